@@ -0,0 +1,8 @@
+"""
+VuiTuber model pipeline — MediaPipe FaceLandmarker → VSeeFace (VMC/OSC).
+
+    python -m modelpipeline --help
+
+Sengaja kosong (tanpa import submodule) supaya `import modelpipeline` dan
+start CLI tetap ringan; tiap subcommand memuat modulnya sendiri.
+"""
@@ -0,0 +1,324 @@
+"""
+Session Analytics
+─────────────────
+Analisa satu/banyak sesi rekaman sekaligus untuk fitting threshold,
+pengganti "kira-kira dari bar HUD".
+
+    python -m modelpipeline analytics recordings/*.vui
+    python -m modelpipeline analytics recordings --focus mouthPucker --export calibration.json
+
+Yang dihitung (semua vectorized numpy, tanpa loop per frame):
+  - histogram & persentil per channel
+  - korelasi antar channel (misal mouthPucker vs jarak pipi *_dist)
+  - saran threshold hysteresis cheekPuff-proxy (CHEEK_THRESHOLD_ON/OFF),
+    SQUINT_OFFSET dan BLINK_TRIGGER
+
+Hasil bisa diexport jadi calibration profile (JSON) yang key-nya sama
+dengan key profile di remap.py (`python -m modelpipeline track -p calib.json`).
+"""
+
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+
+from .constants import RECORDINGS_DIR
+
+# ─────────────────────────────────────────────
+# CONFIG
+# ─────────────────────────────────────────────
+HIST_BINS      = 20
+PERCENTILES    = [1, 5, 25, 50, 75, 95, 99]
+FOCUS_CHANNEL  = "mouthPucker"
+HYST_NOISE_K   = 3.0    # margin hysteresis = K × noise frame-ke-frame
+MIN_HYST_GAP   = 0.04   # jarak minimum ON–OFF (juga jarak OFF dari 0 dan ON dari CHEEK_MAX)
+MAX_HYST_GAP   = 0.30   # jarak maksimum ON–OFF (noise besar ≠ hysteresis selebar seluruh range)
+CHEEK_MAX      = 1.0    # sama dengan DEFAULT_PROFILE["CHEEK_MAX"] di remap.py
+MIN_FRAMES     = 300    # di bawah ini (~12 s @ 24 fps) saran threshold tidak diexport tanpa --force
+
+
+# ─────────────────────────────────────────────
+# LOAD
+# ─────────────────────────────────────────────
+def _expand(paths):
+    out = []
+    for p in paths:
+        if os.path.isdir(p) and not os.path.isfile(os.path.join(p, "header.json")):
+            out += sorted(glob.glob(os.path.join(p, "*.vui")))
+            vui_stems = {os.path.splitext(f)[0] for f in out}
+            for f in sorted(glob.glob(os.path.join(p, "session_*.json"))):
+                if os.path.splitext(f)[0] not in vui_stems:
+                    out.append(f)
+        else:
+            out.append(p)
+    return out
+
+
+def load_sessions(paths):
+    """
+    Gabung banyak sesi jadi satu array.
+    Return (values[N, C] float32, channels, session_id[N], list path).
+    Channel yang tidak ada di suatu sesi diisi NaN.
+    """
+    from .replay import load_session_arrays
+
+    files = _expand(paths)
+    parts, all_channels = [], []
+    for f in files:
+        _ts, vals, channels = load_session_arrays(f)
+        parts.append((np.asarray(vals, dtype=np.float32), channels))
+        for c in channels:
+            if c not in all_channels:
+                all_channels.append(c)
+
+    pos = {c: i for i, c in enumerate(all_channels)}
+    total = sum(len(v) for v, _ in parts)
+    values = np.full((total, len(all_channels)), np.nan, dtype=np.float32)
+    session_id = np.empty(total, dtype=np.int32)
+    row = 0
+    for sid, (vals, channels) in enumerate(parts):
+        n = len(vals)
+        values[row:row + n, [pos[c] for c in channels]] = vals
+        session_id[row:row + n] = sid
+        row += n
+    return values, all_channels, session_id, files
+
+
+# ─────────────────────────────────────────────
+# STATISTIK
+# ─────────────────────────────────────────────
+def channel_histograms(values, bins=HIST_BINS):
+    """
+    Histogram semua channel sekaligus (satu bincount).
+    Range tiap channel = [min, max] channel itu sendiri.
+    Return (counts[C, bins], lo[C], hi[C]).
+    """
+    lo = np.nanmin(values, axis=0)
+    hi = np.nanmax(values, axis=0)
+    width = np.where(hi > lo, hi - lo, 1.0)
+    idx = np.floor((values - lo) / width * bins)
+    idx = np.clip(np.nan_to_num(idx, nan=-1), -1, bins - 1).astype(np.int64)
+    C = values.shape[1]
+    flat = (idx + np.arange(C) * bins)[idx >= 0]
+    counts = np.bincount(flat, minlength=C * bins).reshape(C, bins)
+    return counts, lo, hi
+
+
+def channel_percentiles(values, q=PERCENTILES):
+    """Persentil per channel → array [len(q), C]."""
+    return np.nanpercentile(values, q, axis=0)
+
+
+def correlation_matrix(values):
+    """
+    Korelasi Pearson antar channel, pairwise-complete: tiap pasangan cuma
+    dihitung di frame yang kedua channel-nya ada (sesi dengan set channel
+    beda tidak jadi nol palsu). Channel konstan / tanpa frame bersama → 0.
+    """
+    x = values.astype(np.float64)
+    m = np.isfinite(x)
+    with np.errstate(all="ignore"):
+        x = np.where(m, x - np.nanmean(x, axis=0), 0.0)   # geser dulu: kurangi cancellation
+    m = m.astype(np.float64)
+    n  = m.T @ m                    # [i, j] frame bersama
+    sx = x.T @ m                    # [i, j] Σ x_i di frame bersama dengan j
+    sxx = (x * x).T @ m
+    sxy = x.T @ x
+    with np.errstate(all="ignore"):
+        mi = sx / n
+        cov = sxy / n - mi * mi.T
+        var = sxx / n - mi * mi
+        corr = cov / np.sqrt(var * var.T)
+    corr[~np.isfinite(corr) | (var <= 1e-12) | (var.T <= 1e-12)] = 0.0
+    return np.clip(corr, -1.0, 1.0)
+
+
+def otsu_threshold(x, bins=256):
+    """Threshold 2 kelompok (Otsu) dari histogram — pemisah 'diam' vs 'aktif'."""
+    x = x[~np.isnan(x)]
+    if len(x) == 0:
+        return float("nan")
+    counts, edges = np.histogram(x, bins=bins)
+    centers = (edges[:-1] + edges[1:]) / 2
+    w0 = np.cumsum(counts)
+    w1 = w0[-1] - w0
+    m0 = np.cumsum(counts * centers)
+    mean0 = m0 / np.maximum(w0, 1)
+    mean1 = (m0[-1] - m0) / np.maximum(w1, 1)
+    between = w0 * w1 * (mean0 - mean1) ** 2
+    return float(edges[int(np.argmax(between)) + 1])
+
+
+def hysteresis_mask(x, on, off):
+    """
+    State ON/OFF hysteresis tanpa loop per frame.
+      x >= on → ON, x < off → OFF, di antara → ikut state sebelumnya (awal OFF).
+    """
+    events = np.where(x >= on, 1, np.where(x < off, 0, -1))
+    idx = np.where(events >= 0, np.arange(len(x)), -1)
+    last = np.maximum.accumulate(idx)
+    return np.where(last >= 0, events[np.maximum(last, 0)], 0).astype(bool)
+
+
+def frame_noise(x, session_id):
+    """Noise frame-ke-frame (median |diff|, skala ke sigma) — tidak lintas sesi."""
+    d = np.diff(x)
+    same = session_id[1:] == session_id[:-1]
+    d = np.abs(d[same & ~np.isnan(d)])
+    return float(np.median(d) * 1.4826) if len(d) else 0.0
+
+
+def suggest_thresholds(values, channels, session_id, focus=FOCUS_CHANNEL):
+    """Saran konstanta tracker dari distribusi data."""
+    pos = {c: i for i, c in enumerate(channels)}
+    out = {}
+    warnings = []
+    if len(values) < MIN_FRAMES:
+        warnings.append(f"cuma {len(values)} frame (minimum {MIN_FRAMES})")
+
+    if focus in pos:
+        x = values[:, pos[focus]]
+        split = otsu_threshold(x)
+        if np.isnan(split):
+            warnings.append(f"{focus} tidak punya data")
+        else:
+            margin = min(max(HYST_NOISE_K * frame_noise(x, session_id), MIN_HYST_GAP / 2), MAX_HYST_GAP / 2)
+            # ON < CHEEK_MAX (remap membagi dengan CHEEK_MAX − ON), OFF > 0 (kalau 0 state tidak pernah OFF)
+            on  = float(np.clip(split + margin, 2 * MIN_HYST_GAP, CHEEK_MAX - MIN_HYST_GAP))
+            off = float(np.clip(split - margin, MIN_HYST_GAP, on - MIN_HYST_GAP))
+            if on != split + margin or off != split - margin:
+                warnings.append(f"threshold {focus} terpotong ke batas (split {split:.3f}) — distribusi degenerate")
+            state = hysteresis_mask(np.nan_to_num(x), on, off)
+            toggles = int(np.count_nonzero(state[1:] != state[:-1]))
+            if toggles == 0:
+                warnings.append(f"{focus} tidak pernah berpindah ON/OFF dengan threshold ini")
+            out.update(CHEEK_THRESHOLD_ON=round(on, 3), CHEEK_THRESHOLD_OFF=round(off, 3),
+                       _cheek_split=round(split, 3), _cheek_active_ratio=round(float(state.mean()), 3),
+                       _cheek_toggles=toggles)
+
+    squint = [pos[c] for c in ("eyeSquintLeft", "eyeSquintRight") if c in pos]
+    if squint:
+        # baseline squint saat netral (median) → yang di bawahnya dianggap noise
+        out["SQUINT_OFFSET"] = round(float(np.nanmedian(values[:, squint])), 3)
+
+    blink = [pos[c] for c in ("eyeBlinkLeft", "eyeBlinkRight") if c in pos]
+    if blink:
+        out["BLINK_TRIGGER"] = round(otsu_threshold(values[:, blink].reshape(-1)), 3)
+    out["_warnings"] = warnings
+    return out
+
+
+# ─────────────────────────────────────────────
+# REPORT
+# ─────────────────────────────────────────────
+def print_report(values, channels, files, pct, corr, hist, suggestion, focus, top=8):
+    print(f"\n📊 {len(files)} sesi, {len(values)} frames, {len(channels)} channels")
+
+    print(f"\n▶ PERSENTIL (channel aktif, p50/p95/p99):")
+    p50, p95, p99 = (pct[PERCENTILES.index(q)] for q in (50, 95, 99))
+    order = np.argsort(-np.nan_to_num(p95))
+    for i in order:
+        if np.nan_to_num(p95[i]) <= 0.05:
+            continue
+        bar = "█" * int(min(p95[i], 1.0) * 25)
+        print(f"  {channels[i]:<22} {p50[i]:.3f} / {p95[i]:.3f} / {p99[i]:.3f}  {bar}")
+
+    if focus in channels:
+        fi = channels.index(focus)
+        print(f"\n▶ KORELASI dengan {focus}:")
+        order = np.argsort(-np.abs(corr[fi]))
+        shown = 0
+        for j in order:
+            if j == fi:
+                continue
+            print(f"  {channels[j]:<22} {corr[fi, j]:+.3f}")
+            shown += 1
+            if shown >= top:
+                break
+        for j, c in enumerate(channels):
+            if c.endswith("_dist"):
+                print(f"  ({focus} vs {c}) {corr[fi, j]:+.3f}")
+
+        counts, lo, hi = hist
+        print(f"\n▶ HISTOGRAM {focus} ({lo[fi]:.3f}–{hi[fi]:.3f}):")
+        edges = np.linspace(lo[fi], hi[fi], len(counts[fi]) + 1)
+        peak = max(int(counts[fi].max()), 1)
+        for k, cnt in enumerate(counts[fi]):
+            print(f"  {edges[k]:.3f}  {cnt:>8}  {'█' * int(cnt / peak * 40)}")
+
+    print("\n▶ SARAN THRESHOLD:")
+    for k, v in suggestion.items():
+        if not k.startswith("_"):
+            print(f"  {k:<22} = {v}")
+    if "_cheek_split" in suggestion:
+        print(f"  (split {focus} {suggestion['_cheek_split']}, aktif "
+              f"{suggestion['_cheek_active_ratio'] * 100:.1f}% frame, "
+              f"{suggestion['_cheek_toggles']} kali ON/OFF)")
+    for w in suggestion.get("_warnings", ()):
+        print(f"  ⚠ {w}")
+
+
+def export_profile(path, suggestion, channels, pct, hist, files, n_frames):
+    profile = {k: v for k, v in suggestion.items() if not k.startswith("_")}
+    profile["_meta"] = {
+        "created":     datetime.now().isoformat(),
+        "sessions":    [os.path.basename(f) for f in files],
+        "frames":      int(n_frames),
+        "percentiles": {
+            c: {f"p{q}": round(float(pct[k, i]), 4) for k, q in enumerate(PERCENTILES)}
+            for i, c in enumerate(channels)
+        },
+        "histograms": {
+            c: {"lo": float(hist[1][i]), "hi": float(hist[2][i]), "counts": hist[0][i].tolist()}
+            for i, c in enumerate(channels)
+        },
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(profile, f, indent=2)
+    print(f"\n💾 Calibration profile → {path}")
+
+
+# ─────────────────────────────────────────────
+# MAIN
+# ─────────────────────────────────────────────
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Analytics sesi rekaman + saran threshold")
+    ap.add_argument("paths", nargs="*", default=[RECORDINGS_DIR])
+    ap.add_argument("--focus", default=FOCUS_CHANNEL, help="channel proxy cheekPuff (default mouthPucker)")
+    ap.add_argument("--export", nargs="?", const="", help="simpan calibration profile (JSON)")
+    ap.add_argument("--force", action="store_true", help="tetap export walau data kurang / degenerate")
+    args = ap.parse_args(argv)
+
+    t0 = time.perf_counter()
+    values, channels, session_id, files = load_sessions(args.paths)
+    if len(values) == 0:
+        print("Tidak ada frame.")
+        return 1
+    t_load = time.perf_counter() - t0
+
+    pct  = channel_percentiles(values)
+    hist = channel_histograms(values)
+    corr = correlation_matrix(values)
+    suggestion = suggest_thresholds(values, channels, session_id, args.focus)
+    t_total = time.perf_counter() - t0
+
+    print_report(values, channels, files, pct, corr, hist, suggestion, args.focus)
+    print(f"\n⏱  load {t_load:.2f} s, total {t_total:.2f} s")
+
+    if args.export is not None:
+        if suggestion["_warnings"] and not args.force:
+            print("\n❌ Calibration profile tidak diexport (lihat ⚠ di atas) — tambah --force untuk tetap export.")
+            return 1
+        path = args.export or os.path.join(
+            RECORDINGS_DIR, f"calibration_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+        export_profile(path, suggestion, channels, pct, hist, files, len(values))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,52 +1,42 @@
-import cv2
+"""
+Camera Check
+────────────
+Diagnosa kamera / OBS Virtual Camera: semua index di-probe paralel (backend
+sesuai platform, timeout per probe), hasilnya disimpan ke cache kamera
+supaya tracker langsung buka device yang terbukti jalan. Lalu detail satu
+index: properti yang bisa diset + baca beberapa frame.
+
+    python -m modelpipeline check-camera
+    python -m modelpipeline check-camera --index 1
+    python -m modelpipeline check-camera --source clip.mp4      # file / folder gambar
+    python -m modelpipeline check-camera --cache                # isi cache saja
+"""
+
+import argparse
+import json
+import os
 import sys
+import time
 
-print("=" * 60)
-print("DIAGNOSTIC TOOL - OBS VIRTUAL CAMERA")
-print("=" * 60)
-
-# Test semua backend yang tersedia
-backends = [
-    ("CAP_ANY (Default)", cv2.CAP_ANY),
-    ("CAP_DSHOW (DirectShow)", cv2.CAP_DSHOW),
-    ("CAP_MSMF (Media Foundation)", cv2.CAP_MSMF),
-]
-
-print("\n[1] Testing Camera Index 3 dengan berbagai backend:\n")
-
-working_backend = None
-for backend_name, backend_id in backends:
-    print(f"Testing {backend_name}...", end=" ")
-    cap = cv2.VideoCapture(3, backend_id)
-    
-    if cap.isOpened():
-        ret, frame = cap.read()
-        if ret and frame is not None:
-            print(f"✓ BERHASIL")
-            print(f"   - Resolution: {frame.shape[1]}x{frame.shape[0]}")
-            print(f"   - Channels: {frame.shape[2] if len(frame.shape) > 2 else 'N/A'}")
-            print(f"   - FPS: {cap.get(cv2.CAP_PROP_FPS)}")
-            print(f"   - Backend: {cap.get(cv2.CAP_PROP_BACKEND)}")
-            print(f"   - Format: {cap.get(cv2.CAP_PROP_FORMAT)}")
-            print(f"   - Codec: {int(cap.get(cv2.CAP_PROP_FOURCC))}")
-            
-            working_backend = (backend_name, backend_id)
-            cap.release()
-            break
+from .camerasource import (PROBE_TIMEOUT, SCAN_INDICES, FileSource, discover, load_cache, open_source,
+                           platform_backends)
+from .constants import CAMERA_CACHE, CAMERA_INDEX
+
+
+def print_table(results, highlight=None):
+    print(f"  {'index':>5}  {'backend':<13} {'resolusi':>10} {'fps':>6} {'fourcc':<6} {'open':>8}")
+    for r in results:
+        mark = "→" if r["source"] == highlight else " "
+        if r["ok"]:
+            print(f"{mark} {r['source']:>5}  {r['backend']:<13} {r['width']:>4}x{r['height']:<5} "
+                  f"{r['fps']:>6g} {r['fourcc'] or '-':<6} {r['open_ms']:>6.0f}ms ✓")
         else:
-            print(f"✗ GAGAL (opened tapi tidak bisa read frame)")
-            cap.release()
-    else:
-        print(f"✗ GAGAL (tidak bisa open)")
+            print(f"{mark} {r['source']:>5}  ✗ {r['error']}")
+
 
-print("\n" + "=" * 60)
+def check_properties(cap, frames=5):
+    import cv2
 
-if working_backend:
-    print(f"\n[2] Backend yang WORK: {working_backend[0]}\n")
-    
-    # Test lebih detail dengan backend yang work
-    cap = cv2.VideoCapture(3, working_backend[1])
-    
     print("Properti kamera yang bisa diset:")
     properties_to_test = [
         ("FRAME_WIDTH", cv2.CAP_PROP_FRAME_WIDTH, 640),
@@ -54,51 +44,108 @@ if working_backend:
         ("FPS", cv2.CAP_PROP_FPS, 30),
         ("BUFFERSIZE", cv2.CAP_PROP_BUFFERSIZE, 1),
     ]
-    
     for prop_name, prop_id, test_value in properties_to_test:
         before = cap.get(prop_id)
         cap.set(prop_id, test_value)
         after = cap.get(prop_id)
-        
         if abs(after - test_value) < 0.1:
             print(f"   ✓ {prop_name}: {before} -> {after} (SET BERHASIL)")
         else:
             print(f"   ✗ {prop_name}: {before} -> {after} (SET GAGAL, target: {test_value})")
-    
-    print("\n[3] Testing continuous frame read (5 frames):\n")
-    
-    for i in range(5):
+
+    print(f"\nContinuous frame read ({frames} frames):\n")
+    for i in range(frames):
+        t0 = time.perf_counter()
         ret, frame = cap.read()
-        if ret and frame is not None:
-            print(f"   Frame {i+1}: ✓ {frame.shape}")
+        dt = (time.perf_counter() - t0) * 1e3
+        print(f"   Frame {i+1}: ✓ {frame.shape} {dt:.1f} ms" if ret and frame is not None
+              else f"   Frame {i+1}: ✗ FAILED")
+
+
+def check_file(spec, frames):
+    src = FileSource(spec, realtime=False)
+    print(f"Sumber file: {spec} ({src.kind}, {src.frames} frame, {src.fps:.2f} fps)")
+    for i in range(frames):
+        ret, frame = src.read()
+        print(f"   Frame {i+1}: ✓ {frame.shape}" if ret else f"   Frame {i+1}: ✗ habis / gagal")
+    src.release()
+    return 0
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(prog="modelpipeline check-camera", description="Diagnosa kamera / OBS Virtual Camera")
+    ap.add_argument("--index", type=int, default=CAMERA_INDEX, help="index yang dicek detail")
+    ap.add_argument("--scan", type=int, default=SCAN_INDICES, help="jumlah index yang di-probe paralel")
+    ap.add_argument("--timeout", type=float, default=PROBE_TIMEOUT, help="detik per probe")
+    ap.add_argument("--backend", action="append", help="backend (V4L2, DSHOW, MSMF, ANY, ...), bisa berulang")
+    ap.add_argument("--source", help="file video / folder / glob gambar sebagai kamera palsu")
+    ap.add_argument("--frames", type=int, default=5)
+    ap.add_argument("--cache", action="store_true", help="tampilkan isi cache kamera saja")
+    ap.add_argument("--clear-cache", action="store_true", help="hapus cache kamera")
+    ap.add_argument("--json", action="store_true")
+    args = ap.parse_args(argv)
+
+    if args.clear_cache:
+        if os.path.exists(CAMERA_CACHE):
+            os.remove(CAMERA_CACHE)
+        print(f"🗑  Cache kamera dihapus ({CAMERA_CACHE})")
+        return 0
+    if args.cache:
+        devices = load_cache()
+        if args.json:
+            print(json.dumps(devices, indent=2))
+        elif devices:
+            print_table(sorted(devices.values(), key=lambda r: r["source"]), args.index)
         else:
-            print(f"   Frame {i+1}: ✗ FAILED")
-    
-    cap.release()
-    
-    print("\n" + "=" * 60)
-    print("KESIMPULAN:")
-    print(f"✓ Gunakan backend: {working_backend[0]}")
-    print(f"✓ Backend ID untuk kode: cv2.VideoCapture(3, {working_backend[1]})")
+            print(f"Cache kamera kosong ({CAMERA_CACHE})")
+        return 0
+    if args.source:
+        return check_file(args.source, args.frames)
+
+    backends = tuple(args.backend) if args.backend else platform_backends()
+    indices = sorted(set(range(args.scan)) | {args.index})
+
     print("=" * 60)
-    
-else:
-    print("\n[ERROR] TIDAK ADA BACKEND YANG BERHASIL!\n")
+    print("DIAGNOSTIC TOOL - KAMERA / OBS VIRTUAL CAMERA")
+    print("=" * 60)
+    print(f"\n[1] Probe paralel index 0-{indices[-1]} ({' → '.join(backends)}, timeout {args.timeout:g} s):\n")
+
+    t0 = time.perf_counter()
+    results = discover(indices, backends, timeout=args.timeout)
+    print_table(results, args.index)
+    print(f"\n   {time.perf_counter() - t0:.1f} s, disimpan ke {CAMERA_CACHE}")
+    if args.json:
+        print(json.dumps(results, indent=2))
+
+    target = next(r for r in results if r["source"] == args.index)
+    print("\n" + "=" * 60)
+    if target["ok"]:
+        print(f"\n[2] Detail index {args.index} via {target['backend']}\n")
+        cap, _info = open_source(args.index, fallback=False)
+        check_properties(cap, args.frames)
+        cap.release()
+
+        print("\n" + "=" * 60)
+        print("KESIMPULAN:")
+        print(f"✓ Kamera {args.index}: {target['width']}x{target['height']} @ {target['fps']:g} fps "
+              f"{target['fourcc']} via {target['backend']}")
+        print(f"✓ Tracker membuka kamera ini langsung dari cache (--camera {args.index})")
+        print("=" * 60)
+        return 0
+
+    working = [r["source"] for r in results if r["ok"]]
+    print(f"\n[ERROR] Kamera {args.index} tidak bisa dipakai: {target['error']}\n")
     print("Troubleshooting:")
     print("1. Pastikan OBS Virtual Camera sudah di-START")
     print("2. Coba restart OBS")
-    print("3. Coba index kamera lain (0, 1, 2, 4)")
-    print("4. Check apakah aplikasi lain bisa akses OBS Virtual Camera")
-    print("\n[4] Scanning semua available camera indexes:\n")
-    
-    for idx in range(10):
-        cap = cv2.VideoCapture(idx)
-        if cap.isOpened():
-            ret, _ = cap.read()
-            status = "✓ CAN READ" if ret else "✗ CAN'T READ"
-            print(f"   Index {idx}: {status}")
-            cap.release()
-        else:
-            print(f"   Index {idx}: NOT AVAILABLE")
-    
-    print("\n" + "=" * 60)
\ No newline at end of file
+    if working:
+        print(f"3. Index lain yang jalan: {', '.join(map(str, working))} (--camera N)")
+    else:
+        print("3. Tidak ada index lain yang bisa dibaca")
+    print("4. Check apakah aplikasi lain bisa akses kamera")
+    print("\n" + "=" * 60)
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,347 @@
+"""
+Camera Source
+─────────────
+Discovery & buka sumber video untuk tracker:
+
+    cap, info = open_source(3)                  # index kamera (langsung dari cache kalau ada)
+    cap, info = open_source("clip.mp4")         # file video sebagai kamera palsu
+    cap, info = open_source("frames/")          # folder / glob / pola printf (img_%04d.png)
+    results   = discover(range(10))             # probe paralel semua index
+
+  - Backend sesuai platform (Linux: V4L2, Windows: DSHOW → MSMF, macOS:
+    AVFOUNDATION), CAP_ANY sebagai cadangan.
+  - Tiap index di-probe di thread sendiri dengan timeout, jadi satu device
+    yang hang saat open tidak menahan yang lain. Backend untuk index yang
+    sama dicoba berurutan (satu device tidak bisa dibuka dua kali bersamaan).
+  - Hasil probe (backend, resolusi / FPS / FOURCC asli) disimpan di
+    CAMERA_CACHE; start berikutnya langsung buka dengan backend yang terbukti
+    jalan tanpa probe ulang. Kalau gagal, cache entry itu di-probe ulang.
+
+File video & urutan gambar dibaca lewat FileSource dengan interface yang
+sama (read / get / set / release), dijeda sesuai FPS supaya perilakunya
+seperti kamera — bisa test tracker tanpa hardware.
+"""
+
+import glob
+import json
+import os
+import sys
+import threading
+import time
+from datetime import datetime
+
+from .constants import CAMERA_CACHE, CAMERA_FPS, CAMERA_HEIGHT, CAMERA_INDEX, CAMERA_WIDTH
+
+# ─────────────────────────────────────────────
+# CONFIG
+# ─────────────────────────────────────────────
+PROBE_TIMEOUT = 4.0      # detik per probe (open + baca 1 frame)
+SCAN_INDICES  = 10       # index 0..N-1 untuk discover()
+CACHE_VERSION = 1
+
+PLATFORM_BACKENDS = {
+    "linux":  ("V4L2", "ANY"),
+    "win32":  ("DSHOW", "MSMF", "ANY"),
+    "darwin": ("AVFOUNDATION", "ANY"),
+}
+IMAGE_EXTS = (".png", ".jpg", ".jpeg", ".bmp", ".webp")
+
+
+def platform_backends(platform=None):
+    platform = platform or sys.platform
+    for prefix, backends in PLATFORM_BACKENDS.items():
+        if platform.startswith(prefix):
+            return backends
+    return ("ANY",)
+
+
+def backend_id(name):
+    import cv2
+    return getattr(cv2, f"CAP_{name}")
+
+
+def fourcc_str(value):
+    value = int(value)
+    text = "".join(chr((value >> (8 * i)) & 0xFF) for i in range(4))
+    return text if value and text.isprintable() else ""
+
+
+def describe(cap, frame):
+    """Properti ASLI setelah set (resolusi dari frame, bukan dari yang diminta)."""
+    import cv2
+    try:
+        backend = cap.getBackendName()
+    except cv2.error:
+        backend = str(int(cap.get(cv2.CAP_PROP_BACKEND)))
+    return {"width": int(frame.shape[1]), "height": int(frame.shape[0]),
+            "fps": round(float(cap.get(cv2.CAP_PROP_FPS)), 3),
+            "fourcc": fourcc_str(cap.get(cv2.CAP_PROP_FOURCC)), "backend_name": backend}
+
+
+def configure(cap, width=CAMERA_WIDTH, height=CAMERA_HEIGHT, fps=CAMERA_FPS):
+    import cv2
+    cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+    cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+    cap.set(cv2.CAP_PROP_FPS, fps)
+
+
+# ─────────────────────────────────────────────
+# PROBE
+# ─────────────────────────────────────────────
+def probe_index(index, backends=None, size=(CAMERA_WIDTH, CAMERA_HEIGHT, CAMERA_FPS), keep=False):
+    """
+    Coba buka `index` dengan tiap backend sampai ada yang bisa baca frame.
+    Return dict hasil; keep=True → capture yang berhasil ikut di result["cap"].
+    """
+    import cv2
+
+    errors = []
+    for name in backends or platform_backends():
+        t0 = time.perf_counter()
+        cap = cv2.VideoCapture(index, backend_id(name))
+        if not cap.isOpened():
+            errors.append(f"{name}: tidak bisa open")
+            cap.release()
+            continue
+        configure(cap, *size)
+        ret, frame = cap.read()
+        if not ret or frame is None:
+            errors.append(f"{name}: open tapi tidak bisa read")
+            cap.release()
+            continue
+        result = dict(describe(cap, frame), source=index, ok=True, backend=name,
+                      open_ms=round((time.perf_counter() - t0) * 1e3, 1),
+                      probed_at=datetime.now().isoformat(timespec="seconds"))
+        if keep:
+            result["cap"] = cap
+        else:
+            cap.release()
+        return result
+    return {"source": index, "ok": False, "error": "; ".join(errors),
+            "probed_at": datetime.now().isoformat(timespec="seconds")}
+
+
+def probe_many(indices, backends=None, size=(CAMERA_WIDTH, CAMERA_HEIGHT, CAMERA_FPS),
+               timeout=PROBE_TIMEOUT, keep=False):
+    """
+    Probe semua index bersamaan (thread daemon per index). Yang belum selesai
+    saat timeout dilaporkan "timeout" — thread-nya dibiarkan, tidak menahan exit.
+    """
+    results = {}
+
+    def worker(index):
+        try:
+            results[index] = probe_index(index, backends, size, keep)
+        except Exception as e:
+            results[index] = {"source": index, "ok": False, "error": repr(e)}
+
+    threads = [threading.Thread(target=worker, args=(i,), name=f"probe-{i}", daemon=True) for i in indices]
+    for t in threads:
+        t.start()
+    deadline = time.perf_counter() + timeout
+    for t in threads:
+        t.join(max(deadline - time.perf_counter(), 0))
+    return [results.get(i, {"source": i, "ok": False, "error": f"timeout {timeout:.1f} s"}) for i in indices]
+
+
+# ─────────────────────────────────────────────
+# CACHE
+# ─────────────────────────────────────────────
+def load_cache(path=CAMERA_CACHE):
+    try:
+        with open(path, encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if cache.get("version") != CACHE_VERSION or cache.get("platform") != sys.platform:
+        return {}
+    return cache.get("devices", {})
+
+
+def save_cache(devices, path=CAMERA_CACHE):
+    """Tulis atomik (tmp + replace) supaya dua proses tidak merusak file."""
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump({"version": CACHE_VERSION, "platform": sys.platform, "devices": devices}, f, indent=2)
+    os.replace(tmp, path)
+
+
+def update_cache(results, path=CAMERA_CACHE):
+    if not path:
+        return
+    devices = load_cache(path)
+    for r in results:
+        devices[str(r["source"])] = {k: v for k, v in r.items() if k != "cap"}
+    try:
+        save_cache(devices, path)
+    except OSError as e:
+        print(f"⚠  Cache kamera tidak bisa ditulis ({e})")
+
+
+def discover(indices=range(SCAN_INDICES), backends=None, size=(CAMERA_WIDTH, CAMERA_HEIGHT, CAMERA_FPS),
+             timeout=PROBE_TIMEOUT, cache_path=CAMERA_CACHE):
+    """Probe paralel semua index, simpan hasilnya ke cache. Return list hasil urut index."""
+    results = probe_many(list(indices), backends, size, timeout)
+    update_cache(results, cache_path)
+    return results
+
+
+# ─────────────────────────────────────────────
+# FAKE DEVICE (file video / urutan gambar)
+# ─────────────────────────────────────────────
+def image_files(spec):
+    """Folder / glob → list file gambar terurut; None kalau bukan urutan gambar."""
+    if os.path.isdir(spec):
+        spec = os.path.join(spec, "*")
+    elif not glob.has_magic(spec):
+        return None
+    return sorted(f for f in glob.glob(spec) if f.lower().endswith(IMAGE_EXTS))
+
+
+class FileSource:
+    """File video / urutan gambar dengan interface cv2.VideoCapture (read/get/set/release)."""
+
+    def __init__(self, spec, fps=None, realtime=True, loop=False):
+        import cv2
+
+        self.spec     = spec
+        self.realtime = realtime
+        self.loop     = loop
+        self._files   = image_files(spec)
+        self._cap     = None
+        if self._files is None:
+            # file video, atau pola printf (img_%04d.png) → backend CAP_IMAGES bawaan OpenCV
+            api = cv2.CAP_IMAGES if "%" in os.path.basename(spec) else cv2.CAP_ANY
+            self._cap = cv2.VideoCapture(spec, api)
+            if not self._cap.isOpened():
+                raise FileNotFoundError(f"sumber video '{spec}' tidak bisa dibuka")
+            self.kind   = "images" if api == cv2.CAP_IMAGES else "video"
+            self.frames = int(self._cap.get(cv2.CAP_PROP_FRAME_COUNT))
+            fps = fps or self._cap.get(cv2.CAP_PROP_FPS)
+        else:
+            if not self._files:
+                raise FileNotFoundError(f"tidak ada gambar di '{spec}'")
+            self.kind   = "images"
+            self.frames = len(self._files)
+        self.fps  = float(fps) if fps and fps > 0 else float(CAMERA_FPS)
+        self._pos = 0
+        self._t0  = None
+
+    def isOpened(self):
+        return True
+
+    def read(self):
+        import cv2
+
+        if self._files is not None:
+            if self._pos >= len(self._files) and self.loop:
+                self._pos = 0
+            frame = cv2.imread(self._files[self._pos]) if self._pos < len(self._files) else None
+            ret = frame is not None
+        else:
+            ret, frame = self._cap.read()
+            if not ret and self.loop and self._pos:
+                self._cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+                ret, frame = self._cap.read()
+        if not ret:
+            return False, None
+        if self.realtime:
+            # Jeda ke jadwal frame berikut (drift-free) → rate seperti kamera asli
+            now = time.perf_counter()
+            if self._t0 is None:
+                self._t0 = now
+            delay = self._t0 + self._pos / self.fps - now
+            if delay > 0:
+                time.sleep(delay)
+        self._pos += 1
+        return True, frame
+
+    def get(self, prop):
+        import cv2
+        if prop == cv2.CAP_PROP_FPS:
+            return self.fps
+        if prop == cv2.CAP_PROP_FRAME_COUNT:
+            return float(self.frames)
+        if self._cap is not None:
+            return self._cap.get(prop)
+        return 0.0
+
+    def set(self, prop, value):
+        return False        # resolusi / fps file tidak bisa diubah
+
+    def release(self):
+        if self._cap is not None:
+            self._cap.release()
+
+
+def is_device(spec):
+    return isinstance(spec, int) or (isinstance(spec, str) and spec.strip().isdigit())
+
+
+# ─────────────────────────────────────────────
+# OPEN
+# ─────────────────────────────────────────────
+def open_cached(index, entry, size=(CAMERA_WIDTH, CAMERA_HEIGHT, CAMERA_FPS)):
+    """Buka langsung dengan backend dari cache; None kalau sudah tidak jalan."""
+    import cv2
+
+    t0 = time.perf_counter()
+    cap = cv2.VideoCapture(index, backend_id(entry["backend"]))
+    if cap.isOpened():
+        configure(cap, *size)
+        ret, frame = cap.read()
+        if ret and frame is not None:
+            return cap, dict(entry, **describe(cap, frame), cached=True,
+                             open_ms=round((time.perf_counter() - t0) * 1e3, 1))
+    cap.release()
+    return None
+
+
+def open_source(spec=CAMERA_INDEX, size=(CAMERA_WIDTH, CAMERA_HEIGHT, CAMERA_FPS), realtime=True,
+                cache_path=CAMERA_CACHE, refresh=False, timeout=PROBE_TIMEOUT, fallback=True):
+    """
+    Index kamera atau file/folder → (cap, info).
+      1. file video / gambar → FileSource
+      2. index ada di cache & masih jalan → langsung dibuka (tanpa probe)
+      3. probe index itu (backend platform, timeout)
+      4. fallback: discover() paralel, pakai device pertama yang bisa dibaca
+    """
+    if not is_device(spec):
+        src = FileSource(spec, realtime=realtime)
+        return src, {"source": spec, "ok": True, "kind": src.kind, "frames": src.frames, "fps": src.fps,
+                     "backend": "file", "realtime": realtime}
+
+    index = int(spec)
+    if not refresh:
+        entry = load_cache(cache_path).get(str(index)) if cache_path else None
+        if entry and entry.get("ok"):
+            opened = open_cached(index, entry, size)
+            if opened is not None:
+                return opened
+            print(f"⚠  Kamera {index} di cache ({entry['backend']}) tidak bisa dibuka lagi, probe ulang...")
+
+    result = probe_many([index], size=size, timeout=timeout, keep=True)[0]
+    update_cache([result], cache_path)
+    if result["ok"]:
+        return result.pop("cap"), dict(result, cached=False)
+
+    if fallback:
+        others = [i for i in range(SCAN_INDICES) if i != index]
+        found = [r for r in discover(others, size=size, timeout=timeout, cache_path=cache_path) if r["ok"]]
+        if found:
+            alt = found[0]["source"]
+            print(f"⚠  Kamera {index} gagal ({result['error']}) → pakai kamera {alt}")
+            return open_source(alt, size, realtime, cache_path, refresh=False, timeout=timeout, fallback=False)
+    raise RuntimeError(f"kamera {index} tidak bisa dibuka: {result['error']} "
+                       f"(cek: python -m modelpipeline check-camera)")
+
+
+def format_source(info):
+    if info.get("backend") == "file":
+        return (f"🎞  Sumber: {info['source']} ({info['kind']}, {info['frames']} frame, {info['fps']:.1f} fps"
+                + (", real-time" if info["realtime"] else ", secepatnya") + ")")
+    how = "cache" if info.get("cached") else "probe"
+    fourcc = f" {info['fourcc']}" if info.get("fourcc") else ""
+    return (f"📷 Kamera {info['source']}: {info['width']}x{info['height']} @ {info['fps']:g} fps{fourcc} "
+            f"via {info['backend']} ({how}, open {info['open_ms']:.0f} ms)")
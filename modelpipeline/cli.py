@@ -0,0 +1,204 @@
+"""
+VuiTuber CLI
+────────────
+Satu entry point untuk semua tool di package ini:
+
+    python -m modelpipeline track                 # tracker + cheekPuff proxy
+    python -m modelpipeline monitor               # tracker + jarak pipi
+    python -m modelpipeline listen --dashboard
+    python -m modelpipeline replay recordings/stream_xxx.vui
+    python -m modelpipeline emulate               # VSeeFace palsu di 39539 (stress test tanpa Windows)
+    python -m modelpipeline loadgen -n 8 --fps 60
+    python -m modelpipeline shm                   # baca frame dari tracker yang jalan dengan --shm
+    python -m modelpipeline check-camera --index 3
+    python -m modelpipeline bench clip.mp4        # FaceMesh lama vs FaceLandmarker
+    python -m modelpipeline startup               # ukur waktu start tiap subcommand vs budget
+    python -m modelpipeline startup --detail listen
+
+Modul subcommand baru di-import saat dipilih, dan cv2 / mediapipe hanya
+di-import oleh subcommand yang memang butuh (track, monitor, check-camera, bench),
+di dalam fungsinya. Tool OSC / analisa tidak pernah memuat keduanya.
+
+`startup` menjalankan tiap subcommand di proses baru: waktu import modulnya
+(+ import berat yang dideklarasikan) dibandingkan STARTUP_BUDGET_MS, dan
+dicek tidak ada cv2 / mediapipe yang ikut ter-import di subcommand ringan.
+"""
+
+import argparse
+import importlib
+import json
+import os
+import subprocess
+import sys
+
+# ─────────────────────────────────────────────
+# COMMANDS
+# ─────────────────────────────────────────────
+# nama → (modul, fungsi main, import berat yang dibutuhkan, deskripsi)
+COMMANDS = {
+    "track":        ("tracker",        "track_main",   ("cv2", "mediapipe.tasks.python.vision"),
+                     "face tracker → VSeeFace, cheekPuff proxy (dulu CheeckModel.py)"),
+    "monitor":      ("tracker",        "monitor_main", ("cv2", "mediapipe.tasks.python.vision"),
+                     "face tracker + jarak pipi ke hidung (dulu modelmonitor.py)"),
+    "listen":       ("listener",       "main", (), "VMC listener: HUD / dashboard, statistik, capture"),
+    "replay":       ("replay",         "main", (), "kirim ulang recording ke VSeeFace"),
+    "emulate":      ("vmcsim",         "emulate_main", (), "emulator penerima VMC (pengganti VSeeFace) + echo ke 39540"),
+    "loadgen":      ("vmcsim",         "loadgen_main", (), "load generator: N tracker VMC sintetis"),
+    "shm":          ("sharedframe",    "main", (), "baca frame tracker dari shared memory (track --shm)"),
+    "check-camera": ("cameracheck",    "main", ("cv2",), "probe kamera paralel + cache, diagnosa OBS Virtual Camera"),
+    "bench":        ("landmarkbench",  "main", ("cv2", "mediapipe.tasks.python.vision"),
+                     "benchmark FaceMesh lama vs Tasks FaceLandmarker (fps, latency, jitter, CPU)"),
+    "analytics":    ("analytics",      "main", (), "statistik sesi + calibration profile"),
+    "whatif":       ("whatif",         "main", (), "bandingkan profile remap di recording"),
+    "index":        ("exprindex",      "main", (), "k-NN index ekspresi (build / query)"),
+    "archive":      ("sessionarchive", "main", (), "pack / unpack / bench .vuiz"),
+    "convert":      ("convertlegacy",  "main", (), "migrasi recording JSON/CSV lama → .vui"),
+    "capture":      ("vmccapture",     "main", (), "info / dump / export file .vmcap"),
+    "session":      ("sessionformat",  "main", (), "info / baca satu sesi .vui"),
+}
+
+HEAVY_MODULES = ("cv2", "mediapipe")
+
+# Budget waktu start (ms): import modul subcommand + import berat yang dideklarasikan,
+# tanpa start interpreter Python-nya sendiri.
+DEFAULT_BUDGET_MS = 300
+STARTUP_BUDGET_MS = {
+    "check-camera": 600,
+    "track":        3000,
+    "monitor":      3000,
+    "bench":        3000,
+}
+
+_PARENT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def load(name):
+    """Import modul subcommand (lazy) dan return fungsi main-nya."""
+    module, func, _heavy, _desc = COMMANDS[name]
+    return getattr(importlib.import_module(f".{module}", __package__), func)
+
+
+def run(name, argv):
+    return load(name)(argv)
+
+
+# ─────────────────────────────────────────────
+# STARTUP BUDGET
+# ─────────────────────────────────────────────
+_PROBE = """
+import json, sys, time
+t0 = time.perf_counter()
+from modelpipeline import cli
+cli.load(%(name)r)
+t1 = time.perf_counter()
+leaked = [m for m in cli.HEAVY_MODULES if m in sys.modules]
+for m in %(heavy)r:
+    __import__(m)
+t2 = time.perf_counter()
+print(json.dumps({"import_ms": (t1 - t0) * 1e3, "heavy_ms": (t2 - t1) * 1e3, "leaked": leaked}))
+"""
+
+
+def _child_env():
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(p for p in (_PARENT_DIR, env.get("PYTHONPATH")) if p)
+    return env
+
+
+def measure_startup(name, repeat=3):
+    """Ukur start satu subcommand di proses baru (minimum dari `repeat` kali)."""
+    _module, _func, heavy, _desc = COMMANDS[name]
+    best = None
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, "-c", _PROBE % {"name": name, "heavy": heavy}],
+                             capture_output=True, text=True, env=_child_env())
+        if out.returncode != 0:
+            return {"command": name, "error": out.stderr.strip().splitlines()[-1] if out.stderr else "gagal"}
+        r = json.loads(out.stdout.strip().splitlines()[-1])
+        r["total_ms"] = r["import_ms"] + r["heavy_ms"]
+        if best is None or r["total_ms"] < best["total_ms"]:
+            best = r
+    budget = STARTUP_BUDGET_MS.get(name, DEFAULT_BUDGET_MS)
+    best.update(command=name, budget_ms=budget,
+                ok=best["total_ms"] <= budget and not best["leaked"])
+    return best
+
+
+def import_profile(name, top=15):
+    """Modul paling lambat saat import subcommand (python -X importtime), ms kumulatif."""
+    _module, _func, heavy, _desc = COMMANDS[name]
+    code = f"from modelpipeline import cli; cli.load({name!r})" + "".join(f"; import {m}" for m in heavy)
+    out = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                         capture_output=True, text=True, env=_child_env())
+    rows = []
+    for line in out.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _self_us, cum_us, mod = (p.strip() for p in line[len("import time:"):].split("|"))
+        rows.append((int(cum_us) / 1e3, mod))
+    return sorted(rows, reverse=True)[:top]
+
+
+def startup_main(argv=None):
+    ap = argparse.ArgumentParser(prog="modelpipeline startup",
+                                 description="Ukur waktu start tiap subcommand vs STARTUP_BUDGET_MS")
+    ap.add_argument("commands", nargs="*", help="default: semua")
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--json", action="store_true")
+    ap.add_argument("--detail", metavar="CMD", help="tampilkan modul paling lambat untuk satu subcommand")
+    args = ap.parse_args(argv)
+
+    if args.detail:
+        for ms, mod in import_profile(args.detail):
+            print(f"  {ms:8.1f} ms  {mod}")
+        return 0
+
+    names = args.commands or list(COMMANDS)
+    unknown = [n for n in names if n not in COMMANDS]
+    if unknown:
+        ap.error(f"subcommand tidak dikenal: {', '.join(unknown)}")
+
+    results = [measure_startup(n, args.repeat) for n in names]
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(f"{'command':<14} {'import':>9} {'berat':>9} {'total':>9} {'budget':>8}")
+        for r in results:
+            if "error" in r:
+                print(f"{r['command']:<14} ❌ {r['error']}")
+                continue
+            flag = "✅" if r["ok"] else "❌"
+            leaked = f"  (ikut ter-import: {', '.join(r['leaked'])})" if r["leaked"] else ""
+            print(f"{r['command']:<14} {r['import_ms']:7.0f}ms {r['heavy_ms']:7.0f}ms "
+                  f"{r['total_ms']:7.0f}ms {r['budget_ms']:6d}ms {flag}{leaked}")
+    return 0 if all(r.get("ok") for r in results) else 1
+
+
+# ─────────────────────────────────────────────
+# MAIN
+# ─────────────────────────────────────────────
+def print_usage():
+    print("Pemakaian: python -m modelpipeline <command> [opsi...]\n")
+    for name, (_m, _f, _h, desc) in COMMANDS.items():
+        print(f"  {name:<14} {desc}")
+    print(f"  {'startup':<14} ukur waktu start tiap subcommand vs budget")
+    print("\n<command> --help untuk opsi tiap command.")
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if not argv or argv[0] in ("-h", "--help", "help"):
+        print_usage()
+        return 0
+    name, rest = argv[0], argv[1:]
+    if name == "startup":
+        return startup_main(rest)
+    if name not in COMMANDS:
+        print(f"❌ command '{name}' tidak dikenal.\n")
+        print_usage()
+        return 2
+    return run(name, rest)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
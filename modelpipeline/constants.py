@@ -0,0 +1,132 @@
+"""
+Shared Constants
+────────────────
+Konstanta yang dulu di-copy di tiap script (CheeckModel, modelmonitor,
+runmodel, modellistener, ...) sekarang di satu tempat.
+
+Modul ini sengaja tanpa import berat (tidak ada numpy / cv2 / mediapipe),
+jadi aman di-import dari subcommand mana pun tanpa menambah waktu start.
+"""
+
+import os
+
+# ─────────────────────────────────────────────
+# PATH & JARINGAN
+# ─────────────────────────────────────────────
+PACKAGE_DIR    = os.path.dirname(os.path.abspath(__file__))
+# model di sebelah package (bukan relatif ke cwd), bisa ditimpa env VUI_MODEL
+MODEL_PATH     = os.environ.get("VUI_MODEL", os.path.join(PACKAGE_DIR, "face_landmarker.task"))
+# recordings tetap di folder yang sama seperti dulu (modelpipeline/recordings),
+# bisa dipindah lewat env VUI_RECORDINGS
+RECORDINGS_DIR = os.environ.get("VUI_RECORDINGS", os.path.join(PACKAGE_DIR, "recordings"))
+
+VMC_IP      = "127.0.0.1"
+VMC_PORT    = 39539     # tracker → VSeeFace
+LISTEN_PORT = 39540     # VSeeFace → listener
+
+# ─────────────────────────────────────────────
+# KAMERA
+# ─────────────────────────────────────────────
+CAMERA_INDEX  = 3       # OBS Virtual Camera
+CAMERA_WIDTH  = 1280
+CAMERA_HEIGHT = 720
+CAMERA_FPS    = 24
+# hasil probe kamera (resolusi / fps / fourcc asli per device), lihat camerasource.py
+CAMERA_CACHE  = os.environ.get("VUI_CAMERA_CACHE", os.path.join(PACKAGE_DIR, "camera_cache.json"))
+
+# ─────────────────────────────────────────────
+# FACE REGION — Landmark index per bagian wajah
+# Berdasarkan MediaPipe Face Mesh 478 landmarks
+# ─────────────────────────────────────────────
+FACE_REGIONS = {
+    "LEFT_EYE":   [33, 7, 163, 144, 145, 153, 154, 155, 133, 173, 157, 158, 159, 160, 161, 246],
+    "RIGHT_EYE":  [362, 382, 381, 380, 374, 373, 390, 249, 263, 466, 388, 387, 386, 385, 384, 398],
+    "LEFT_BROW":  [70, 63, 105, 66, 107, 55, 65, 52, 53, 46],
+    "RIGHT_BROW": [300, 293, 334, 296, 336, 285, 295, 282, 283, 276],
+    "NOSE":       [1, 2, 5, 4, 19, 94, 164, 0, 11, 12, 13, 14, 15, 16, 17, 18],
+    "MOUTH":      [61, 84, 17, 314, 405, 320, 307, 375, 321, 308, 324, 318, 402, 317, 14, 87, 178, 88, 95, 185, 40, 39, 37, 0, 267, 269, 270, 409],
+    "LEFT_CHEEK": [116, 123, 147, 213, 192, 214, 210, 211, 32],
+    "RIGHT_CHEEK":[345, 352, 376, 433, 416, 434, 430, 431, 262],
+    "CHIN":       [152, 148, 176, 149, 150, 136, 172, 58, 132, 93, 234, 127, 162, 21, 54],
+    "FOREHEAD":   [10, 338, 297, 332, 284, 251, 389, 356, 454, 323, 361, 288, 397, 365, 379, 378, 400, 377, 152],
+}
+
+# Semua index landmark di FACE_REGIONS (tanpa duplikat) — yang direkam per frame
+RECORD_LANDMARK_INDICES = sorted({idx for indices in FACE_REGIONS.values() for idx in indices})
+
+# Landmark index khusus pipi + titik referensi tengah wajah (ujung hidung)
+CHEEK_LANDMARKS = {
+    "LEFT_CHEEK":  FACE_REGIONS["LEFT_CHEEK"],
+    "RIGHT_CHEEK": FACE_REGIONS["RIGHT_CHEEK"],
+}
+NOSE_TIP_INDEX = 4
+
+# ─────────────────────────────────────────────
+# BLENDSHAPE
+# ─────────────────────────────────────────────
+# Urutan 52 blendshape output FaceLandmarker (category index 0..51)
+MP_BLENDSHAPE_NAMES = [
+    "_neutral",
+    "browDownLeft", "browDownRight", "browInnerUp", "browOuterUpLeft", "browOuterUpRight",
+    "cheekPuff", "cheekSquintLeft", "cheekSquintRight",
+    "eyeBlinkLeft", "eyeBlinkRight",
+    "eyeLookDownLeft", "eyeLookDownRight", "eyeLookInLeft", "eyeLookInRight",
+    "eyeLookOutLeft", "eyeLookOutRight", "eyeLookUpLeft", "eyeLookUpRight",
+    "eyeSquintLeft", "eyeSquintRight", "eyeWideLeft", "eyeWideRight",
+    "jawForward", "jawLeft", "jawOpen", "jawRight",
+    "mouthClose", "mouthDimpleLeft", "mouthDimpleRight", "mouthFrownLeft", "mouthFrownRight",
+    "mouthFunnel", "mouthLeft", "mouthLowerDownLeft", "mouthLowerDownRight",
+    "mouthPressLeft", "mouthPressRight", "mouthPucker", "mouthRight",
+    "mouthRollLower", "mouthRollUpper", "mouthShrugLower", "mouthShrugUpper",
+    "mouthSmileLeft", "mouthSmileRight", "mouthStretchLeft", "mouthStretchRight",
+    "mouthUpperUpLeft", "mouthUpperUpRight",
+    "noseSneerLeft", "noseSneerRight",
+]
+
+CHEEK_DIST_CHANNELS = ["LEFT_CHEEK_dist", "RIGHT_CHEEK_dist"]
+
+BLENDSHAPE_GROUPS = {
+    "EYE": [
+        "eyeBlinkLeft", "eyeBlinkRight",
+        "eyeLookDownLeft", "eyeLookDownRight",
+        "eyeLookInLeft", "eyeLookInRight",
+        "eyeLookOutLeft", "eyeLookOutRight",
+        "eyeLookUpLeft", "eyeLookUpRight",
+        "eyeSquintLeft", "eyeSquintRight",
+        "eyeWideLeft", "eyeWideRight",
+    ],
+    "BROW": [
+        "browDownLeft", "browDownRight",
+        "browInnerUp",
+        "browOuterUpLeft", "browOuterUpRight",
+    ],
+    "MOUTH": [
+        "jawForward", "jawLeft", "jawRight", "jawOpen",
+        "mouthClose", "mouthFunnel", "mouthPucker",
+        "mouthLeft", "mouthRight",
+        "mouthSmileLeft", "mouthSmileRight",
+        "mouthFrownLeft", "mouthFrownRight",
+        "mouthDimpleLeft", "mouthDimpleRight",
+        "mouthStretchLeft", "mouthStretchRight",
+        "mouthRollLower", "mouthRollUpper",
+        "mouthShrugLower", "mouthShrugUpper",
+        "mouthPressLeft", "mouthPressRight",
+        "mouthLowerDownLeft", "mouthLowerDownRight",
+        "mouthUpperUpLeft", "mouthUpperUpRight",
+    ],
+    "CHEEK": [
+        "cheekPuff", "cheekSquintLeft", "cheekSquintRight",
+    ],
+    "NOSE": [
+        "noseSneerLeft", "noseSneerRight",
+    ],
+    "HEAD": [
+        "headRoll", "headPitch", "headYaw",  # kalau ada
+    ],
+    "TONGUE": [
+        "tongueOut",
+    ],
+}
+
+# Reverse lookup: name → group
+BLENDSHAPE_TO_GROUP = {name: group for group, names in BLENDSHAPE_GROUPS.items() for name in names}
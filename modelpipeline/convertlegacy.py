@@ -0,0 +1,325 @@
+"""
+Legacy Recording Converter
+──────────────────────────
+Migrasi recording lama (recordings/session_*.json & *_blendshapes.csv)
+ke format sesi .vui (kolumnar + time index, lihat sessionformat.py).
+
+    python -m modelpipeline convert   # semua file di recordings/
+    python -m modelpipeline convert recordings/session_20260224_133426.json
+    python -m modelpipeline convert recordings --out converted --workers 4 --force
+
+Dua skema JSON ditangani:
+  - CheeckModel.py  : timestamp, blendshapes, landmark_regions
+                      (region NOSE punya index 2 dobel → 17 titik)
+  - modelmonitor.py : + cheek_distances, cheek_raw_coords
+                      (NOSE 16 titik, jarak pipi jadi channel *_dist)
+
+File JSON dibaca incremental (raw_decode per snapshot), CSV per baris,
+dan ditulis per chunk — memori tetap kecil walaupun file arsipnya besar.
+Satu file = satu job di process pool. Setelah ditulis, file lama dibaca
+ulang dan dibandingkan dengan hasil .vui (round-trip check).
+"""
+
+import argparse
+import csv
+import glob
+import json
+import multiprocessing
+import os
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+
+from .constants import MP_BLENDSHAPE_NAMES, CHEEK_DIST_CHANNELS, RECORDINGS_DIR
+from .sessionformat import SessionWriter, SessionReader, make_header, DTYPE
+
+# ─────────────────────────────────────────────
+# CONFIG
+# ─────────────────────────────────────────────
+BLOCK_SIZE   = 1 << 16   # byte per read() dari file JSON
+CHUNK_FRAMES = 256       # snapshot per write ke .vui
+VALUE_TOL    = 1e-4      # toleransi round-trip (nilai lama dibulatkan 4 desimal)
+TIME_TOL     = 2e-3      # detik (timestamp relatif disimpan float32)
+
+# FACE_REGIONS versi tiap script lama — urutan index = urutan koordinat di JSON
+_REGIONS_COMMON = {
+    "LEFT_EYE":    [33, 7, 163, 144, 145, 153, 154, 155, 133, 173, 157, 158, 159, 160, 161, 246],
+    "RIGHT_EYE":   [362, 382, 381, 380, 374, 373, 390, 249, 263, 466, 388, 387, 386, 385, 384, 398],
+    "LEFT_BROW":   [70, 63, 105, 66, 107, 55, 65, 52, 53, 46],
+    "RIGHT_BROW":  [300, 293, 334, 296, 336, 285, 295, 282, 283, 276],
+    "MOUTH":       [61, 84, 17, 314, 405, 320, 307, 375, 321, 308, 324, 318, 402, 317, 14, 87, 178, 88, 95, 185, 40, 39, 37, 0, 267, 269, 270, 409],
+    "LEFT_CHEEK":  [116, 123, 147, 213, 192, 214, 210, 211, 32],
+    "RIGHT_CHEEK": [345, 352, 376, 433, 416, 434, 430, 431, 262],
+    "CHIN":        [152, 148, 176, 149, 150, 136, 172, 58, 132, 93, 234, 127, 162, 21, 54],
+    "FOREHEAD":    [10, 338, 297, 332, 284, 251, 389, 356, 454, 323, 361, 288, 397, 365, 379, 378, 400, 377, 152],
+}
+LEGACY_REGIONS = {
+    "CheeckModel":  dict(_REGIONS_COMMON, NOSE=[1, 2, 5, 4, 19, 94, 2, 164, 0, 11, 12, 13, 14, 15, 16, 17, 18]),
+    "modelmonitor": dict(_REGIONS_COMMON, NOSE=[1, 2, 5, 4, 19, 94, 164, 0, 11, 12, 13, 14, 15, 16, 17, 18]),
+}
+LANDMARK_INDICES = sorted({i for idx in _REGIONS_COMMON.values() for i in idx}
+                          | set(LEGACY_REGIONS["CheeckModel"]["NOSE"]))
+_LANDMARK_POS = {idx: i for i, idx in enumerate(LANDMARK_INDICES)}
+
+_WS       = " \t\r\n"
+_WS_COMMA = " \t\r\n,"
+
+
+# ─────────────────────────────────────────────
+# INCREMENTAL READERS
+# ─────────────────────────────────────────────
+def iter_json_array(path, block_size=BLOCK_SIZE):
+    """Yield item top-level array JSON satu per satu tanpa load seluruh file."""
+    decoder = json.JSONDecoder()
+    with open(path, encoding="utf-8") as f:
+        buf, started, eof = "", False, False
+        while True:
+            buf = buf.lstrip(_WS_COMMA if started else _WS)
+            if not buf:
+                if eof:
+                    if started:
+                        raise ValueError(f"{path}: JSON terpotong (tidak ada ']')")
+                    return
+                chunk = f.read(block_size)
+                eof = not chunk
+                buf += chunk
+                continue
+
+            if not started:
+                if buf[0] != "[":
+                    raise ValueError(f"{path}: bukan JSON array")
+                buf, started = buf[1:], True
+                continue
+            if buf[0] == "]":
+                return
+
+            try:
+                obj, end = decoder.raw_decode(buf)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                chunk = f.read(block_size)
+                eof = not chunk
+                buf += chunk
+                continue
+            yield obj
+            buf = buf[end:]
+
+
+def _parse_ts(iso):
+    return datetime.fromisoformat(iso).timestamp()
+
+
+def detect_json_schema(first_snapshot):
+    if "cheek_distances" in first_snapshot or "cheek_raw_coords" in first_snapshot:
+        return "modelmonitor"
+    nose = first_snapshot.get("landmark_regions", {}).get("NOSE")
+    if nose is not None and len(nose) == len(LEGACY_REGIONS["modelmonitor"]["NOSE"]):
+        return "modelmonitor"
+    return "CheeckModel"
+
+
+def iter_json_frames(path):
+    """
+    Yield (wall_ts, values, landmarks_flat, schema, channels) per snapshot JSON lama.
+    values mengikuti urutan `channels` (52 blendshape [+ jarak pipi]).
+    """
+    schema = channels = regions = pos = None
+    for snap in iter_json_array(path):
+        if schema is None:
+            schema   = detect_json_schema(snap)
+            channels = list(MP_BLENDSHAPE_NAMES)
+            if schema == "modelmonitor":
+                channels += CHEEK_DIST_CHANNELS
+            regions  = LEGACY_REGIONS[schema]
+            pos      = {name: i for i, name in enumerate(channels)}
+
+        values = np.zeros(len(channels), dtype=DTYPE)
+        for group_items in snap.get("blendshapes", {}).values():
+            for name, score in group_items.items():
+                i = pos.get(name)
+                if i is not None:
+                    values[i] = score
+        if schema == "modelmonitor":
+            cd = snap.get("cheek_distances", {})
+            values[pos["LEFT_CHEEK_dist"]]  = cd.get("LEFT_CHEEK", 0.0)
+            values[pos["RIGHT_CHEEK_dist"]] = cd.get("RIGHT_CHEEK", 0.0)
+
+        lms = np.full((len(LANDMARK_INDICES), 3), np.nan, dtype=DTYPE)
+        for region, coords in snap.get("landmark_regions", {}).items():
+            for idx, c in zip(regions.get(region, ()), coords):
+                lms[_LANDMARK_POS[idx]] = (c["x"], c["y"], c["z"])
+        for side_coords in snap.get("cheek_raw_coords", {}).values():
+            for idx, c in side_coords.items():
+                lms[_LANDMARK_POS[int(idx)]] = (c["x"], c["y"], c["z"])
+
+        yield _parse_ts(snap["timestamp"]), values, lms.reshape(-1), schema, channels
+
+
+def iter_csv_frames(path):
+    """Yield (wall_ts, values, None, schema, channels) per baris CSV lama."""
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        channels = header[1:]
+        schema = "modelmonitor" if "LEFT_CHEEK_dist" in channels else "CheeckModel"
+        for row in reader:
+            if not row:
+                continue
+            values = np.asarray([float(v) for v in row[1:]], dtype=DTYPE)
+            yield _parse_ts(row[0]), values, None, schema, channels
+
+
+def iter_legacy_frames(path):
+    if path.endswith(".csv"):
+        return iter_csv_frames(path)
+    return iter_json_frames(path)
+
+
+# ─────────────────────────────────────────────
+# CONVERT + VERIFY (1 file = 1 job)
+# ─────────────────────────────────────────────
+def _flush(writer, buf, t0):
+    ts   = np.asarray([b[0] - t0 for b in buf], dtype=DTYPE)
+    vals = np.stack([b[1] for b in buf])
+    L3   = len(LANDMARK_INDICES) * 3
+    lms  = np.stack([b[2] if b[2] is not None else np.full(L3, np.nan, dtype=DTYPE) for b in buf])
+    writer.write_arrays(ts, vals, lms)
+
+
+def convert_file(src, dst):
+    """Konversi satu file lama → .vui. Return jumlah frame."""
+    writer, t0, buf = None, None, []
+    for wall_ts, values, lms, schema, channels in iter_legacy_frames(src):
+        if writer is None:
+            t0 = wall_ts
+            header = make_header(channels, LANDMARK_INDICES,
+                                 start_time=datetime.fromtimestamp(t0).isoformat(),
+                                 raw_blendshapes=False,
+                                 legacy_source=os.path.basename(src),
+                                 legacy_schema=schema)
+            writer = SessionWriter(dst, header)
+        buf.append((wall_ts, values, lms))
+        if len(buf) >= CHUNK_FRAMES:
+            _flush(writer, buf, t0)
+            buf = []
+    if writer is None:
+        return 0
+    if buf:
+        _flush(writer, buf, t0)
+    writer.close()
+    return writer.frames
+
+
+def verify_file(src, dst):
+    """Baca ulang file lama & .vui, bandingkan semua nilai. Return error maksimum."""
+    s = SessionReader(dst)
+    max_val_err = max_lm_err = max_t_err = 0.0
+    n, t0 = 0, None
+    for wall_ts, values, lms, _schema, channels in iter_legacy_frames(src):
+        if t0 is None:
+            t0 = wall_ts
+            if channels != s.channels:
+                raise ValueError(f"{dst}: channel tidak cocok dengan {src}")
+        if n >= len(s):
+            raise ValueError(f"{dst}: frame kurang ({len(s)})")
+        max_t_err   = max(max_t_err, abs(float(s.timestamps[n]) - (wall_ts - t0)))
+        max_val_err = max(max_val_err, float(np.max(np.abs(s.values[n] - values))) if len(values) else 0.0)
+        if lms is not None:
+            got = np.asarray(s.landmarks[n]).reshape(-1)
+            if not np.array_equal(np.isnan(got), np.isnan(lms)):
+                raise ValueError(f"{dst}: landmark frame {n} beda (NaN mask)")
+            ok = ~np.isnan(lms)
+            if ok.any():
+                max_lm_err = max(max_lm_err, float(np.max(np.abs(got[ok] - lms[ok]))))
+        n += 1
+    if n != len(s):
+        raise ValueError(f"{dst}: jumlah frame beda ({n} vs {len(s)})")
+    if max_val_err > VALUE_TOL or max_lm_err > VALUE_TOL or max_t_err > TIME_TOL:
+        raise ValueError(f"{dst}: round-trip error terlalu besar "
+                         f"(val={max_val_err:.2e}, lm={max_lm_err:.2e}, t={max_t_err:.2e})")
+    return {"values": max_val_err, "landmarks": max_lm_err, "time": max_t_err}
+
+
+def _job(args):
+    src, dst, force = args
+    t_start = time.perf_counter()
+    try:
+        if os.path.exists(dst) and not force:
+            return {"src": src, "dst": dst, "status": "skip"}
+        frames = convert_file(src, dst)
+        err = verify_file(src, dst) if frames else None
+        return {"src": src, "dst": dst, "status": "ok", "frames": frames, "err": err,
+                "seconds": time.perf_counter() - t_start,
+                "bytes_in": os.path.getsize(src)}
+    except Exception as e:  # satu file rusak tidak boleh menghentikan batch
+        return {"src": src, "dst": dst, "status": "error", "error": str(e)}
+
+
+def collect_jobs(paths, out_dir=None, force=False):
+    """JSON diprioritaskan; CSV hanya dipakai kalau JSON pasangannya tidak ada."""
+    files = []
+    for p in paths:
+        if os.path.isdir(p):
+            files += sorted(glob.glob(os.path.join(p, "session_*.json")))
+            files += sorted(glob.glob(os.path.join(p, "session_*_blendshapes.csv")))
+        else:
+            files.append(p)
+
+    json_stems = {os.path.splitext(f)[0] for f in files if f.endswith(".json")}
+    jobs = []
+    for f in files:
+        if f.endswith("_blendshapes.csv"):
+            stem = f[:-len("_blendshapes.csv")]
+            if stem in json_stems:
+                continue
+        else:
+            stem = os.path.splitext(f)[0]
+        dst = stem + ".vui"
+        if out_dir:
+            dst = os.path.join(out_dir, os.path.basename(dst))
+        jobs.append((f, dst, force))
+    return jobs
+
+
+# ─────────────────────────────────────────────
+# MAIN
+# ─────────────────────────────────────────────
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Konversi recording JSON/CSV lama ke format .vui")
+    ap.add_argument("paths", nargs="*", default=[RECORDINGS_DIR], help="file atau folder (default: recordings)")
+    ap.add_argument("--out", help="folder output (default: di sebelah file asli)")
+    ap.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    ap.add_argument("--force", action="store_true", help="timpa .vui yang sudah ada")
+    args = ap.parse_args(argv)
+
+    if args.out:
+        os.makedirs(args.out, exist_ok=True)
+    jobs = collect_jobs(args.paths, args.out, args.force)
+    if not jobs:
+        print("Tidak ada file recording lama.")
+        return 0
+
+    print(f"🔄 Konversi {len(jobs)} file ({args.workers} proses)...\n")
+    n_err = 0
+    t_start = time.perf_counter()
+    with multiprocessing.Pool(min(args.workers, len(jobs))) as pool:
+        for res in pool.imap_unordered(_job, jobs):
+            if res["status"] == "ok":
+                err = res["err"] or {"values": 0.0, "landmarks": 0.0}
+                print(f"  ✓ {res['src']} → {res['dst']}  "
+                      f"{res['frames']} frames, {res['seconds'] * 1000:.0f} ms  "
+                      f"(max err val={err['values']:.1e} lm={err['landmarks']:.1e})")
+            elif res["status"] == "skip":
+                print(f"  - {res['src']} (sudah ada, pakai --force untuk timpa)")
+            else:
+                n_err += 1
+                print(f"  ✗ {res['src']}: {res['error']}")
+    print(f"\n✅ Selesai dalam {time.perf_counter() - t_start:.2f} s, {n_err} error.")
+    return 1 if n_err else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,149 @@
+"""
+Terminal Dashboard
+──────────────────
+Tampilan listener yang digambar ulang DI TEMPAT (ANSI cursor), pengganti
+print blok 20–50 baris tiap 0.15 detik yang bikin terminal scroll terus.
+
+  - layout tetap: satu baris per blendshape (urutan tidak berubah), kalau
+    tidak muat tinggi terminal dibagi ke beberapa kolom
+  - tiap refresh hanya baris yang teksnya berubah yang ditulis ulang,
+    semua dalam satu write() + flush()
+  - refresh rate bisa diatur (default REFRESH_HZ)
+  - highlight cheekPuff / mouthPucker sama seperti CHEEK_FOCUS_MODE
+
+Windows 10+: escape ANSI diaktifkan lewat os.system("") (VT mode console).
+"""
+
+import os
+import shutil
+import sys
+import time
+
+# ─────────────────────────────────────────────
+# CONFIG
+# ─────────────────────────────────────────────
+REFRESH_HZ   = 10
+BAR_WIDTH    = 20
+NAME_WIDTH   = 22
+HEADER_LINES = 2
+
+_ESC   = "\x1b["
+_RESET = _ESC + "0m"
+_DIM   = _ESC + "2m"
+_BOLD  = _ESC + "1m"
+_ORANGE = _ESC + "38;5;208m"
+_BLUE   = _ESC + "38;5;39m"
+
+
+def enable_ansi():
+    """Aktifkan VT processing di console Windows (no-op di terminal lain)."""
+    if os.name == "nt":
+        os.system("")
+
+
+def _prefix(name, cheek_focus):
+    """(label, warna) sama seperti print_active_blendshapes di listener.py."""
+    if not cheek_focus:
+        return "      ", ""
+    if name == "cheekPuff":
+        return "CHEEK ", _BOLD + _ORANGE
+    if name == "mouthPucker":
+        return "PUCKER", _BOLD + _BLUE
+    if "mouth" in name.lower():
+        return "mouth ", ""
+    if "eye" in name.lower():
+        return "eye   ", ""
+    return "      ", ""
+
+
+class TerminalDashboard:
+    """
+    dash = TerminalDashboard(refresh_hz=10)
+    dash.update(names, values, seen, footer_lines)   # boleh dipanggil sesering apapun
+    dash.close()
+    """
+
+    def __init__(self, title="VSeeFace OSC Listener", refresh_hz=REFRESH_HZ,
+                 active_threshold=0.05, cheek_focus=True, stream=None):
+        self.title = title
+        self.interval = 1.0 / refresh_hz if refresh_hz > 0 else 0.0
+        self.active_threshold = active_threshold
+        self.cheek_focus = cheek_focus
+        self.out = stream or sys.stdout
+        self._rows = []          # teks terakhir per slot layout
+        self._layout_key = None
+        self._next = 0.0
+        self.redraws = self.rows_written = 0
+        enable_ansi()
+        self.out.write(_ESC + "?25l" + _ESC + "2J")   # sembunyikan cursor + clear sekali
+        self.out.flush()
+
+    # ── layout ──
+    def _layout(self, n_names, n_footer):
+        """Posisi (baris, kolom) tiap slot: header, nama-nama, footer."""
+        size = shutil.get_terminal_size((100, 40))
+        usable = max(size.lines - HEADER_LINES - n_footer - 1, 4)
+        cell_w = 6 + 1 + NAME_WIDTH + 7 + BAR_WIDTH + 3
+        n_cols = max(1, min(-(-n_names // usable), size.columns // cell_w))
+        per_col = -(-n_names // n_cols) if n_names else 0
+        pos = [(1, 1), (2, 1)]
+        pos += [(HEADER_LINES + 1 + i % per_col, 1 + (i // per_col) * cell_w) for i in range(n_names)]
+        top = HEADER_LINES + 1 + per_col + 1
+        pos += [(top + i, 1) for i in range(n_footer)]
+        return pos, cell_w
+
+    def _render_row(self, name, value, seen):
+        label, color = _prefix(name, self.cheek_focus)
+        if not seen:
+            return f"{_DIM}{label} {name[:NAME_WIDTH]:<{NAME_WIDTH}}      -{_RESET}"
+        bar = "█" * int(min(max(value, 0.0), 1.0) * BAR_WIDTH)
+        text = f"{label} {name[:NAME_WIDTH]:<{NAME_WIDTH}} {value:6.3f} {bar:<{BAR_WIDTH}}"
+        if value <= self.active_threshold:
+            return f"{_DIM}{text}{_RESET}"
+        return f"{color}{text}{_RESET}" if color else text
+
+    # ── render ──
+    def update(self, names, values, seen, footer=(), force=False):
+        """
+        names/values/seen: urutan tetap per channel (values & seen boleh array numpy).
+        footer: list baris teks di bawah (statistik stream dsb).
+        Return True kalau benar-benar menggambar.
+        """
+        now = time.perf_counter()
+        if not force and now < self._next:
+            return False
+        self._next = now + self.interval
+
+        n = len(names)
+        key = (n, len(footer), shutil.get_terminal_size((100, 40)))
+        if key != self._layout_key:
+            self._layout_key = key
+            self._pos, self._cell_w = self._layout(n, len(footer))
+            self._rows = [None] * len(self._pos)
+            self.out.write(_ESC + "2J")
+
+        active = sum(1 for i in range(n) if seen[i] and values[i] > self.active_threshold)
+        texts = [f"{_BOLD}{self.title}{_RESET}  —  {time.strftime('%H:%M:%S')}",
+                 f"{active}/{n} aktif (> {self.active_threshold})   Ctrl+C untuk stop"]
+        texts += [self._render_row(names[i], float(values[i]), bool(seen[i])) for i in range(n)]
+        texts += list(footer)
+
+        parts = []
+        for i, text in enumerate(texts):
+            if text != self._rows[i]:
+                self._rows[i] = text
+                row, col = self._pos[i]
+                clear = _ESC + "K" if col == 1 and (i < HEADER_LINES or i >= HEADER_LINES + n) else ""
+                parts.append(f"{_ESC}{row};{col}H{text}{clear}")
+        if parts:
+            self.out.write("".join(parts))
+            self.out.flush()
+            self.rows_written += len(parts)
+        self.redraws += 1
+        return True
+
+    def close(self):
+        """Kembalikan cursor, pindah ke bawah layout supaya print berikutnya rapi."""
+        bottom = max((r for r, _ in getattr(self, "_pos", [(1, 1)])), default=1)
+        self.out.write(f"{_ESC}{bottom + 1};1H{_RESET}{_ESC}?25h\n")
+        self.out.flush()
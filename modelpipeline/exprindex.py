@@ -0,0 +1,281 @@
+"""
+Expression Index
+────────────────
+"Momen rekaman mana yang mirip ekspresi ini?" — cari referensi ekspresi dan
+glitch tracking (frame yang jauh dari semua frame lain) di library sesi.
+
+    python -m modelpipeline index build recordings                   # → recordings/expression_index.npz
+    python -m modelpipeline index build recordings/stream_baru.vui   # tambah sesi baru saja (incremental)
+    python -m modelpipeline index query --at recordings/stream_x.vui:12.5 -k 5
+    python -m modelpipeline index query --snippet recordings/stream_x.vui:12.0-13.0 -k 3
+
+Vektor = 52 blendshape MediaPipe (urutan MP_BLENDSHAPE_NAMES). Pencarian
+brute-force tapi vectorized:
+
+    |q - x|² = |q|² - 2·q·x + |x|²
+
+|x|² disimpan saat insert, q·x dihitung pakai satu matmul per blok
+(BLOCK_ROWS baris) → beberapa ms untuk ratusan ribu frame. Untuk 52 dimensi
+KD-tree tidak lebih cepat dari ini.
+
+Snippet (M frame) dicari sebagai jendela M frame berurutan di sesi yang
+sama, skor = jumlah jarak² per frame.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+from .constants import MP_BLENDSHAPE_NAMES, RECORDINGS_DIR
+
+# ─────────────────────────────────────────────
+# CONFIG
+# ─────────────────────────────────────────────
+INDEX_PATH       = os.path.join(RECORDINGS_DIR, "expression_index.npz")
+INITIAL_CAPACITY = 4096
+BLOCK_ROWS       = 65536   # baris per matmul, batas memori [Q, BLOCK_ROWS]
+
+
+class ExpressionIndex:
+    """
+    Index k-NN di vektor blendshape.
+
+    Storage dialokasi dengan kapasitas (dobel saat penuh), jadi add() per
+    sesi / per frame tidak menyalin seluruh index setiap kali.
+    """
+
+    def __init__(self, channels=None, capacity=INITIAL_CAPACITY):
+        self.channels = list(channels or MP_BLENDSHAPE_NAMES)
+        self.sessions = []                       # nama sesi, id = posisi di list
+        self.n = 0
+        C = len(self.channels)
+        self._vecs = np.empty((capacity, C), dtype=np.float32)
+        self._sq   = np.empty(capacity, dtype=np.float32)
+        self._sid  = np.empty(capacity, dtype=np.int32)
+        self._t    = np.empty(capacity, dtype=np.float32)
+
+    def __len__(self):
+        return self.n
+
+    @property
+    def vectors(self):
+        return self._vecs[:self.n]
+
+    def _reserve(self, extra):
+        need = self.n + extra
+        cap = len(self._vecs)
+        if need <= cap:
+            return
+        while cap < need:
+            cap *= 2
+        for name in ("_vecs", "_sq", "_sid", "_t"):
+            old = getattr(self, name)
+            new = np.empty((cap,) + old.shape[1:], dtype=old.dtype)
+            new[:self.n] = old[:self.n]
+            setattr(self, name, new)
+
+    def _align(self, values, channels):
+        """Susun ulang kolom ke urutan index; channel yang tidak ada / NaN → 0."""
+        values = np.asarray(values, dtype=np.float32)
+        if channels is None or list(channels) == self.channels:
+            return np.nan_to_num(values.reshape(-1, len(self.channels)))
+        values = values.reshape(-1, len(channels))
+        pos = {c: i for i, c in enumerate(channels)}
+        out = np.zeros((len(values), len(self.channels)), dtype=np.float32)
+        for j, c in enumerate(self.channels):
+            if c in pos:
+                out[:, j] = values[:, pos[c]]
+        return np.nan_to_num(out)
+
+    # ── insert ──
+    def add(self, values, session, timestamps=None, channels=None):
+        """Tambah frame [N, C] milik satu sesi. Return jumlah frame yang masuk."""
+        vecs = self._align(values, channels)
+        k = len(vecs)
+        if k == 0:
+            return 0
+        if session in self.sessions:
+            sid = self.sessions.index(session)
+        else:
+            sid = len(self.sessions)
+            self.sessions.append(session)
+        self._reserve(k)
+        a, b = self.n, self.n + k
+        self._vecs[a:b] = vecs
+        self._sq[a:b]   = np.einsum("ij,ij->i", vecs, vecs)
+        self._sid[a:b]  = sid
+        self._t[a:b]    = np.arange(k) if timestamps is None else timestamps
+        self.n = b
+        return k
+
+    def add_session(self, path):
+        """Tambah satu file sesi (skip kalau sudah pernah di-index)."""
+        from .replay import load_session_arrays
+        name = os.path.basename(os.path.normpath(path))
+        if name in self.sessions:
+            return 0
+        ts, values, channels = load_session_arrays(path)
+        return self.add(values, name, ts, channels)
+
+    # ── query ──
+    def knn(self, queries, k=5, channels=None):
+        """
+        k tetangga terdekat untuk satu vektor [C] atau batch [Q, C].
+        Return (dist[Q, k], row[Q, k]) terurut dari yang paling dekat.
+        """
+        q = self._align(queries, channels)
+        k = min(k, self.n)
+        if k == 0:
+            return np.empty((len(q), 0), np.float32), np.empty((len(q), 0), np.int64)
+        q_sq = np.einsum("ij,ij->i", q, q)[:, None]
+        best_d = np.full((len(q), 0), np.inf, dtype=np.float32)
+        best_i = np.empty((len(q), 0), dtype=np.int64)
+        for a in range(0, self.n, BLOCK_ROWS):
+            b = min(a + BLOCK_ROWS, self.n)
+            d2 = q_sq - 2.0 * (q @ self._vecs[a:b].T) + self._sq[a:b]
+            kk = min(k, b - a)
+            part = np.argpartition(d2, kk - 1, axis=1)[:, :kk]
+            best_d = np.concatenate([best_d, np.take_along_axis(d2, part, axis=1)], axis=1)
+            best_i = np.concatenate([best_i, part + a], axis=1)
+            if best_d.shape[1] > k:
+                keep = np.argpartition(best_d, k - 1, axis=1)[:, :k]
+                best_d = np.take_along_axis(best_d, keep, axis=1)
+                best_i = np.take_along_axis(best_i, keep, axis=1)
+        order = np.argsort(best_d, axis=1)
+        dist = np.sqrt(np.maximum(np.take_along_axis(best_d, order, axis=1), 0.0))
+        return dist, np.take_along_axis(best_i, order, axis=1)
+
+    def search_snippet(self, snippet, k=5, channels=None):
+        """
+        Cari jendela M frame berurutan (di sesi yang sama) yang paling mirip
+        snippet [M, C]. Return (skor RMS per frame [k], row awal jendela [k]).
+        """
+        q = self._align(snippet, channels)
+        M, N = len(q), self.n
+        if M == 0 or N < M:
+            return np.empty(0, np.float32), np.empty(0, np.int64)
+        W = N - M + 1
+        x = self._vecs[:N]
+
+        # Σ_j |x_{i+j}|²  → cumsum, Σ_j |q_j|² → konstanta
+        csum = np.concatenate([[0.0], np.cumsum(self._sq[:N], dtype=np.float64)])
+        score = (csum[M:] - csum[:W]) + float(np.einsum("ij,ij->", q, q))
+        # -2 Σ_j q_j·x_{i+j}  → satu matmul [N, M] lalu jumlah diagonal
+        for a in range(0, W, BLOCK_ROWS):
+            b = min(a + BLOCK_ROWS, W)
+            g = x[a:b + M - 1] @ q.T
+            for j in range(M):
+                score[a:b] -= 2.0 * g[j:j + (b - a), j]
+
+        valid = self._sid[:W] == self._sid[M - 1:N]      # jendela tidak lintas sesi
+        score = np.where(valid, score, np.inf)
+        k = min(k, int(valid.sum()))
+        if k == 0:
+            return np.empty(0, np.float32), np.empty(0, np.int64)
+        top = np.argpartition(score, k - 1)[:k]
+        top = top[np.argsort(score[top])]
+        return np.sqrt(np.maximum(score[top], 0.0) / M), top
+
+    def describe(self, row):
+        """row → (nama sesi, timestamp)."""
+        return self.sessions[int(self._sid[row])], float(self._t[row])
+
+    # ── persist ──
+    def save(self, path=INDEX_PATH):
+        tmp = path + ".tmp.npz"
+        np.savez(tmp, vectors=self._vecs[:self.n], session_id=self._sid[:self.n],
+                 timestamps=self._t[:self.n], sessions=np.array(self.sessions),
+                 channels=np.array(self.channels))
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path=INDEX_PATH):
+        with np.load(path) as z:
+            idx = cls([str(c) for c in z["channels"]], capacity=max(len(z["vectors"]), INITIAL_CAPACITY))
+            idx.sessions = [str(s) for s in z["sessions"]]
+            n = len(z["vectors"])
+            idx._vecs[:n] = z["vectors"]
+            idx._sid[:n]  = z["session_id"]
+            idx._t[:n]    = z["timestamps"]
+        idx._sq[:n] = np.einsum("ij,ij->i", idx._vecs[:n], idx._vecs[:n])
+        idx.n = n
+        return idx
+
+
+# ─────────────────────────────────────────────
+# MAIN
+# ─────────────────────────────────────────────
+def _parse_ref(ref):
+    """'sesi.vui:12.5' → (path, 12.5, None), 'sesi.vui:12-13' → (path, 12, 13)."""
+    path, _, spec = ref.rpartition(":")
+    if not path:
+        raise argparse.ArgumentTypeError(f"format: path:detik atau path:awal-akhir ({ref})")
+    lo, _, hi = spec.partition("-")
+    return path, float(lo), float(hi) if hi else None
+
+
+def _load_ref(ref):
+    from .replay import load_session_arrays
+    path, t0, t1 = ref
+    ts, values, channels = load_session_arrays(path)
+    if t1 is None:
+        row = max(int(np.searchsorted(ts, t0, side="right")) - 1, 0)
+        return values[row:row + 1], channels
+    return values[np.searchsorted(ts, t0, side="left"):np.searchsorted(ts, t1, side="right")], channels
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Index k-NN ekspresi dari sesi rekaman")
+    ap.add_argument("--index", default=INDEX_PATH)
+    sub = ap.add_subparsers(dest="cmd", required=True)
+
+    b = sub.add_parser("build", help="buat / tambah sesi ke index")
+    b.add_argument("paths", nargs="*", default=[RECORDINGS_DIR])
+
+    q = sub.add_parser("query", help="cari frame / snippet yang mirip")
+    g = q.add_mutually_exclusive_group(required=True)
+    g.add_argument("--at", type=_parse_ref, help="path:detik (satu frame)")
+    g.add_argument("--snippet", type=_parse_ref, help="path:awal-akhir (detik)")
+    q.add_argument("-k", type=int, default=5)
+    args = ap.parse_args(argv)
+
+    if args.cmd == "build":
+        from .analytics import _expand
+        idx = ExpressionIndex.load(args.index) if os.path.exists(args.index) else ExpressionIndex()
+        t0 = time.perf_counter()
+        for path in _expand(args.paths):
+            added = idx.add_session(path)
+            print(f"  {'➕' if added else '⏭ '} {os.path.basename(os.path.normpath(path))}: {added} frames")
+        idx.save(args.index)
+        print(f"✅ {len(idx)} frames dari {len(idx.sessions)} sesi → {args.index} "
+              f"({time.perf_counter() - t0:.2f} s)")
+        return 0
+
+    idx = ExpressionIndex.load(args.index)
+    ref = args.at or args.snippet
+    values, channels = _load_ref(ref)
+    if len(values) == 0:
+        print("Tidak ada frame di rentang itu.")
+        return 1
+
+    t0 = time.perf_counter()
+    if args.at:
+        dist, rows = idx.knn(values, args.k, channels)
+        dist, rows = dist[0], rows[0]
+    else:
+        dist, rows = idx.search_snippet(values, args.k, channels)
+    ms = (time.perf_counter() - t0) * 1000
+
+    what = "frame" if args.at else f"snippet {len(values)} frame"
+    print(f"🔎 {what} dari {ref[0]} — {len(idx)} frames di index, {ms:.2f} ms")
+    for d, r in zip(dist, rows):
+        session, t = idx.describe(r)
+        print(f"  {d:.4f}  {session} @ {t:.2f} s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
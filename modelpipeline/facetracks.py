@@ -0,0 +1,122 @@
+"""
+Face Tracks
+───────────
+ID stabil per wajah saat FaceLandmarker mendeteksi lebih dari satu wajah.
+Urutan `result.face_landmarks` dari MediaPipe tidak dijamin sama antar frame,
+jadi index [0] bisa lompat ke orang lain — di sini tiap deteksi dicocokkan
+ke track frame sebelumnya:
+
+    tracks = FaceTracks()
+    ids = tracks.assign(result.face_landmarks)     # [id_untuk_wajah_0, id_untuk_wajah_1, ...]
+
+  - fitur per wajah: centroid landmark + bounding box (normalized 0-1)
+  - posisi track diprediksi pakai kecepatan (EMA) supaya dua wajah yang
+    lewat berdekatan tidak tertukar
+  - cost = jarak centroid / diagonal bbox + (1 - IoU); pasangan dengan cost
+    terkecil dipasang duluan (greedy), di atas MATCH_MAX_COST = wajah baru
+  - wajah baru dapat ID bebas terkecil; track yang hilang > MAX_MISSES
+    frame dihapus dan ID-nya bisa dipakai lagi (`new_ids` berisi ID baru
+    supaya state filter/remap-nya di-reset)
+"""
+
+# ─────────────────────────────────────────────
+# CONFIG
+# ─────────────────────────────────────────────
+MATCH_MAX_COST = 1.2     # di atas ini deteksi dianggap wajah lain
+MAX_MISSES     = 12      # frame tanpa deteksi sebelum ID dilepas (~0.5 s @ 24 fps)
+VELOCITY_EMA   = 0.5
+
+
+def face_box(landmarks):
+    """(cx, cy, x0, y0, x1, y1) dari landmark normalized."""
+    xs = [l.x for l in landmarks]
+    ys = [l.y for l in landmarks]
+    return sum(xs) / len(xs), sum(ys) / len(ys), min(xs), min(ys), max(xs), max(ys)
+
+
+def iou(a, b):
+    ix = max(min(a[4], b[4]) - max(a[2], b[2]), 0.0)
+    iy = max(min(a[5], b[5]) - max(a[3], b[3]), 0.0)
+    inter = ix * iy
+    union = (a[4] - a[2]) * (a[5] - a[3]) + (b[4] - b[2]) * (b[5] - b[3]) - inter
+    return inter / union if union > 0 else 0.0
+
+
+class Track:
+    __slots__ = ("id", "box", "vx", "vy", "misses", "age")
+
+    def __init__(self, track_id, box):
+        self.id, self.box = track_id, box
+        self.vx = self.vy = 0.0
+        self.misses = self.age = 0
+
+    def predicted(self):
+        """Box digeser sesuai kecepatan × jumlah frame sejak terakhir terlihat."""
+        k = self.misses + 1
+        dx, dy = self.vx * k, self.vy * k
+        cx, cy, x0, y0, x1, y1 = self.box
+        return cx + dx, cy + dy, x0 + dx, y0 + dy, x1 + dx, y1 + dy
+
+    def update(self, box):
+        k = self.misses + 1
+        vx, vy = (box[0] - self.box[0]) / k, (box[1] - self.box[1]) / k
+        if self.age:
+            vx = VELOCITY_EMA * vx + (1 - VELOCITY_EMA) * self.vx
+            vy = VELOCITY_EMA * vy + (1 - VELOCITY_EMA) * self.vy
+        self.vx, self.vy = vx, vy
+        self.box, self.misses = box, 0
+        self.age += 1
+
+
+def match_cost(track_box, box):
+    diag = ((track_box[4] - track_box[2]) ** 2 + (track_box[5] - track_box[3]) ** 2) ** 0.5 or 1e-6
+    dist = ((track_box[0] - box[0]) ** 2 + (track_box[1] - box[1]) ** 2) ** 0.5
+    return dist / diag + (1.0 - iou(track_box, box))
+
+
+class FaceTracks:
+    def __init__(self, max_cost=MATCH_MAX_COST, max_misses=MAX_MISSES):
+        self.max_cost   = max_cost
+        self.max_misses = max_misses
+        self.tracks     = {}        # id → Track
+        self.new_ids    = []        # ID yang baru dibuat di assign() terakhir
+        self.created    = 0
+
+    def assign(self, faces):
+        """List landmark per wajah → list ID (urutan sama dengan input)."""
+        boxes = [face_box(lm) for lm in faces]
+        preds = {tid: t.predicted() for tid, t in self.tracks.items()}
+        pairs = sorted((match_cost(pbox, box), tid, i)
+                       for tid, pbox in preds.items() for i, box in enumerate(boxes))
+
+        ids = [None] * len(boxes)
+        used = set()
+        for cost, tid, i in pairs:
+            if cost > self.max_cost:
+                break
+            if ids[i] is not None or tid in used:
+                continue
+            ids[i] = tid
+            used.add(tid)
+            self.tracks[tid].update(boxes[i])
+
+        self.new_ids = []
+        for i, box in enumerate(boxes):
+            if ids[i] is None:
+                tid = next(n for n in range(len(self.tracks) + 1) if n not in self.tracks)
+                self.tracks[tid] = Track(tid, box)
+                ids[i] = tid
+                used.add(tid)
+                self.new_ids.append(tid)
+                self.created += 1
+
+        for tid in [tid for tid in self.tracks if tid not in used]:
+            track = self.tracks[tid]
+            track.misses += 1
+            if track.misses > self.max_misses:
+                del self.tracks[tid]
+        return ids
+
+    def reset(self):
+        self.tracks.clear()
+        self.new_ids = []
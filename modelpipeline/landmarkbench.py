@@ -0,0 +1,305 @@
+"""
+Landmark Benchmark
+──────────────────
+FaceMesh lama (mp.solutions.face_mesh, dipakai testmedia.py / testpipe.ipynb)
+vs Tasks FaceLandmarker (yang dipakai tracker) di klip yang sama, di
+beberapa resolusi:
+
+    python -m modelpipeline bench clip1.mp4 frames/ --res 640x360,1280x720,1920x1080
+    python -m modelpipeline bench                                  # klip sintetis, tanpa file
+    python -m modelpipeline bench clip.mp4 --backend tasks-live,facemesh-refine --json hasil.json
+
+Backend:
+  - tasks-live      : FaceLandmarker LIVE_STREAM (produksi), latency = detect_async → callback
+  - tasks-video     : FaceLandmarker VIDEO (detect_for_video, dipakai graph threaded/throughput)
+  - facemesh        : mp.solutions FaceMesh, refine_landmarks=False
+  - facemesh-refine : FaceMesh refine_landmarks=True (iris, 478 titik)
+FaceMesh butuh mediapipe versi lama yang masih punya mp.solutions; kalau
+tidak ada, backend itu dilaporkan "tidak tersedia" dan sisanya tetap jalan.
+
+Metrik per (klip, resolusi, backend), setelah BENCH_WARMUP frame pertama dibuang:
+  - fps       : frame / detik wall clock (satu frame sekali jalan, tanpa antrean)
+  - p50 / p95 : latency per frame (ms)
+  - cpu       : CPU time process per frame (ms) dan % satu core — termasuk thread MediaPipe
+  - jitter    : rata-rata |p[t] - 2·p[t-1] + p[t-2]| landmark (468 titik yang sama di semua
+                backend), normalized × 1000 — gerak halus (konstan) tidak dihitung, getaran iya
+  - deteksi   : fraksi frame dengan wajah
+
+Frame klip di-decode & di-resize dulu ke memori (di luar waktu ukur), jadi
+--frames membatasi pemakaian RAM (1920x1080: ~6 MB per frame).
+"""
+
+import argparse
+import json
+import sys
+import threading
+import time
+
+from .constants import CAMERA_FPS
+
+# ─────────────────────────────────────────────
+# CONFIG
+# ─────────────────────────────────────────────
+BACKENDS        = ("tasks-live", "tasks-video", "facemesh", "facemesh-refine")
+DEFAULT_RES     = ((640, 360), (1280, 720), (1920, 1080))
+BENCH_FRAMES    = 120     # frame maksimum per klip
+BENCH_WARMUP    = 5       # frame awal yang tidak dihitung (inisialisasi lazy)
+JITTER_POINTS   = 468     # titik yang ada di semua backend (FaceMesh tanpa refine = 468)
+LIVE_TIMEOUT    = 2.0     # detik tunggu callback LIVE_STREAM per frame
+
+
+# ─────────────────────────────────────────────
+# BACKEND
+# ─────────────────────────────────────────────
+class Unavailable(Exception):
+    pass
+
+
+class TasksBackend:
+    """FaceLandmarker; process(rgb, ts) → list (x, y) landmark wajah pertama atau None."""
+
+    def __init__(self, mode):
+        from .landmarker import create_landmarker
+
+        self.mode   = mode
+        self._done  = threading.Event()
+        self._last  = None
+        self.landmarker, _report = create_landmarker(mode=mode, callback=self._on_result, warmup=0)
+
+    def _on_result(self, result, _image, _ts):
+        self._last = result
+        self._done.set()
+
+    def process(self, rgb, ts):
+        from .landmarker import make_mp_image
+
+        image = make_mp_image(rgb)
+        if self.mode == "live":
+            self._done.clear()
+            self.landmarker.detect_async(image, ts)
+            if not self._done.wait(LIVE_TIMEOUT):
+                return None
+            result = self._last
+        else:
+            result = self.landmarker.detect_for_video(image, ts)
+        if not result.face_landmarks:
+            return None
+        return [(l.x, l.y) for l in result.face_landmarks[0]]
+
+    def close(self):
+        self.landmarker.close()
+
+
+class FaceMeshBackend:
+    """mp.solutions FaceMesh (API lama, sinkron)."""
+
+    def __init__(self, refine):
+        import mediapipe as mp
+
+        solutions = getattr(mp, "solutions", None)
+        if solutions is None:
+            raise Unavailable(f"mediapipe {mp.__version__} tanpa mp.solutions")
+        self.mesh = solutions.face_mesh.FaceMesh(static_image_mode=False, max_num_faces=1,
+                                                 refine_landmarks=refine, min_detection_confidence=0.5,
+                                                 min_tracking_confidence=0.5)
+
+    def process(self, rgb, _ts):
+        result = self.mesh.process(rgb)
+        if not result.multi_face_landmarks:
+            return None
+        return [(l.x, l.y) for l in result.multi_face_landmarks[0].landmark]
+
+    def close(self):
+        self.mesh.close()
+
+
+def make_backend(name):
+    if name == "tasks-live":
+        return TasksBackend("live")
+    if name == "tasks-video":
+        return TasksBackend("video")
+    if name in ("facemesh", "facemesh-refine"):
+        return FaceMeshBackend(refine=name == "facemesh-refine")
+    raise ValueError(f"backend '{name}' tidak dikenal (ada: {', '.join(BACKENDS)})")
+
+
+# ─────────────────────────────────────────────
+# KLIP
+# ─────────────────────────────────────────────
+def synthetic_clip(frames=BENCH_FRAMES, size=(1280, 720)):
+    """Wajah kartun bergeser sinus + kedip sesekali (BGR) — cuma kalau tidak ada klip asli."""
+    import math
+
+    import cv2
+
+    from .landmarker import synthetic_face
+
+    out = []
+    for i in range(frames):
+        rgb = synthetic_face(*size, shift=int(40 * math.sin(i / 12)))
+        if i % 48 in (20, 21, 22):
+            for dx in (-55, 55):
+                cx, cy = size[0] // 2 + int(40 * math.sin(i / 12)) + int(dx * size[1] / 720), size[1] // 2
+                cv2.rectangle(rgb, (cx - 30, cy - 54), (cx + 30, cy - 26), (230, 190, 170), -1)
+        out.append(cv2.cvtColor(rgb, cv2.COLOR_RGB2BGR))
+    return out, CAMERA_FPS
+
+
+def load_clip(spec, max_frames=BENCH_FRAMES):
+    """File video / folder / glob gambar → (list frame BGR, fps)."""
+    from .camerasource import FileSource
+
+    src = FileSource(spec, realtime=False)
+    frames = []
+    while len(frames) < max_frames:
+        ret, frame = src.read()
+        if not ret:
+            break
+        frames.append(frame)
+    src.release()
+    return frames, src.fps
+
+
+def resized_rgb(frames, size):
+    import cv2
+    return [cv2.cvtColor(cv2.resize(f, size, interpolation=cv2.INTER_AREA), cv2.COLOR_BGR2RGB)
+            if (f.shape[1], f.shape[0]) != size else cv2.cvtColor(f, cv2.COLOR_BGR2RGB) for f in frames]
+
+
+# ─────────────────────────────────────────────
+# UKUR
+# ─────────────────────────────────────────────
+def percentile(values, q):
+    if not values:
+        return None
+    values = sorted(values)
+    return values[min(int(round(q * (len(values) - 1))), len(values) - 1)]
+
+
+def jitter(tracks):
+    """Rata-rata second difference landmark (× 1000) di run frame berurutan yang ada wajahnya."""
+    total = count = 0
+    for a, b, c in zip(tracks, tracks[1:], tracks[2:]):
+        if a is None or b is None or c is None:
+            continue
+        n = min(len(a), len(b), len(c), JITTER_POINTS)
+        total += sum(((c[k][0] - 2 * b[k][0] + a[k][0]) ** 2 + (c[k][1] - 2 * b[k][1] + a[k][1]) ** 2) ** 0.5
+                     for k in range(n)) / n
+        count += 1
+    return total / count * 1000 if count else None
+
+
+def run_backend(name, frames, fps):
+    """Satu backend di satu klip+resolusi → dict metrik."""
+    try:
+        backend = make_backend(name)
+    except Unavailable as e:
+        return {"backend": name, "error": str(e)}
+
+    latencies, tracks = [], []
+    step_ms = 1000.0 / (fps or CAMERA_FPS)
+    try:
+        for i, rgb in enumerate(frames[:BENCH_WARMUP]):
+            backend.process(rgb, int(i * step_ms) + 1)
+        w0, c0 = time.perf_counter(), time.process_time()
+        for i, rgb in enumerate(frames[BENCH_WARMUP:], start=BENCH_WARMUP):
+            t0 = time.perf_counter()
+            tracks.append(backend.process(rgb, int(i * step_ms) + 1))
+            latencies.append((time.perf_counter() - t0) * 1e3)
+        wall, cpu = time.perf_counter() - w0, time.process_time() - c0
+    finally:
+        backend.close()
+
+    n = len(latencies)
+    if not n:
+        return {"backend": name, "error": f"klip kurang dari {BENCH_WARMUP + 1} frame"}
+    return {"backend": name, "frames": n, "fps": n / wall if wall else None,
+            "p50_ms": percentile(latencies, 0.5), "p95_ms": percentile(latencies, 0.95),
+            "cpu_ms": cpu * 1e3 / n, "cpu_pct": cpu / wall * 100 if wall else None,
+            "jitter": jitter(tracks), "detect": sum(t is not None for t in tracks) / n,
+            "points": max((len(t) for t in tracks if t), default=0)}
+
+
+def run_bench(clips, resolutions=DEFAULT_RES, backends=BACKENDS, max_frames=BENCH_FRAMES, log=print):
+    results = []
+    for spec in clips or [None]:
+        frames, fps = synthetic_clip(max_frames) if spec is None else load_clip(spec, max_frames)
+        label = spec or "sintetis"
+        log(f"\n🎞  {label}: {len(frames)} frame @ {fps:.1f} fps")
+        log(HEADER)
+        for size in resolutions:
+            rgb = resized_rgb(frames, size)
+            for name in backends:
+                r = run_backend(name, rgb, fps)
+                r.update(clip=label, width=size[0], height=size[1])
+                results.append(r)
+                log(format_row(r))
+            del rgb
+    return results
+
+
+def _fmt(value, spec, none="-"):
+    return format(value, spec) if value is not None else none
+
+
+def format_row(r):
+    res = f"{r['width']}x{r['height']}"
+    if "error" in r:
+        return f"  {res:>9}  {r['backend']:<15} ⚠ {r['error']}"
+    return (f"  {res:>9}  {r['backend']:<15} {_fmt(r['fps'], '6.1f'):>6} {_fmt(r['p50_ms'], '7.1f'):>7} "
+            f"{_fmt(r['p95_ms'], '7.1f'):>7} {_fmt(r['cpu_ms'], '7.1f'):>7} {_fmt(r['cpu_pct'], '5.0f'):>5}% "
+            f"{_fmt(r['jitter'], '7.2f'):>7} {r['detect']:>6.0%} {r['points']:>5}")
+
+
+HEADER = (f"  {'resolusi':>9}  {'backend':<15} {'fps':>6} {'p50 ms':>7} {'p95 ms':>7} {'cpu ms':>7} "
+          f"{'cpu':>6} {'jitter':>7} {'deteksi':>6} {'titik':>5}")
+
+
+# ─────────────────────────────────────────────
+# MAIN
+# ─────────────────────────────────────────────
+def parse_res(text):
+    out = []
+    for part in text.split(","):
+        w, _, h = part.strip().lower().partition("x")
+        out.append((int(w), int(h)))
+    return out
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(prog="modelpipeline bench",
+                                 description="Benchmark FaceMesh lama vs Tasks FaceLandmarker")
+    ap.add_argument("clips", nargs="*", help="file video / folder / glob gambar (default: klip sintetis)")
+    ap.add_argument("--res", type=parse_res, default=list(DEFAULT_RES),
+                    help="resolusi, mis. 640x360,1280x720,1920x1080")
+    ap.add_argument("--backend", default=",".join(BACKENDS), help=f"subset dari: {', '.join(BACKENDS)}")
+    ap.add_argument("--frames", type=int, default=BENCH_FRAMES, help="frame maksimum per klip")
+    ap.add_argument("--json", metavar="FILE", help="simpan hasil lengkap ke JSON")
+    args = ap.parse_args(argv)
+
+    backends = [b.strip() for b in args.backend.split(",") if b.strip()]
+    unknown = [b for b in backends if b not in BACKENDS]
+    if unknown:
+        ap.error(f"backend tidak dikenal: {', '.join(unknown)}")
+
+    print(f"⏱  Benchmark landmark — {', '.join(backends)} @ {', '.join(f'{w}x{h}' for w, h in args.res)}")
+    print("   jitter = second difference landmark × 1000 (lebih kecil = lebih stabil)")
+    results = run_bench(args.clips, args.res, backends, args.frames)
+
+    ok = [r for r in results if "error" not in r and r["fps"]]
+    if ok:
+        best = max(ok, key=lambda r: r["fps"])
+        stable = min((r for r in ok if r["jitter"] is not None), key=lambda r: r["jitter"], default=None)
+        print(f"\n🏁 Tercepat: {best['backend']} @ {best['width']}x{best['height']} ({best['fps']:.1f} fps)")
+        if stable is not None:
+            print(f"   Paling stabil: {stable['backend']} @ {stable['width']}x{stable['height']} "
+                  f"(jitter {stable['jitter']:.2f})")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"💾 {args.json}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
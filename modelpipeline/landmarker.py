@@ -0,0 +1,173 @@
+"""
+Landmarker Loader
+─────────────────
+Load FaceLandmarker sekali di awal, bukan saat frame pertama datang:
+
+    lm, report = create_landmarker(mode="video", warmup=4)
+    print(format_report(report))
+
+  - find_model()   : model dicari di sebelah package (constants.MODEL_PATH /
+                     env VUI_MODEL), bukan relatif ke folder tempat script dijalankan
+  - model_buffer() : file model di-mmap lalu dijadikan satu buffer bytes per
+                     process, dipakai bersama semua landmarker (BaseOptions
+                     model_asset_buffer) — file tidak dibaca ulang tiap instance
+  - warm_up()      : beberapa inference di frame sintetis (wajah kartun yang
+                     memang terdeteksi, jadi detector + landmark + blendshape
+                     semua ter-inisialisasi) sebelum kamera dibuka
+
+Mode 'live': hasil warm-up (timestamp 1..N) ditahan di sini, tidak pernah
+sampai ke callback — frame asli pakai timestamp wall-clock ms yang jauh lebih
+besar, jadi urutan timestamp MediaPipe tetap naik.
+"""
+
+import mmap
+import os
+import threading
+import time
+
+from .constants import CAMERA_HEIGHT, CAMERA_WIDTH, MODEL_PATH, PACKAGE_DIR
+
+# ─────────────────────────────────────────────
+# CONFIG
+# ─────────────────────────────────────────────
+WARMUP_FRAMES  = 4       # inference sintetis sebelum kamera dibuka (0 = tanpa warm-up)
+WARMUP_TIMEOUT = 5.0     # detik — tunggu callback warm-up mode live
+
+_buffers = {}            # realpath → (mtime, bytes)
+_buffers_lock = threading.Lock()
+
+
+# ─────────────────────────────────────────────
+# MODEL FILE
+# ─────────────────────────────────────────────
+def find_model(path=None):
+    """
+    Path model yang ada: path apa adanya, lalu relatif ke folder package.
+    Default constants.MODEL_PATH (sebelah package / env VUI_MODEL).
+    """
+    path = path or MODEL_PATH
+    for candidate in (path, os.path.join(PACKAGE_DIR, path)):
+        if os.path.isfile(candidate):
+            return os.path.abspath(candidate)
+    raise FileNotFoundError(f"model '{path}' tidak ditemukan (cek juga {PACKAGE_DIR} / env VUI_MODEL)")
+
+
+def model_buffer(path=None):
+    """
+    Isi file model sebagai bytes, di-load sekali per process lewat mmap.
+    Binding ctypes MediaPipe (c_char_p) butuh bytes, jadi mmap disalin sekali
+    ke buffer bersama; objek ini tetap hidup selama process (dipakai C-side).
+    """
+    path = find_model(path)
+    key = os.path.realpath(path)
+    mtime = os.path.getmtime(key)
+    with _buffers_lock:
+        cached = _buffers.get(key)
+        if cached is None or cached[0] != mtime:
+            with open(key, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                cached = _buffers[key] = (mtime, mm[:])
+        return cached[1]
+
+
+# ─────────────────────────────────────────────
+# WARM-UP
+# ─────────────────────────────────────────────
+def synthetic_face(width=CAMERA_WIDTH, height=CAMERA_HEIGHT, shift=0):
+    """Frame RGB wajah kartun (oval, mata, hidung, mulut) — cukup untuk lolos face detector."""
+    import cv2
+    import numpy as np
+
+    img = np.full((height, width, 3), 90, np.uint8)
+    s = min(width, height) / 720
+    cx, cy = width // 2 + shift, height // 2
+
+    def p(dx, dy):
+        return int(cx + dx * s), int(cy + dy * s)
+
+    def r(a, b):
+        return int(a * s), int(b * s)
+
+    cv2.ellipse(img, p(0, 0), r(150, 200), 0, 0, 360, (230, 190, 170), -1)
+    for dx in (-55, 55):
+        cv2.ellipse(img, p(dx, -40), r(28, 12), 0, 0, 360, (255, 255, 255), -1)
+        cv2.circle(img, p(dx, -40), int(10 * s), (20, 30, 40), -1)
+    cv2.line(img, p(0, -30), p(-10, 50), (180, 140, 120), max(int(4 * s), 1))
+    cv2.ellipse(img, p(0, 100), r(50, 15), 0, 0, 360, (160, 60, 60), -1)
+    return img
+
+
+def make_mp_image(rgb):
+    import mediapipe as mp
+    return mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb)
+
+
+def warm_up(landmarker, mode="live", frames=WARMUP_FRAMES, gate=None, size=(CAMERA_WIDTH, CAMERA_HEIGHT)):
+    """
+    Jalankan `frames` inference sintetis (timestamp 1..N). Return list ms per frame.
+    Mode live: tunggu callback tiap frame lewat `gate` (lihat create_landmarker).
+    """
+    times = []
+    for i in range(frames):
+        image = make_mp_image(synthetic_face(*size, shift=(i % 2) * 8))
+        t0 = time.perf_counter()
+        if mode == "live":
+            gate.clear()
+            landmarker.detect_async(image, i + 1)
+            if not gate.wait(WARMUP_TIMEOUT):
+                break
+        else:
+            landmarker.detect_for_video(image, i + 1)
+        times.append((time.perf_counter() - t0) * 1e3)
+    return times
+
+
+# ─────────────────────────────────────────────
+# LANDMARKER
+# ─────────────────────────────────────────────
+def create_landmarker(model_path=None, mode="live", callback=None, warmup=WARMUP_FRAMES,
+                      size=(CAMERA_WIDTH, CAMERA_HEIGHT), num_faces=1):
+    """
+    FaceLandmarker mode 'live' (detect_async + callback) atau 'video'
+    (detect_for_video), dari buffer model bersama + warm-up.
+    Return (landmarker, report) — report: waktu load / create / warm-up (ms).
+    """
+    from mediapipe.tasks.python import vision
+    from mediapipe.tasks.python.core.base_options import BaseOptions
+
+    live = mode == "live"
+    warm_from = warmup
+    gate = threading.Event()
+
+    def on_result(result, image, ts):
+        if ts <= warm_from:
+            gate.set()              # hasil warm-up, jangan diteruskan
+        elif callback is not None:
+            callback(result, image, ts)
+
+    t0 = time.perf_counter()
+    path = find_model(model_path)
+    buffer = model_buffer(path)
+    t1 = time.perf_counter()
+    options = vision.FaceLandmarkerOptions(
+        base_options=BaseOptions(model_asset_buffer=buffer),
+        running_mode=vision.RunningMode.LIVE_STREAM if live else vision.RunningMode.VIDEO,
+        result_callback=on_result if live else None,
+        num_faces=num_faces,
+        output_face_blendshapes=True
+    )
+    landmarker = vision.FaceLandmarker.create_from_options(options)
+    t2 = time.perf_counter()
+    warm = warm_up(landmarker, mode, warmup, gate, size) if warmup else []
+
+    report = {"path": path, "size_mb": len(buffer) / 1e6, "mode": mode,
+              "load_ms": (t1 - t0) * 1e3, "create_ms": (t2 - t1) * 1e3, "warmup_ms": warm}
+    return landmarker, report
+
+
+def format_report(report):
+    text = (f"🧠 Model {os.path.basename(report['path'])} ({report['size_mb']:.1f} MB, {report['mode']}) — "
+            f"load {report['load_ms']:.0f} ms, create {report['create_ms']:.0f} ms")
+    warm = report["warmup_ms"]
+    if warm:
+        text += f", warm-up {len(warm)}× {sum(warm):.0f} ms (frame 1: {warm[0]:.0f} ms → {warm[-1]:.0f} ms)"
+    return text
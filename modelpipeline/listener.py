@@ -0,0 +1,188 @@
+"""
+VSeeFace OSC Listener
+─────────────────────
+Jalankan di terminal TERPISAH, bersamaan dengan pipeline utama.
+
+    python -m modelpipeline listen
+    python -m modelpipeline listen --dashboard --capture
+    python -m modelpipeline listen --port 39539        # terima langsung dari tracker
+
+Akan menangkap semua pesan VMC yang VSeeFace kirim balik,
+dan filter khusus blendshape yang aktif > threshold supaya
+tidak kebanjiran output.
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import datetime
+
+from .constants import LISTEN_PORT, RECORDINGS_DIR
+from .dashboard import TerminalDashboard
+from .streamstats import StreamMonitor, format_report
+from .vmccapture import CaptureWriter
+from .vmclisten import VMCListener
+
+# ─────────────────────────────────────────────
+# CONFIG
+# ─────────────────────────────────────────────
+ACTIVE_THRESHOLD = 0.05    # hanya tampilkan blendshape > nilai ini
+CHEEK_FOCUS_MODE = True    # kalau True, highlight cheekPuff & mouthPucker
+STREAM_STATS     = True    # statistik rate / jitter / loss / latency per sender
+STATS_INTERVAL   = 1.0     # detik antar print & log statistik
+STATS_LOG_DIR    = RECORDINGS_DIR
+DASHBOARD_HZ     = 10      # refresh rate dashboard (--dashboard)
+
+# ─────────────────────────────────────────────
+# STATE
+# ─────────────────────────────────────────────
+last_print_time  = 0
+PRINT_INTERVAL   = 0.15  # detik antar print (supaya terminal tidak scroll gila)
+stats_lines      = []    # baris statistik terakhir (footer dashboard)
+dashboard        = None  # TerminalDashboard kalau --dashboard
+monitor          = None  # StreamMonitor kalau STREAM_STATS
+
+# ─────────────────────────────────────────────
+# HANDLERS
+# ─────────────────────────────────────────────
+def handle_blend_apply(listener):
+    """
+    /VMC/Ext/Blend/Apply dikirim VSeeFace setelah semua blendshape di-set.
+    Ini momen terbaik untuk print snapshot karena semua nilai sudah lengkap.
+    """
+    global last_print_time
+    if dashboard:
+        return
+    now = time.time()
+    if now - last_print_time < PRINT_INTERVAL:
+        return
+    last_print_time = now
+    print_active_blendshapes(listener.snapshot())
+
+def handle_any(address, args):
+    """Catch-all untuk lihat address lain yang dikirim VSeeFace."""
+    # Uncomment baris di bawah kalau mau lihat SEMUA pesan (verbose banget)
+    # print(f"[OTHER] {address} → {args}")
+    pass
+
+def handle_tick(listener):
+    """
+    Tiap STATS_INTERVAL: log statistik stream ke file + satu baris per sender.
+    Mode dashboard: gambar ulang di tempat (dibatasi DASHBOARD_HZ).
+    """
+    global stats_lines
+    report = monitor.tick() if monitor else None
+    if report:
+        stats_lines = [format_report(r) for r in report]
+        if not dashboard:
+            for line in stats_lines:
+                print(line)
+    if dashboard:
+        n = len(listener.names)
+        dashboard.update(listener.names, listener.values[:n], listener.updated[:n] > 0, stats_lines)
+
+def print_active_blendshapes(blendshape_state):
+    """Print blendshape yang aktif dengan highlight khusus untuk cheek & mouth."""
+    if not blendshape_state:
+        return
+
+    active = {k: v for k, v in blendshape_state.items() if v > ACTIVE_THRESHOLD}
+    if not active:
+        return
+
+    ts = datetime.now().strftime("%H:%M:%S.%f")[:-3]
+    print(f"\n── {ts} ──────────────────────────────")
+
+    # Sort by value descending
+    for name, val in sorted(active.items(), key=lambda x: -x[1]):
+        bar = "█" * int(val * 25)
+
+        # Highlight khusus
+        if CHEEK_FOCUS_MODE and name == "cheekPuff":
+            prefix = "🟠 CHEEK  "
+        elif CHEEK_FOCUS_MODE and name == "mouthPucker":
+            prefix = "🔵 PUCKER "
+        elif CHEEK_FOCUS_MODE and "mouth" in name.lower():
+            prefix = "   mouth  "
+        elif CHEEK_FOCUS_MODE and "eye" in name.lower():
+            prefix = "   eye    "
+        else:
+            prefix = "          "
+
+        print(f"  {prefix} {name:<35} {val:.3f}  {bar}")
+
+# ─────────────────────────────────────────────
+# MAIN
+# ─────────────────────────────────────────────
+def main(argv=None):
+    global dashboard, monitor
+    ap = argparse.ArgumentParser(prog="modelpipeline listen", description="VSeeFace OSC / VMC listener")
+    ap.add_argument("--port", type=int, default=LISTEN_PORT,
+                    help=f"default {LISTEN_PORT} (VSeeFace sender); 39539 = terima langsung dari tracker")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--dashboard", action="store_true", help="tampilan di tempat, bukan print bertumpuk")
+    ap.add_argument("--capture", action="store_true", help="rekam semua datagram ke recordings/capture_*.vmcap")
+    ap.add_argument("--no-stats", action="store_true", help="matikan statistik stream")
+    args = ap.parse_args(argv)
+    port = args.port
+
+    listener = VMCListener(args.host, port)
+    listener.on_apply   = handle_blend_apply
+    listener.on_message = handle_any
+
+    stream_stats = STREAM_STATS and not args.no_stats
+    if stream_stats:
+        os.makedirs(STATS_LOG_DIR, exist_ok=True)
+        stats_path = os.path.join(STATS_LOG_DIR, f"listener_stats_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl")
+        monitor = StreamMonitor(log_path=stats_path, log_interval=STATS_INTERVAL)
+        listener.monitor = monitor
+
+    capture = None
+    if args.capture:
+        capture_path = os.path.join(STATS_LOG_DIR, f"capture_{datetime.now().strftime('%Y%m%d_%H%M%S')}.vmcap")
+        capture = CaptureWriter(capture_path, {"listen_port": port}).start()
+        listener.capture = capture
+
+    print("╔══════════════════════════════════════════════════╗")
+    print("║         VSeeFace OSC Listener                   ║")
+    print("╠══════════════════════════════════════════════════╣")
+    print(f"║  Listening port : {port}                          ║")
+    print(f"║  Show threshold : > {ACTIVE_THRESHOLD}                         ║")
+    print(f"║  Cheek focus    : {'ON ' if CHEEK_FOCUS_MODE else 'OFF'}                           ║")
+    print(f"║  Stream stats   : {'ON ' if stream_stats else 'OFF'}                           ║")
+    print(f"║  Capture        : {'ON ' if capture else 'OFF'}                           ║")
+    print("╠══════════════════════════════════════════════════╣")
+    print("║  Ctrl+C untuk stop                              ║")
+    print("╚══════════════════════════════════════════════════╝")
+    print(f"\nMenunggu data dari VSeeFace di port {port}...\n")
+    if monitor:
+        print(f"📈 Statistik stream → {monitor.log_path}\n")
+    if capture:
+        print(f"📼 Capture datagram → {capture.path}\n")
+
+    if args.dashboard:
+        dashboard = TerminalDashboard(f"VSeeFace OSC Listener — port {port}", DASHBOARD_HZ,
+                                      ACTIVE_THRESHOLD, CHEEK_FOCUS_MODE)
+
+    try:
+        listener.serve_forever(poll_interval=0.5 / DASHBOARD_HZ if dashboard else 0.1, on_tick=handle_tick)
+    except KeyboardInterrupt:
+        if dashboard:
+            dashboard.close()
+        st = listener.stats()
+        print(f"\n\n✅ Listener dihentikan. {st['datagrams']} datagram, {st['messages']} pesan, "
+              f"{st['applies']} frame, {st['malformed']} rusak.")
+    finally:
+        listener.close()
+        if monitor:
+            monitor.close()
+        if capture:
+            capture.close()
+            cs = capture.stats()
+            print(f"📼 {cs['written']} datagram ({cs['bytes'] / 1e6:.1f} MB) → {capture.path}, {cs['dropped']} drop")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
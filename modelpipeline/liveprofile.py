@@ -0,0 +1,187 @@
+"""
+Live Profiler
+─────────────
+Sampling profiler + tracemalloc yang bisa dinyalakan di tengah stream
+(tombol P di tracker, atau `kill -USR1 <pid>`), jalan N detik lalu mati
+sendiri — tanpa restart tracker:
+
+    prof = LiveProfiler("recordings", seconds=10)
+    prof.start()            # thread sampler, return langsung
+    ...
+    prof.stop()             # opsional: berhenti lebih awal, hasil tetap ditulis
+
+Sampler: tiap SAMPLE_INTERVAL, sys._current_frames() dibaca dan stack
+SEMUA thread Python dicatat — loop utama, thread stage graph, thread
+preview, dan thread callback MediaPipe (on_result dipanggil dari thread C++
+MediaPipe; selama callback jalan, stack-nya tercatat sebagai "native-<id>").
+Tidak ada hook per call seperti cProfile, jadi overhead kecil dan tetap
+sama berapa pun thread-nya; sampel adalah wall clock (thread yang menunggu
+antrean kelihatan menunggu). tracemalloc sendiri memperlambat SEMUA alokasi Python
+selama sesi (inference bisa ~1.5× lebih lambat) — alloc=False / --no-alloc
+kalau yang dicari cuma waktu.
+
+Hasil, di folder recordings (sebelah stream_*.vui):
+  - profile_<ts>.txt    : per thread, fungsi teratas self (leaf) & total (ada di stack)
+  - profile_<ts>.folded : stack "thread;f1;f2 count" — langsung dibuka di
+                          speedscope / flamegraph.pl
+  - alloc_<ts>.txt      : tracemalloc, alokasi yang bertambah selama profiling
+                          per baris + peak (kalau alloc=True)
+"""
+
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from datetime import datetime
+
+# ─────────────────────────────────────────────
+# CONFIG
+# ─────────────────────────────────────────────
+PROFILE_SECONDS    = 10.0    # durasi default satu sesi profiling
+SAMPLE_INTERVAL    = 0.005   # 200 Hz
+TRACEMALLOC_FRAMES = 8       # kedalaman traceback alokasi
+TOP_N              = 25      # baris per tabel di laporan
+
+
+def _label(code):
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class LiveProfiler:
+    def __init__(self, out_dir, seconds=PROFILE_SECONDS, interval=SAMPLE_INTERVAL, alloc=True, log=print):
+        self.out_dir  = out_dir
+        self.seconds  = seconds
+        self.interval = interval
+        self.alloc    = alloc
+        self.log      = log
+        self.paths    = []        # file hasil sesi terakhir
+
+        self._thread  = None
+        self._stop    = threading.Event()
+
+    @property
+    def active(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, seconds=None):
+        """Mulai satu sesi (False kalau masih ada sesi yang jalan)."""
+        if self.active:
+            return False
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, args=(seconds or self.seconds,),
+                                        name="vui-profiler", daemon=True)
+        self._thread.start()
+        return True
+
+    def stop(self, wait=True):
+        """Hentikan sesi lebih awal; hasil sampai titik ini tetap ditulis."""
+        self._stop.set()
+        if wait and self._thread is not None:
+            self._thread.join()
+
+    def toggle(self):
+        if self.active:
+            self.stop(wait=False)
+            return False
+        return self.start()
+
+    # ── sampler ──
+    def _run(self, seconds):
+        started_alloc = False
+        if self.alloc and not tracemalloc.is_tracing():
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+            started_alloc = True
+        before = tracemalloc.take_snapshot() if self.alloc else None
+        if self.alloc:
+            tracemalloc.reset_peak()
+
+        self.log(f"🔬 Profiling {seconds:g} s ({1 / self.interval:.0f} Hz"
+                 f"{' + tracemalloc' if self.alloc else ''}) ...")
+        stacks, names = Counter(), {}
+        me = threading.get_ident()
+        n = 0
+        busy = 0.0
+        t_start = time.perf_counter()
+        deadline = t_start + seconds
+        next_t = t_start
+        while not self._stop.is_set() and next_t < deadline:
+            t0 = time.perf_counter()
+            if n % 50 == 0:
+                names.update((t.ident, t.name) for t in threading.enumerate())
+            for tid, frame in sys._current_frames().items():
+                if tid == me:
+                    continue
+                stack = []          # code object saja; label baru dibuat saat menulis hasil
+                while frame is not None:
+                    stack.append(frame.f_code)
+                    frame = frame.f_back
+                stacks[tid, tuple(reversed(stack))] += 1
+            n += 1
+            busy += time.perf_counter() - t0
+            next_t += self.interval
+            self._stop.wait(max(next_t - time.perf_counter(), 0.0))
+        wall = time.perf_counter() - t_start
+
+        after = tracemalloc.take_snapshot() if self.alloc else None
+        peak = tracemalloc.get_traced_memory()[1] if self.alloc else 0
+        if started_alloc:
+            tracemalloc.stop()
+
+        try:
+            self.paths = self._write(stacks, names, n, wall, busy, before, after, peak)
+        except OSError as e:
+            self.log(f"⚠ Hasil profiling gagal ditulis: {e}")
+            return
+        self.log(f"🔬 Profiling selesai — {n} sampel, {wall:.1f} s, overhead sampler "
+                 f"{busy / wall:.1%} → " + ", ".join(self.paths))
+
+    # ── output ──
+    def _write(self, stacks, names, n, wall, busy, before, after, peak):
+        ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+        os.makedirs(self.out_dir, exist_ok=True)
+        base = os.path.join(self.out_dir, f"profile_{ts}")
+        paths = [base + ".txt", base + ".folded"]
+
+        def thread_name(tid):
+            return names.get(tid, f"native-{tid}")
+
+        with open(paths[1], "w", encoding="utf-8") as f:
+            for (tid, stack), count in stacks.most_common():
+                frames = ";".join(_label(k) for k in stack)
+                f.write(f"{thread_name(tid)};{frames} {count}\n")
+
+        per_thread = {}
+        for (tid, stack), count in stacks.items():
+            t = per_thread.setdefault(tid, {"samples": 0, "self": Counter(), "total": Counter()})
+            t["samples"] += count
+            if stack:
+                t["self"][stack[-1]] += count
+            for key in set(stack):
+                t["total"][key] += count
+
+        with open(paths[0], "w", encoding="utf-8") as f:
+            f.write(f"Sampling profile {ts} — {n} sampel dalam {wall:.2f} s "
+                    f"(interval {self.interval * 1e3:g} ms, overhead {busy / wall:.1%})\n")
+            f.write("Persen = fraksi sampel thread itu (wall clock, termasuk menunggu)\n")
+            for tid, t in sorted(per_thread.items(), key=lambda kv: -kv[1]["samples"]):
+                f.write(f"\n═══ {thread_name(tid)} — {t['samples']} sampel\n")
+                for title, counter in (("self", t["self"]), ("total", t["total"])):
+                    f.write(f"  {title}:\n")
+                    for key, count in counter.most_common(TOP_N):
+                        f.write(f"    {count / t['samples']:6.1%}  {count:6d}  {_label(key)}\n")
+
+        if after is not None:
+            path = os.path.join(self.out_dir, f"alloc_{ts}.txt")
+            own = (tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__))
+            diff = after.filter_traces(own).compare_to(before.filter_traces(own), "lineno")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(f"tracemalloc {ts} — peak {peak / 1e6:.1f} MB, "
+                        f"total {sum(s.size for s in after.statistics('filename')) / 1e6:.1f} MB\n")
+                f.write("Alokasi yang bertambah selama profiling (per baris):\n\n")
+                for stat in diff[:TOP_N]:
+                    f.write(f"  {stat.size_diff / 1024:+10.1f} KiB  {stat.count_diff:+7d} blok  "
+                            f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}\n")
+            paths.append(path)
+        return paths
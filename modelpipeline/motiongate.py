@@ -0,0 +1,165 @@
+"""
+Motion Gate
+───────────
+Skip inference FaceLandmarker kalau frame praktis tidak berubah (performer
+diam) — CPU-nya dipakai OBS untuk encoding.
+
+    gate = MotionGate()
+    if gate.check(frame_bgr):          # True = jalankan inference
+        result = detect(frame)
+        gate.update(landmarks, blendshapes)
+    else:
+        result = hasil sebelumnya      # ditahan, lewat remap seperti biasa
+
+Detector murah: ROI wajah terakhir (bbox landmark + margin) → grayscale
+GATE_SIZE×GATE_SIZE → absdiff terhadap frame REFERENSI (frame terakhir yang
+di-inference, bukan frame sebelumnya, jadi gerak pelan tetap terakumulasi).
+Skor = rata-rata diff per sel GATE_CELL×GATE_CELL, ambil sel tertinggi —
+kedipan cuma mengubah sel di sekitar mata, rata-rata satu ROI bakal
+menenggelamkannya. Pergeseran terang global (auto exposure) dibuang dulu.
+
+Supaya kedipan tidak pernah terlewat:
+  - threshold di bawah skor kelopak turun 25% (lihat tuning di DIFF_THRESHOLD)
+  - selama blendshape mata masih bergerak (|Δ| > HOT_DELTA antar inference)
+    atau sedang di tengah kedipan, gate tidak skip sama sekali
+  - paling lama MAX_SKIP frame berturut-turut, lalu refresh paksa
+"""
+
+import time
+
+# ─────────────────────────────────────────────
+# CONFIG
+# ─────────────────────────────────────────────
+GATE_SIZE      = 48      # ROI di-resize ke N×N grayscale
+GATE_CELL      = 6       # sel N×N piksel (di ROI kecil) → grid 8×8
+ROI_MARGIN     = 0.15    # margin bbox wajah (fraksi lebar/tinggi)
+# Skor sel (gray level). Tuning di wajah sintetis 1280x720 + noise sensor σ=2..5:
+# diam 0.9–2.1, exposure +6 1.3–2.1, kelopak turun 25% 4.5–5.5, setengah kedip 10–11,
+# kedip penuh 23–24, geser 3 px 12–13 → awal kedipan pun sudah lewat threshold.
+DIFF_THRESHOLD = 3.0
+MAX_SKIP       = 6       # frame berturut-turut maksimum tanpa inference (~250 ms @ 24 fps)
+HOT_DELTA      = 0.04    # perubahan blendshape antar inference yang dianggap "sedang bergerak"
+HOT_CHANNELS   = ("eyeBlinkLeft", "eyeBlinkRight", "eyeSquintLeft", "eyeSquintRight", "jawOpen")
+BLINK_ACTIVE   = 0.25    # eyeBlink di atas ini = kedipan sedang berjalan, jangan skip
+
+
+class MotionGate:
+    def __init__(self, threshold=DIFF_THRESHOLD, max_skip=MAX_SKIP, size=GATE_SIZE, cell=GATE_CELL,
+                 margin=ROI_MARGIN):
+        self.threshold = threshold
+        self.max_skip  = max_skip
+        self.size      = size - size % cell
+        self.cell      = cell
+        self.margin    = margin
+
+        self._roi      = None      # (x0, y0, x1, y1) normalized dari landmark terakhir
+        self._ref      = None      # gray kecil frame referensi
+        self._ref_roi  = None      # ROI piksel saat referensi diambil
+        self._hot      = True      # blendshape masih bergerak → jangan skip
+        self._last_bs  = None
+        self._run      = 0         # skip berturut-turut
+
+        self.frames = self.skipped = self.forced = 0
+        self.gate_s = 0.0
+        self.last_score = 0.0
+
+    # ── input dari hasil inference ──
+    def update(self, landmarks=None, blendshapes=None):
+        """
+        Dipanggil setelah inference asli: ROI wajah baru + cek blendshape masih bergerak.
+        Multi wajah: landmarks = gabungan semua wajah (ROI = union), blendshapes = list
+        dict per wajah dengan urutan ID tetap.
+        """
+        if landmarks:
+            xs = [l.x for l in landmarks]
+            ys = [l.y for l in landmarks]
+            mx = (max(xs) - min(xs)) * self.margin
+            my = (max(ys) - min(ys)) * self.margin
+            self._roi = (min(xs) - mx, min(ys) - my, max(xs) + mx, max(ys) + my)
+        else:
+            self._roi = None
+        faces = [blendshapes] if isinstance(blendshapes, dict) else [bs for bs in blendshapes or () if bs]
+        if faces:
+            prev = self._last_bs if self._last_bs is not None and len(self._last_bs) == len(faces) else None
+            hot = prev is None or any(abs(bs.get(ch, 0.0) - old[ch]) > HOT_DELTA
+                                      for bs, old in zip(faces, prev) for ch in HOT_CHANNELS)
+            blinking = any(max(bs.get("eyeBlinkLeft", 0.0), bs.get("eyeBlinkRight", 0.0)) > BLINK_ACTIVE
+                           for bs in faces)
+            self._hot = hot or blinking
+            self._last_bs = [{ch: bs.get(ch, 0.0) for ch in HOT_CHANNELS} for bs in faces]
+        else:
+            self._hot, self._last_bs = True, None
+
+    # ── per frame ──
+    def _roi_pixels(self, w, h):
+        if self._roi is None:
+            return 0, 0, w, h
+        x0, y0, x1, y1 = self._roi
+        x0, y0 = max(int(x0 * w), 0), max(int(y0 * h), 0)
+        x1, y1 = min(int(x1 * w), w), min(int(y1 * h), h)
+        if x1 - x0 < self.cell or y1 - y0 < self.cell:
+            return 0, 0, w, h
+        return x0, y0, x1, y1
+
+    def _small(self, frame, roi):
+        import cv2
+        x0, y0, x1, y1 = roi
+        # subsample dulu (view, tanpa copy) sampai ~2× ukuran target, baru INTER_AREA & gray di gambar kecil
+        step = max(min(x1 - x0, y1 - y0) // (self.size * 2), 1)
+        small = cv2.resize(frame[y0:y1:step, x0:x1:step], (self.size, self.size), interpolation=cv2.INTER_AREA)
+        return cv2.cvtColor(small, cv2.COLOR_BGR2GRAY) if small.ndim == 3 else small
+
+    def score(self, small):
+        """Diff terbesar per sel vs referensi, setelah offset terang global dibuang."""
+        import numpy as np
+        d = small.astype(np.float32) - self._ref
+        d -= np.median(d)
+        n = self.size // self.cell
+        cells = np.abs(d).reshape(n, self.cell, n, self.cell).mean(axis=(1, 3))
+        return float(cells.max())
+
+    def check(self, frame):
+        """True = frame ini perlu inference (dan jadi referensi baru)."""
+        t0 = time.perf_counter()
+        self.frames += 1
+        h, w = frame.shape[:2]
+        roi = self._ref_roi if self._ref is not None else self._roi_pixels(w, h)
+        small = self._small(frame, roi)
+
+        run = True
+        if self._ref is not None and not self._hot:
+            self.last_score = self.score(small)
+            if self.last_score <= self.threshold:
+                if self._run < self.max_skip:
+                    run = False
+                else:
+                    self.forced += 1
+
+        if run:
+            self._run = 0
+            # referensi baru pakai ROI wajah terbaru (ROI referensi lama bisa sudah bergeser)
+            self._ref_roi = self._roi_pixels(w, h)
+            self._ref = (small if self._ref_roi == roi else self._small(frame, self._ref_roi)).astype("float32")
+        else:
+            self._run += 1
+            self.skipped += 1
+        self.gate_s += time.perf_counter() - t0
+        return run
+
+    # ── laporan ──
+    def stats(self, infer_ms=None):
+        st = {"frames": self.frames, "skipped": self.skipped, "forced": self.forced,
+              "skip_ratio": self.skipped / self.frames if self.frames else 0.0,
+              "gate_ms": self.gate_s * 1e3 / self.frames if self.frames else 0.0}
+        if infer_ms is not None:
+            st["infer_ms"] = infer_ms
+            st["saved_ms"] = self.skipped * infer_ms - self.gate_s * 1e3
+        return st
+
+
+def format_gate_stats(st):
+    text = (f"🎯 Motion gate: {st['skipped']}/{st['frames']} frame di-skip ({st['skip_ratio']:.0%}), "
+            f"{st['forced']} refresh paksa, gate {st['gate_ms']:.2f} ms/frame")
+    if "saved_ms" in st:
+        text += f" → hemat ~{st['saved_ms'] / 1e3:.1f} s CPU (inference ~{st['infer_ms']:.1f} ms)"
+    return text
@@ -0,0 +1,176 @@
+"""
+OSC Codec
+─────────
+Encode pesan OSC/VMC langsung ke bytes, tanpa lewat python-osc builder.
+Dipakai di jalur yang kirim ribuan pesan per detik (replay, load test),
+di mana SimpleUDPClient.send_message terlalu mahal per pesan.
+
+    enc = BlendValEncoder()
+    sock.sendto(enc.encode("mouthPucker", 0.42), ("127.0.0.1", 39539))
+    sock.sendto(BLEND_APPLY, ("127.0.0.1", 39539))
+
+Sisi terima: iter_messages() memecah datagram (pesan tunggal atau bundle,
+termasuk bundle bersarang) jadi rentang byte per pesan tanpa menyalin,
+parse_message() men-decode satu pesan jadi (address, args).
+"""
+
+import struct
+import time
+
+BLEND_VAL_ADDRESS   = "/VMC/Ext/Blend/Val"
+BLEND_APPLY_ADDRESS = "/VMC/Ext/Blend/Apply"
+FRAME_STAMP_ADDRESS = "/VUI/Frame"     # [seq, waktu kirim µs] — diabaikan VSeeFace
+STAMP_MASK          = 0x7FFFFFFF       # µs dibungkus ke int32 positif (wrap ±35 menit)
+
+_FLOAT  = struct.Struct(">f")
+_INT    = struct.Struct(">i")
+_DOUBLE = struct.Struct(">d")
+_INT64  = struct.Struct(">q")
+
+BUNDLE_TAG = b"#bundle\0"
+
+
+def osc_string(s):
+    """String OSC: ASCII + null terminator, dipad ke kelipatan 4 byte."""
+    b = s.encode("utf-8") + b"\0"
+    return b + b"\0" * (-len(b) % 4)
+
+
+def osc_blob(b):
+    return _INT.pack(len(b)) + b + b"\0" * (-len(b) % 4)
+
+
+def encode_message(address, *args):
+    """Encode satu pesan OSC (int, float, str, bytes, bool)."""
+    tags = ","
+    payload = []
+    for a in args:
+        if isinstance(a, bool):
+            tags += "T" if a else "F"
+        elif isinstance(a, int):
+            tags += "i"
+            payload.append(_INT.pack(a))
+        elif isinstance(a, float):
+            tags += "f"
+            payload.append(_FLOAT.pack(a))
+        elif isinstance(a, str):
+            tags += "s"
+            payload.append(osc_string(a))
+        elif isinstance(a, (bytes, bytearray)):
+            tags += "b"
+            payload.append(osc_blob(bytes(a)))
+        else:
+            raise TypeError(f"Tipe argumen OSC tidak didukung: {type(a).__name__}")
+    return osc_string(address) + osc_string(tags) + b"".join(payload)
+
+
+def encode_bundle(messages, timetag=1):
+    """Bundle OSC dari list pesan yang sudah di-encode (timetag 1 = langsung)."""
+    parts = [osc_string("#bundle"), struct.pack(">Q", timetag)]
+    for m in messages:
+        parts.append(_INT.pack(len(m)))
+        parts.append(m)
+    return b"".join(parts)
+
+
+BLEND_APPLY = encode_message(BLEND_APPLY_ADDRESS)
+
+
+def stamp_us(t=None):
+    """Waktu wall clock (µs) dibungkus STAMP_MASK, muat di argumen int OSC."""
+    return int((time.time() if t is None else t) * 1_000_000) & STAMP_MASK
+
+
+def stamp_delay_us(sent, now=None):
+    """Selisih (now - sent) dari dua stamp_us, aman terhadap wrap."""
+    d = (stamp_us(now) - sent) & STAMP_MASK
+    return d - (STAMP_MASK + 1) if d > STAMP_MASK // 2 else d
+
+
+def encode_frame_stamp(seq, t=None):
+    """/VUI/Frame [seq, stamp_us] — penanda akhir frame untuk statistik listener."""
+    return encode_message(FRAME_STAMP_ADDRESS, int(seq) & STAMP_MASK, stamp_us(t))
+
+
+class BlendValEncoder:
+    """/VMC/Ext/Blend/Val [name, value] dengan prefix per nama di-cache."""
+
+    def __init__(self):
+        self._prefix = {}
+        self._head = osc_string(BLEND_VAL_ADDRESS) + osc_string(",sf")
+
+    def encode(self, name, value):
+        prefix = self._prefix.get(name)
+        if prefix is None:
+            prefix = self._prefix[name] = self._head + osc_string(name)
+        return prefix + _FLOAT.pack(value)
+
+
+# ─────────────────────────────────────────────
+# DECODE
+# ─────────────────────────────────────────────
+def iter_messages(data, start=0, end=None):
+    """
+    Yield (start, end) tiap pesan di datagram. Bundle di-flatten rekursif,
+    timetag diabaikan (VMC selalu "langsung"). Datagram rusak → ValueError.
+    """
+    if end is None:
+        end = len(data)
+    if not data.startswith(BUNDLE_TAG, start):
+        yield start, end
+        return
+    pos = start + 16                      # "#bundle\0" + timetag 8 byte
+    while pos < end:
+        if pos + 4 > end:
+            raise ValueError("bundle terpotong")
+        size = _INT.unpack_from(data, pos)[0]
+        pos += 4
+        if size <= 0 or pos + size > end:
+            raise ValueError("ukuran elemen bundle tidak valid")
+        yield from iter_messages(data, pos, pos + size)
+        pos += size
+
+
+def _read_string(data, pos, end):
+    z = data.find(b"\0", pos, end)
+    if z < 0:
+        raise ValueError("string OSC tanpa terminator")
+    return data[pos:z].decode("utf-8", "replace"), pos + ((z - pos) // 4 + 1) * 4
+
+
+def parse_message(data, start=0, end=None):
+    """Decode satu pesan → (address, tuple args)."""
+    if end is None:
+        end = len(data)
+    address, pos = _read_string(data, start, end)
+    if pos >= end or data[pos] != 0x2C:   # tanpa type tag "," → tanpa argumen
+        return address, ()
+    tags, pos = _read_string(data, pos, end)
+    args = []
+    try:
+        for t in tags[1:]:
+            if t == "f":
+                args.append(_FLOAT.unpack_from(data, pos)[0]); pos += 4
+            elif t == "i":
+                args.append(_INT.unpack_from(data, pos)[0]); pos += 4
+            elif t == "s":
+                s, pos = _read_string(data, pos, end)
+                args.append(s)
+            elif t == "b":
+                n = _INT.unpack_from(data, pos)[0]; pos += 4
+                args.append(bytes(data[pos:pos + n])); pos += n + (-n % 4)
+            elif t == "d":
+                args.append(_DOUBLE.unpack_from(data, pos)[0]); pos += 8
+            elif t == "h":
+                args.append(_INT64.unpack_from(data, pos)[0]); pos += 8
+            elif t in "TF":
+                args.append(t == "T")
+            elif t == "N":
+                args.append(None)
+            else:
+                raise ValueError(f"type tag OSC tidak didukung: {t}")
+    except struct.error:
+        raise ValueError("argumen OSC terpotong") from None
+    if pos > end:
+        raise ValueError("argumen OSC terpotong")
+    return address, tuple(args)
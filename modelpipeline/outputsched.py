@@ -0,0 +1,167 @@
+"""
+Output Scheduler
+────────────────
+Kirim frame VMC dengan rate tetap, lepas dari rate inference. Kamera 24 fps
++ hasil MediaPipe yang datang tidak teratur kelihatan patah-patah di avatar
+yang di-render 60–144 Hz; di sini tiap blendshape diinterpolasi di antara
+hasil-hasil terakhir:
+
+    python -m modelpipeline track --output-rate 60
+    python -m modelpipeline track --output-rate 120 --output-delay 80
+
+    sched = OutputScheduler(send, rate=60, delay_ms=50).start()
+    sched.push(frames)          # dari stage osc (TrackedFrame per wajah), return langsung
+    ...
+    sched.stop()
+
+  - waktu render = sekarang − delay, di jam capture (TrackedFrame.t_ms, wall
+    clock), lalu dicari dua sampel yang mengapitnya → lerp linear per channel
+  - render di depan sampel terbaru → nilai terbaru DITAHAN (tanpa ekstrapolasi);
+    gate skip / inference telat = nilai terakhir tetap dikirim. Wajah yang
+    tidak dapat sampel baru lebih dari delay + FACE_TIMEOUT dilepas (port-nya
+    berhenti dikirimi); ID yang dipakai ulang wajah baru → reset(face_id)
+  - delay ≥ latency inference + 1 interval kamera → selalu interpolasi; lebih
+    kecil → latency lebih rendah, tapi ujung tiap interval jadi ditahan.
+    Rasio interpolasi vs tahan dicetak di akhir untuk tuning
+  - jadwal tick deadline absolut (replay.DriftFreeScheduler); tick yang
+    terlewat karena stall dilompati, bukan dikirim beruntun
+  - per tick per wajah: satu lerp numpy ~52 float + encode/sendto yang sama
+    dengan jalur langsung
+"""
+
+import threading
+import time
+
+import numpy as np
+
+from .replay import DriftFreeScheduler
+
+# ─────────────────────────────────────────────
+# CONFIG
+# ─────────────────────────────────────────────
+OUTPUT_RATE   = 0        # Hz; 0 = kirim langsung tiap hasil inference (perilaku lama)
+OUTPUT_DELAY  = 50.0     # ms render di belakang jam capture
+HISTORY       = 4        # sampel per wajah yang disimpan untuk dicari pengapitnya
+LATENESS_KEEP = 4096     # keterlambatan tick terakhir yang disimpan untuk statistik
+FACE_TIMEOUT  = 500.0    # ms tanpa sampel baru (di luar delay) sebelum wajah berhenti dikirim
+
+
+class OutputScheduler:
+    """
+    send(face_id, names, values, t_ms) dipanggil dari thread scheduler tiap tick
+    per wajah; values = list float urut names, t_ms = capture sampel terbaru.
+    """
+
+    def __init__(self, send, rate, delay_ms=OUTPUT_DELAY, clock=time.time, timeout_ms=FACE_TIMEOUT):
+        if rate <= 0:
+            raise ValueError("rate output harus > 0 Hz")
+        self.send   = send
+        self.rate   = rate
+        self.period = 1.0 / rate
+        self.delay  = delay_ms / 1000.0
+        self.timeout = timeout_ms / 1000.0
+        self.clock  = clock
+        self.sched  = DriftFreeScheduler(keep=LATENESS_KEEP)
+
+        self._faces  = {}           # face_id → (names, tuple sampel (t, values)) — diganti utuh per push
+        self._thread = None
+        self._stop   = threading.Event()
+
+        self.pushed = self.ticks = self.skipped = 0
+        self.interpolated = self.held = self.evicted = 0
+        self.send_s = 0.0
+
+    # ── input (thread osc / remap) ──
+    def push(self, frames):
+        for frame in frames:
+            names = tuple(frame.sent)
+            sample = (frame.t_ms / 1000.0, np.fromiter(frame.sent.values(), np.float32, len(names)))
+            state = self._faces.get(frame.face_id)
+            if state is None or state[0] != names or sample[0] <= state[1][-1][0]:
+                # wajah baru / set channel berubah / timestamp tidak naik → mulai ulang
+                self._faces[frame.face_id] = (names, (sample,))
+            else:
+                self._faces[frame.face_id] = (names, state[1][-(HISTORY - 1):] + (sample,))
+            self.pushed += 1
+
+    def reset(self, face_id):
+        """ID dipakai wajah lain → history lama dibuang (jangan lerp dari wajah sebelumnya)."""
+        self._faces.pop(face_id, None)
+
+    # ── tick (thread scheduler) ──
+    def values_at(self, samples, t):
+        """Nilai di waktu t: lerp dua sampel pengapit, ditahan di luar rentang."""
+        if t >= samples[-1][0]:
+            self.held += 1
+            return samples[-1][1]
+        if t <= samples[0][0]:
+            return samples[0][1]
+        for (t0, v0), (t1, v1) in zip(samples, samples[1:]):
+            if t <= t1:
+                self.interpolated += 1
+                return v0 + (v1 - v0) * np.float32((t - t0) / (t1 - t0))
+        return samples[-1][1]
+
+    def tick(self):
+        t0 = time.perf_counter()
+        render_t = self.clock() - self.delay
+        for face_id, state in list(self._faces.items()):
+            names, samples = state
+            if render_t - samples[-1][0] > self.timeout:
+                # wajah sudah pergi: lepas (kecuali push baru masuk di sela-sela)
+                if self._faces.get(face_id) is state:
+                    self._faces.pop(face_id, None)
+                    self.evicted += 1
+                continue
+            values = self.values_at(samples, render_t)
+            self.send(face_id, names, values.tolist(), samples[-1][0] * 1000.0)
+        self.ticks += 1
+        self.send_s += time.perf_counter() - t0
+
+    def _run(self):
+        sched = self.sched
+        sched.reset()
+        k = 0
+        while not self._stop.is_set():
+            late = sched.wait_until_offset(k * self.period)
+            self.tick()
+            k += 1
+            if late > self.period:
+                # stall (GC, CPU penuh): lompat ke tick berikutnya yang masih di depan
+                missed = int(late / self.period)
+                k += missed
+                self.skipped += missed
+
+    # ── lifecycle ──
+    def start(self):
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="vmc-output", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def stats(self):
+        st = {"rate": self.rate, "delay_ms": self.delay * 1e3, "ticks": self.ticks, "pushed": self.pushed,
+              "skipped": self.skipped, "interpolated": self.interpolated, "held": self.held,
+              "evicted": self.evicted,
+              "tick_ms": self.send_s * 1e3 / self.ticks if self.ticks else 0.0}
+        total = self.interpolated + self.held
+        st["interp_ratio"] = self.interpolated / total if total else 0.0
+        if self.sched.lateness:
+            late = np.asarray(self.sched.lateness) * 1e3
+            st.update(late_p50_ms=float(np.percentile(late, 50)), late_p99_ms=float(np.percentile(late, 99)))
+        return st
+
+
+def format_output_stats(st):
+    text = (f"⏲  Output {st['rate']:g} Hz (delay {st['delay_ms']:.0f} ms): {st['ticks']} tick dari "
+            f"{st['pushed']} hasil, {st['interp_ratio']:.0%} interpolasi / {1 - st['interp_ratio']:.0%} ditahan, "
+            f"{st['skipped']} tick dilompati, {st['evicted']} wajah dilepas, {st['tick_ms']:.2f} ms/tick")
+    if "late_p99_ms" in st:
+        text += f", telat p50 {st['late_p50_ms']:.2f} / p99 {st['late_p99_ms']:.2f} ms"
+    return text
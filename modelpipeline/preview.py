@@ -0,0 +1,132 @@
+"""
+Preview Window
+──────────────
+Jendela preview (cv2.imshow + cv2.waitKey) dijalankan di thread sendiri,
+terpisah dari loop tracking.
+
+    preview = PreviewWindow("VuiTuber Pipeline", draw_overlay, fps=15)
+    preview.start()
+    ...
+    preview.submit(frame, state)      # non-blocking, cuma simpan frame terbaru
+    key = preview.poll_command()      # 'r' / 's' / 'c' / 'q' / None
+
+Loop tracking cuma menaruh frame terbaru ke slot; thread preview yang
+menggambar HUD/mesh dan menampilkan dengan fps sendiri (default 15).
+Kalau window nge-freeze (drag, resize, dsb), tracking tetap jalan full rate.
+
+Mode headless: pakai StdinCommands saja, tidak ada window dan tidak ada
+gambar sama sekali. Perintah diketik di terminal lalu Enter.
+"""
+
+import queue
+import sys
+import threading
+import time
+
+import cv2
+
+# ─────────────────────────────────────────────
+# CONFIG
+# ─────────────────────────────────────────────
+DEFAULT_PREVIEW_FPS = 15
+
+
+class PreviewWindow:
+    """Preview window di thread sendiri dengan latest-value slot + command queue."""
+
+    def __init__(self, title, draw_fn, fps=DEFAULT_PREVIEW_FPS, commands=None):
+        self.title    = title
+        self.draw_fn  = draw_fn                    # draw_fn(frame, state), dipanggil di thread preview
+        self.period   = 1.0 / max(fps, 1)
+        self.commands = commands if commands is not None else queue.Queue()
+
+        self._lock    = threading.Lock()
+        self._pending = None                       # (frame, state) terbaru, belum ditampilkan
+        self._running = False
+        self._thread  = None
+
+        self.frames_submitted = 0
+        self.frames_shown     = 0
+
+    def start(self):
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="preview", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._running = False
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+            self._thread = None
+
+    def submit(self, frame, state):
+        """Taruh frame terbaru. Frame lama yang belum sempat tampil langsung ditimpa."""
+        with self._lock:
+            self._pending = (frame, state)
+            self.frames_submitted += 1
+
+    def poll_command(self):
+        """Ambil satu perintah dari queue tanpa blocking (None kalau kosong)."""
+        try:
+            return self.commands.get_nowait()
+        except queue.Empty:
+            return None
+
+    def _run(self):
+        next_tick = time.perf_counter()
+        while self._running:
+            with self._lock:
+                item, self._pending = self._pending, None
+
+            if item is not None:
+                # gambar di copy: frame yang sama bisa masih antre di convert / motion gate
+                frame, state = item[0].copy(), item[1]
+                self.draw_fn(frame, state)
+                cv2.imshow(self.title, frame)
+                self.frames_shown += 1
+
+            # waitKey wajib dipanggil di thread yang sama dengan imshow
+            key = cv2.waitKey(1) & 0xFF
+            if key != 0xFF:
+                self.commands.put(chr(key).lower())
+
+            next_tick += self.period
+            delay = next_tick - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                next_tick = time.perf_counter()    # ketinggalan → jangan kejar-kejaran
+
+        cv2.destroyWindow(self.title)
+
+
+class StdinCommands:
+    """Baca perintah dari terminal (mode headless) ke command queue yang sama."""
+
+    def __init__(self, commands=None):
+        self.commands = commands if commands is not None else queue.Queue()
+        self._thread  = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="stdin-commands", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        # iterasi stdin tidak bisa diinterupsi, thread daemon ikut mati saat proses selesai
+        pass
+
+    def poll_command(self):
+        try:
+            return self.commands.get_nowait()
+        except queue.Empty:
+            return None
+
+    def _run(self):
+        for line in sys.stdin:
+            line = line.strip().lower()
+            if line:
+                self.commands.put(line[0])
+        # stdin ditutup (EOF, misal jalan di background) → berhenti baca saja,
+        # tracking jalan terus sampai Ctrl+C
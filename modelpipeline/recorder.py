@@ -0,0 +1,153 @@
+"""
+Stream Recorder
+───────────────
+Recording kontinu: SETIAP frame hasil MediaPipe (blendshape, landmark,
+jarak pipi, timestamp) dicatat, bukan cuma snapshot manual.
+
+    rec = StreamRecorder("recordings/stream_xxx.vui", landmark_indices=...)
+    rec.start()
+    rec.push(t, blendshapes_dict, face_landmarks, cheek_dist)   # dari callback
+    rec.close()
+
+push() tidak pernah nge-block: frame masuk ke queue yang ukurannya dibatasi,
+kalau penuh frame dibuang dan dihitung di `frames_dropped`. Thread writer di
+belakang menulis per chunk ke disk (format .vui, lihat sessionformat.py), jadi memori tetap konstan walaupun
+recording berjam-jam, dan kalau crash paling cuma hilang 1 chunk terakhir.
+"""
+
+import queue
+import threading
+import time
+from datetime import datetime
+
+from .constants import MP_BLENDSHAPE_NAMES
+from .sessionformat import SessionWriter, make_header
+
+# ─────────────────────────────────────────────
+# CONFIG
+# ─────────────────────────────────────────────
+QUEUE_SIZE     = 512    # frame maksimum yang antre ke writer (~20 detik @ 24 fps)
+CHUNK_FRAMES   = 120    # frame per chunk yang ditulis sekaligus
+FLUSH_INTERVAL = 1.0    # detik — chunk yang belum penuh tetap di-flush
+
+_STOP = object()
+
+
+class StreamRecorder:
+    """Recorder per-frame dengan bounded queue + background writer thread."""
+
+    def __init__(self, path, landmark_indices, channels=None, extra_channels=(), sample_rate=None,
+                 sink_factory=SessionWriter, queue_size=QUEUE_SIZE, chunk_frames=CHUNK_FRAMES):
+        self.path             = path
+        self.sample_rate      = sample_rate
+        self.blend_channels   = list(channels or MP_BLENDSHAPE_NAMES)
+        self.extra_channels   = list(extra_channels)
+        self.channels         = self.blend_channels + self.extra_channels
+        self.landmark_indices = list(landmark_indices)
+        self.chunk_frames     = chunk_frames
+        self.sink_factory     = sink_factory
+
+        self._queue  = queue.Queue(maxsize=queue_size)
+        self._thread = None
+        self._sink   = None
+        self._t0     = None
+        self._last_t = None
+
+        self.frames_pushed  = 0
+        self.frames_written = 0
+        self.frames_dropped = 0
+        self.chunks_written = 0
+
+    def header(self):
+        return make_header(self.channels, self.landmark_indices,
+                           sample_rate=self.sample_rate,
+                           start_time=datetime.now().isoformat(),
+                           raw_blendshapes=True)
+
+    def start(self):
+        self._sink = self.sink_factory(self.path, self.header())
+        self._thread = threading.Thread(target=self._run, name="stream-recorder", daemon=True)
+        self._thread.start()
+        return self
+
+    def push(self, t, blendshapes, face_landmarks=None, extra=None):
+        """
+        Catat 1 frame. Dipanggil dari callback MediaPipe — tidak boleh nge-block.
+
+        t              : timestamp detik (monotonic / timestamp_ms / 1000)
+        blendshapes    : dict { name: score } (nilai RAW dari MediaPipe)
+        face_landmarks : list landmark 478 titik (result.face_landmarks[0])
+        extra          : dict nilai tambahan sesuai extra_channels (misal jarak pipi)
+        """
+        if self._t0 is None:
+            self._t0 = self._last_t = t
+        # Timestamp wajib monotonic (index sesi pakai binary search)
+        t = self._last_t = max(t, self._last_t)
+        values = [blendshapes.get(n, 0.0) for n in self.blend_channels]
+        if self.extra_channels:
+            extra = extra or {}
+            values += [extra.get(n, 0.0) for n in self.extra_channels]
+
+        landmarks = None
+        if face_landmarks is not None:
+            landmarks = []
+            for idx in self.landmark_indices:
+                lm = face_landmarks[idx]
+                landmarks += (lm.x, lm.y, lm.z)
+
+        self.frames_pushed += 1
+        try:
+            self._queue.put_nowait((t - self._t0, values, landmarks))
+        except queue.Full:
+            self.frames_dropped += 1
+            return False
+        return True
+
+    def annotate(self, **fields):
+        """Field tambahan di header sesi (ditulis ulang saat close), mis. face_id yang direkam."""
+        self._sink.header.update(fields)
+
+    def close(self):
+        if self._thread is None:
+            return
+        self._queue.put(_STOP)
+        self._thread.join()
+        self._thread = None
+        self._sink.close()
+
+    def stats(self):
+        return {
+            "pushed":  self.frames_pushed,
+            "written": self.frames_written,
+            "dropped": self.frames_dropped,
+            "chunks":  self.chunks_written,
+            "queued":  self._queue.qsize(),
+        }
+
+    def _run(self):
+        buf = []
+        last_flush = time.monotonic()
+        while True:
+            try:
+                item = self._queue.get(timeout=FLUSH_INTERVAL)
+            except queue.Empty:
+                item = None
+
+            if item is _STOP:
+                break
+            if item is not None:
+                buf.append(item)
+
+            if buf and (len(buf) >= self.chunk_frames or time.monotonic() - last_flush >= FLUSH_INTERVAL):
+                self._flush(buf)
+                buf = []
+                last_flush = time.monotonic()
+
+        # sisa frame di queue setelah STOP tidak ada (STOP selalu item terakhir)
+        if buf:
+            self._flush(buf)
+
+    def _flush(self, buf):
+        self._sink.write_chunk(buf)
+        self.frames_written += len(buf)
+        self.chunks_written += 1
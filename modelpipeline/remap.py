@@ -0,0 +1,201 @@
+"""
+Remap Profiles
+──────────────
+Post-processing blendshape sebelum dikirim ke VSeeFace, dalam bentuk
+profile (dict) supaya bisa dibandingkan offline:
+
+  - SQUINT_OFFSET          : eyeSquint dikurangi offset (modelmonitor / mediapipefinal)
+  - BLINK_TRIGGER/BOOST    : eyeBlink > trigger dikali boost
+  - CHEEK_PROXY            : cheekPuff dihitung dari mouthPucker
+                             (hysteresis ON/OFF + smoothing N frame, CheeckModel)
+  - SMOOTH_FRAMES          : moving average semua channel (filter opsional)
+
+Key profile sama dengan nama konstanta di script tracker lama & calibration
+profile hasil analytics.py, jadi file JSON dari sana bisa langsung dipakai.
+
+apply_profile() bekerja di array [N, C] sekaligus (vectorized) untuk analisa
+offline; LiveRemap adalah versi per-frame (state hysteresis & smoothing
+disimpan) yang dipakai tracker live. Hasil keduanya identik.
+"""
+
+import json
+import os
+from collections import deque
+
+import numpy as np
+
+from .analytics import hysteresis_mask
+
+# ─────────────────────────────────────────────
+# PROFILES
+# ─────────────────────────────────────────────
+DEFAULT_PROFILE = {
+    "SQUINT_OFFSET":       0.0,
+    "BLINK_TRIGGER":       1.0,
+    "BLINK_BOOST":         1.0,
+    "CHEEK_PROXY":         False,
+    "CHEEK_THRESHOLD_ON":  0.72,
+    "CHEEK_THRESHOLD_OFF": 0.60,
+    "CHEEK_MAX":           1.0,
+    "CHEEK_OUT_MAX":       1.0,
+    "CHEEK_SMOOTH_FRAMES": 6,
+    "SMOOTH_FRAMES":       1,
+}
+
+PROFILES = {
+    "raw":            {},
+    "runmodel":       {},                       # runmodel.py lama kirim nilai mentah
+    "CheeckModel":    {"CHEEK_PROXY": True},
+    "modelmonitor":   {"SQUINT_OFFSET": 0.3, "BLINK_TRIGGER": 0.2, "BLINK_BOOST": 1.4},
+    "mediapipefinal": {"SQUINT_OFFSET": 0.2, "BLINK_TRIGGER": 0.2, "BLINK_BOOST": 1.4},
+}
+
+SQUINT_CHANNELS = ["eyeSquintLeft", "eyeSquintRight"]
+BLINK_CHANNELS  = ["eyeBlinkLeft", "eyeBlinkRight"]
+
+
+def load_profile(spec):
+    """
+    "CheeckModel"                      → profile bawaan
+    "calib.json"                       → DEFAULT + isi file
+    "CheeckModel+calib.json"           → profile bawaan ditimpa isi file
+    """
+    name, _, path = spec.partition("+")
+    if not path and (name.endswith(".json") or os.path.isfile(name)):
+        name, path = "raw", name
+    if name not in PROFILES:
+        raise ValueError(f"profile '{name}' tidak dikenal (ada: {', '.join(PROFILES)})")
+    profile = dict(DEFAULT_PROFILE)
+    profile.update(PROFILES[name])
+    if path:
+        with open(path, encoding="utf-8") as f:
+            overrides = json.load(f)
+        profile.update({k: v for k, v in overrides.items() if k in DEFAULT_PROFILE})
+    return profile
+
+
+# ─────────────────────────────────────────────
+# VECTORIZED OPS
+# ─────────────────────────────────────────────
+def running_mean(x, n):
+    """
+    Rata-rata n frame terakhir sepanjang axis 0; di awal rata-rata dari frame
+    yang sudah ada (sama dengan buffer list + pop(0) di script lama).
+    """
+    if n <= 1:
+        return x
+    c = np.cumsum(x, axis=0, dtype=np.float64)
+    out = c.copy()
+    out[n:] -= c[:-n]
+    count = np.minimum(np.arange(1, len(x) + 1), n).reshape((-1,) + (1,) * (x.ndim - 1))
+    return (out / count).astype(x.dtype)
+
+
+def _segments(n, session_id):
+    """Rentang baris per sesi (state filter di-reset tiap sesi baru)."""
+    if session_id is None or n == 0:
+        return [(0, n)]
+    cut = np.flatnonzero(np.diff(session_id)) + 1
+    bounds = np.concatenate([[0], cut, [n]])
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def apply_profile(values, channels, profile, session_id=None):
+    """values [N, C] RAW → hasil remap [N, C] (float32, array baru)."""
+    out = np.array(values, dtype=np.float32, copy=True)
+    pos = {c: i for i, c in enumerate(channels)}
+
+    sq = [pos[c] for c in SQUINT_CHANNELS if c in pos]
+    if sq and profile["SQUINT_OFFSET"]:
+        out[:, sq] = np.maximum(0.0, out[:, sq] - profile["SQUINT_OFFSET"])
+
+    bl = [pos[c] for c in BLINK_CHANNELS if c in pos]
+    if bl and profile["BLINK_BOOST"] != 1.0:
+        v = out[:, bl]
+        out[:, bl] = np.where(v > profile["BLINK_TRIGGER"], np.minimum(1.0, v * profile["BLINK_BOOST"]), v)
+
+    if profile["CHEEK_PROXY"] and "mouthPucker" in pos and "cheekPuff" in pos:
+        on, off = profile["CHEEK_THRESHOLD_ON"], profile["CHEEK_THRESHOLD_OFF"]
+        out_max = profile["CHEEK_OUT_MAX"]
+        pucker = out[:, pos["mouthPucker"]]
+        cheek = np.empty(len(out), dtype=np.float32)
+        for a, b in _segments(len(out), session_id):
+            p = pucker[a:b]
+            active = hysteresis_mask(p, on, off)
+            span = profile["CHEEK_MAX"] - on
+            ratio = (p - on) / span if span > 0 else np.ones_like(p)     # CHEEK_MAX ≤ ON: aktif = penuh
+            raw = np.where(active, np.clip(ratio * out_max, 0.0, out_max), 0.0).astype(np.float32)
+            cheek[a:b] = np.round(running_mean(raw, int(profile["CHEEK_SMOOTH_FRAMES"])), 4)
+        out[:, pos["cheekPuff"]] = cheek
+
+    n_smooth = int(profile["SMOOTH_FRAMES"])
+    if n_smooth > 1:
+        for a, b in _segments(len(out), session_id):
+            out[a:b] = running_mean(out[a:b], n_smooth)
+    return out
+
+
+# ─────────────────────────────────────────────
+# LIVE (PER FRAME)
+# ─────────────────────────────────────────────
+class LiveRemap:
+    """
+    remap = LiveRemap(load_profile("CheeckModel"))
+    out = remap.apply({"mouthPucker": 0.8, ...})     # dict baru, input tidak diubah
+
+    Urutan & hasil sama dengan apply_profile() per frame.
+    """
+
+    def __init__(self, profile):
+        self.profile = profile
+        self.reset()
+
+    def reset(self):
+        self._cheek_active  = False
+        self._cheek_history = deque(maxlen=max(int(self.profile["CHEEK_SMOOTH_FRAMES"]), 1))
+        self._history       = {}     # smoothing semua channel: nama → deque
+
+    def apply(self, blendshapes):
+        p = self.profile
+        out = dict(blendshapes)
+
+        if p["SQUINT_OFFSET"]:
+            for name in SQUINT_CHANNELS:
+                if name in out:
+                    out[name] = max(0.0, out[name] - p["SQUINT_OFFSET"])
+
+        if p["BLINK_BOOST"] != 1.0:
+            for name in BLINK_CHANNELS:
+                if name in out and out[name] > p["BLINK_TRIGGER"]:
+                    out[name] = min(1.0, out[name] * p["BLINK_BOOST"])
+
+        if p["CHEEK_PROXY"] and "mouthPucker" in out:
+            out["cheekPuff"] = self._cheek_puff(out["mouthPucker"])
+
+        n_smooth = int(p["SMOOTH_FRAMES"])
+        if n_smooth > 1:
+            for name, v in out.items():
+                hist = self._history.get(name)
+                if hist is None:
+                    hist = self._history[name] = deque(maxlen=n_smooth)
+                hist.append(v)
+                out[name] = sum(hist) / len(hist)
+        return out
+
+    def _cheek_puff(self, pucker):
+        """cheekPuff dari mouthPucker: hysteresis ON/OFF + rata-rata N frame."""
+        p = self.profile
+        on = p["CHEEK_THRESHOLD_ON"]
+        if pucker >= on:
+            self._cheek_active = True
+        elif pucker < p["CHEEK_THRESHOLD_OFF"]:
+            self._cheek_active = False
+        # zona tengah: ikut state sebelumnya
+
+        raw = 0.0
+        if self._cheek_active:
+            span = p["CHEEK_MAX"] - on
+            ratio = (pucker - on) / span if span > 0 else 1.0
+            raw = min(max(ratio * p["CHEEK_OUT_MAX"], 0.0), p["CHEEK_OUT_MAX"])
+        self._cheek_history.append(raw)
+        return round(sum(self._cheek_history) / len(self._cheek_history), 4)
@@ -0,0 +1,231 @@
+"""
+VMC Replay
+──────────
+Putar ulang sesi rekaman sebagai stream VMC/OSC (UDP) dengan timing asli,
+ke VSeeFace atau listener (`python -m modelpipeline listen`) — tanpa kamera, tanpa orang di depan kamera.
+
+    python -m modelpipeline replay recordings/stream_20260224_133426.vui
+    python -m modelpipeline replay sesi.vui --speed 2 --loop
+    python -m modelpipeline replay sesi.vui --speed max                      # secepat mungkin (load test)
+    python -m modelpipeline replay sesi.vui --only "eye*,mouthPucker" --exclude "_neutral"
+    python -m modelpipeline replay recordings/session_20260224_133426.json   # file lama juga bisa
+
+Jadwal kirim dihitung dari waktu mulai (deadline absolut), bukan sleep
+relatif per frame, jadi error tidak menumpuk (drift-free). Sleep kasar dulu
+lalu spin di perf_counter untuk sisa ~2 ms terakhir.
+
+Nilai yang dikirim = nilai yang direkam apa adanya (recording kontinu
+menyimpan nilai RAW MediaPipe, belum kena squint offset / blink boost).
+"""
+
+import argparse
+import fnmatch
+import socket
+import sys
+import time
+from collections import deque
+
+import numpy as np
+
+from .constants import VMC_IP, VMC_PORT
+from .osccodec import BlendValEncoder, BLEND_APPLY, encode_frame_stamp
+
+# ─────────────────────────────────────────────
+# CONFIG
+# ─────────────────────────────────────────────
+MIN_SPEED   = 0.5
+MAX_SPEED   = 50.0
+SPIN_MARGIN = 0.002   # detik terakhir sebelum deadline di-spin, bukan sleep
+LATENESS_KEEP = 65536 # keterlambatan frame terakhir untuk statistik (--loop tanpa batas tidak menumpuk)
+
+DEFAULT_EXCLUDE = ["*_dist"]   # channel tambahan (jarak pipi) bukan blendshape VMC
+
+
+class DriftFreeScheduler:
+    """
+    Tunggu sampai deadline absolut: start + offset / speed.
+
+    Semua deadline dihitung dari satu titik awal, jadi keterlambatan satu
+    frame tidak menggeser frame berikutnya. Keterlambatan dicatat di `lateness`.
+    """
+
+    def __init__(self, speed=1.0, spin_margin=SPIN_MARGIN, keep=None):
+        self.speed       = speed
+        self.spin_margin = spin_margin
+        self.start       = None
+        # keep = simpan N keterlambatan terakhir saja (scheduler yang jalan berjam-jam)
+        self.lateness    = deque(maxlen=keep) if keep else []
+
+    def reset(self, start=None):
+        self.start = time.perf_counter() if start is None else start
+
+    def wait_until_offset(self, offset):
+        """offset = detik sejak start (waktu sesi). Return keterlambatan (detik)."""
+        if self.start is None:
+            self.reset()
+        deadline = self.start + offset / self.speed
+        while True:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            if remaining > self.spin_margin:
+                time.sleep(remaining - self.spin_margin)
+        late = time.perf_counter() - deadline
+        self.lateness.append(late)
+        return late
+
+
+def load_session_arrays(path):
+    """Return (timestamps[N], values[N, C], channels) dari .vui, .vuiz atau file lama."""
+    if path.endswith((".json", ".csv")):
+        from .convertlegacy import iter_legacy_frames
+        ts, vals, channels = [], [], None
+        for wall_ts, values, _lms, _schema, ch in iter_legacy_frames(path):
+            channels = ch
+            ts.append(wall_ts)
+            vals.append(values)
+        ts = np.asarray(ts, dtype=np.float64)
+        ts -= ts[0] if len(ts) else 0.0
+        return ts, np.asarray(vals, dtype=np.float32), channels
+
+    if path.endswith(".vuiz"):
+        from .sessionarchive import ArchiveReader
+        a = ArchiveReader(path)
+        ts, vals, _lms = a.read_all()
+        a.close()
+        return ts.astype(np.float64), vals, a.channels
+
+    from .sessionformat import SessionReader
+    s = SessionReader(path)
+    return np.asarray(s.timestamps, dtype=np.float64), s.values, s.channels
+
+
+def select_channels(channels, only=None, exclude=None):
+    """Index channel yang lolos filter glob (--only / --exclude)."""
+    selected = []
+    for i, name in enumerate(channels):
+        if only and not any(fnmatch.fnmatchcase(name, p) for p in only):
+            continue
+        if exclude and any(fnmatch.fnmatchcase(name, p) for p in exclude):
+            continue
+        selected.append(i)
+    return selected
+
+
+def replay(path, host=VMC_IP, port=VMC_PORT, speed=1.0, loops=1, only=None, exclude=None,
+           send_apply=True, send_stamp=True, verbose=True):
+    """
+    Kirim sesi sebagai VMC. speed=None → secepat mungkin. loops=0 → ulang terus.
+    send_stamp → /VUI/Frame [seq, waktu] per frame (statistik loss/latency di listener).
+    Return dict statistik.
+    """
+    ts, values, channels = load_session_arrays(path)
+    cols = select_channels(channels, only, exclude)
+    names = [channels[i] for i in cols]
+    n = len(ts)
+    if n == 0 or not cols:
+        raise ValueError(f"{path}: tidak ada frame / channel untuk dikirim")
+
+    enc  = BlendValEncoder()
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    addr = (host, port)
+    sched = DriftFreeScheduler(speed, keep=LATENESS_KEEP) if speed else None
+
+    # Durasi satu putaran + 1 periode frame, supaya loop berikutnya tidak dobel frame
+    period   = float(np.median(np.diff(ts))) if n > 1 else 0.0
+    loop_len = float(ts[-1]) + period
+
+    frames_sent = msgs_sent = 0
+    loop_i = 0
+    t_start = time.perf_counter()
+    if sched:
+        sched.reset(t_start)
+    try:
+        while loops == 0 or loop_i < loops:
+            base = loop_i * loop_len
+            for row in range(n):
+                if sched:
+                    sched.wait_until_offset(base + float(ts[row]))
+                vals = values[row]
+                for name, col in zip(names, cols):
+                    sock.sendto(enc.encode(name, float(vals[col])), addr)
+                if send_stamp:
+                    sock.sendto(encode_frame_stamp(frames_sent), addr)
+                if send_apply:
+                    sock.sendto(BLEND_APPLY, addr)
+                msgs_sent   += len(cols) + (1 if send_apply else 0) + (1 if send_stamp else 0)
+                frames_sent += 1
+            loop_i += 1
+            if verbose and (loops == 0 or loops > 1):
+                print(f"  🔁 loop {loop_i} selesai ({frames_sent} frames)")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        sock.close()
+
+    elapsed = time.perf_counter() - t_start
+    stats = {
+        "frames":   frames_sent,
+        "messages": msgs_sent,
+        "elapsed":  elapsed,
+        "fps":      frames_sent / elapsed if elapsed > 0 else 0.0,
+        "msg_rate": msgs_sent / elapsed if elapsed > 0 else 0.0,
+    }
+    if sched and sched.lateness:
+        late = np.asarray(sched.lateness) * 1000.0
+        stats.update(late_p50_ms=float(np.percentile(late, 50)),
+                     late_p99_ms=float(np.percentile(late, 99)),
+                     late_max_ms=float(late.max()))
+    return stats
+
+
+def _parse_speed(s):
+    if s.lower() in ("max", "0", "inf"):
+        return None
+    v = float(s)
+    if not MIN_SPEED <= v <= MAX_SPEED:
+        raise argparse.ArgumentTypeError(f"speed harus {MIN_SPEED}–{MAX_SPEED} atau 'max'")
+    return v
+
+
+def _parse_patterns(s):
+    return [p.strip() for p in s.split(",") if p.strip()]
+
+
+# ─────────────────────────────────────────────
+# MAIN
+# ─────────────────────────────────────────────
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Replay sesi rekaman sebagai VMC/OSC")
+    ap.add_argument("session", help="folder .vui atau session_*.json / *_blendshapes.csv lama")
+    ap.add_argument("--host", default=VMC_IP)
+    ap.add_argument("--port", type=int, default=VMC_PORT)
+    ap.add_argument("--speed", type=_parse_speed, default=1.0, help="0.5–50, atau 'max'")
+    ap.add_argument("--loop", nargs="?", type=int, const=0, default=1,
+                    help="ulang N kali (tanpa angka = terus sampai Ctrl+C)")
+    ap.add_argument("--only", type=_parse_patterns, help="glob channel yang dikirim, pisah koma")
+    ap.add_argument("--exclude", type=_parse_patterns, default=DEFAULT_EXCLUDE,
+                    help="glob channel yang TIDAK dikirim (default: *_dist)")
+    ap.add_argument("--no-apply", action="store_true", help="jangan kirim /VMC/Ext/Blend/Apply")
+    ap.add_argument("--no-stamp", action="store_true", help="jangan kirim /VUI/Frame [seq, waktu]")
+    args = ap.parse_args(argv)
+
+    speed_txt = "max" if args.speed is None else f"{args.speed}x"
+    loop_txt  = "∞" if args.loop == 0 else str(args.loop)
+    print(f"▶ Replay {args.session} → {args.host}:{args.port}  (speed {speed_txt}, loop {loop_txt})")
+    print("  Ctrl+C untuk stop\n")
+
+    st = replay(args.session, args.host, args.port, args.speed, args.loop,
+                args.only, args.exclude, send_apply=not args.no_apply,
+                send_stamp=not args.no_stamp)
+
+    print(f"\n✅ {st['frames']} frames / {st['messages']} pesan dalam {st['elapsed']:.2f} s "
+          f"({st['fps']:.1f} fps, {st['msg_rate']:.0f} msg/s)")
+    if "late_p50_ms" in st:
+        print(f"   keterlambatan jadwal: p50 {st['late_p50_ms']:.3f} ms, "
+              f"p99 {st['late_p99_ms']:.3f} ms, max {st['late_max_ms']:.3f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
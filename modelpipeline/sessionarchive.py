@@ -0,0 +1,495 @@
+"""
+Session Archive (.vuiz)
+───────────────────────
+Format arsip kompak untuk menyimpan SEMUA sesi stream jangka panjang.
+
+    python -m modelpipeline archive pack recordings/stream_xxx.vui   # → stream_xxx.vuiz
+    python -m modelpipeline archive pack sesi.vui --bs-bits 10 --codec lzma
+    python -m modelpipeline archive unpack stream_xxx.vuiz           # → .vui lagi
+    python -m modelpipeline archive bench recordings                 # rasio & kecepatan decode
+
+Encoding per chunk (default 512 frame):
+  - blendshape dikuantisasi 8–12 bit (range 0..1, error maks = ½ step)
+  - landmark dikuantisasi 16 bit di range LM_RANGE (error maks ≈ 2e-5)
+  - timestamp: bit float32 di-delta (uint32) → lossless, sama persis dengan .vui
+  - tiap kolom di-delta sepanjang waktu (uint16, wrap-around), disusun per
+    kolom lalu dikompres zlib / lzma (standard library)
+
+Setiap chunk berdiri sendiri (nilai awal chunk disimpan penuh), dan di akhir
+file ada index chunk → read_range / frame_at cuma decode chunk yang kena,
+sama seperti SessionReader.
+
+Layout file:
+    b"VUIZ" | u32 len | header JSON | chunk... | index | u64 offset index | b"VZIX"
+"""
+
+import argparse
+import glob
+import json
+import lzma
+import os
+import shutil
+import struct
+import sys
+import tempfile
+import time
+import zlib
+from collections import OrderedDict
+
+import numpy as np
+
+from .constants import RECORDINGS_DIR
+from .sessionformat import (SessionReader, SessionWriter, Frame, FrameRange,
+                           make_header, DTYPE)
+
+# ─────────────────────────────────────────────
+# CONFIG
+# ─────────────────────────────────────────────
+MAGIC        = b"VUIZ"
+INDEX_MAGIC  = b"VZIX"
+VERSION      = 1
+CHUNK_FRAMES = 512
+BS_BITS      = 10               # 8–12 bit per blendshape → error maks 0.5/1023 ≈ 0.0005
+LM_BITS      = 16
+LM_RANGE     = (-1.0, 2.0)      # koordinat normalized (bisa sedikit keluar 0..1)
+CODEC        = "zlib"           # "zlib" atau "lzma"
+ZLIB_LEVEL   = 6
+LZMA_PRESET  = 6
+CACHE_CHUNKS = 8                # chunk hasil decode yang di-cache reader
+
+_CHUNK_HEAD = struct.Struct("<Id")        # n frame, t pertama (detik)
+_INDEX_ITEM = np.dtype([("offset", "<u8"), ("size", "<u4"), ("t", "<f8"), ("row", "<i8")])
+
+
+def bits_for_error(max_err, lo=8, hi=12):
+    """Bit minimum supaya error kuantisasi range 0..1 <= max_err."""
+    bits = int(np.ceil(np.log2(1.0 / (2.0 * max_err) + 1.0)))
+    if bits > hi:
+        raise ValueError(f"error {max_err} butuh {bits} bit (maks {hi})")
+    return max(bits, lo)
+
+
+def _compress(data, codec):
+    if codec == "lzma":
+        return lzma.compress(data, preset=LZMA_PRESET)
+    return zlib.compress(data, ZLIB_LEVEL)
+
+
+def _decompress(data, codec):
+    if codec == "lzma":
+        return lzma.decompress(data)
+    return zlib.decompress(data)
+
+
+# ─────────────────────────────────────────────
+# ENCODE / DECODE CHUNK
+# ─────────────────────────────────────────────
+class _Quant:
+    def __init__(self, header):
+        q = header["quant"]
+        self.bs_max = (1 << q["bs_bits"]) - 1
+        self.lm_max = (1 << q["lm_bits"]) - 1
+        self.lm_lo, self.lm_hi = q["lm_range"]
+        self.lm_scale = self.lm_max / (self.lm_hi - self.lm_lo)
+        self.codec = header["codec"]
+
+
+def _delta(q):
+    """Delta sepanjang waktu per kolom (axis 1), uint16 wrap-around."""
+    d = q.copy()
+    d[:, 1:] = np.diff(q, axis=1)          # uint16 → otomatis modulo 2^16
+    return d
+
+
+def _undelta(d):
+    return np.cumsum(d, axis=1, dtype=np.uint16)
+
+
+def encode_chunk(ts, vals, lms, qz):
+    """ts[n], vals[n, C], lms[n, L, 3] (NaN = tanpa wajah) → bytes terkompres."""
+    n = len(ts)
+    ts32 = np.asarray(ts, dtype=DTYPE)
+    ts_bits = ts32.view("<u4")
+    dts = ts_bits.copy()
+    dts[1:] = np.diff(ts_bits)               # timestamp monotonic → bit float32 juga naik
+
+    vals = np.asarray(vals, dtype=np.float32)
+    qb = np.round(np.clip(vals, 0.0, 1.0) * qz.bs_max).astype(np.uint16).T      # [C, n]
+
+    lms = np.asarray(lms, dtype=np.float32).reshape(n, -1)
+    face = ~np.isnan(lms).any(axis=1) if lms.shape[1] else np.zeros(n, dtype=bool)
+    if lms.shape[1]:
+        # baris tanpa wajah diisi baris sebelumnya → delta 0, murah dikompres
+        idx = np.where(face, np.arange(n), -1)
+        idx = np.maximum.accumulate(idx)
+        filled = np.where(idx[:, None] >= 0, lms[np.maximum(idx, 0)], 0.0)
+        filled = np.clip(filled, qz.lm_lo, qz.lm_hi)
+        ql = np.round((filled - qz.lm_lo) * qz.lm_scale).astype(np.uint16).T   # [L*3, n]
+    else:
+        ql = np.zeros((0, n), dtype=np.uint16)
+
+    raw = b"".join([
+        _CHUNK_HEAD.pack(n, float(ts32[0])),
+        dts.tobytes(),
+        np.packbits(face).tobytes(),
+        _delta(qb).astype("<u2").tobytes(),
+        _delta(ql).astype("<u2").tobytes(),
+    ])
+    return _compress(raw, qz.codec)
+
+
+def decode_chunk(blob, n_channels, n_landmarks, qz):
+    """Kebalikan encode_chunk → (ts float32[n], vals float32[n, C], lms float32[n, L, 3])."""
+    raw = _decompress(blob, qz.codec)
+    n, _t0 = _CHUNK_HEAD.unpack_from(raw, 0)
+    pos = _CHUNK_HEAD.size
+
+    dts = np.frombuffer(raw, dtype="<u4", count=n, offset=pos)
+    pos += dts.nbytes
+    ts = np.cumsum(dts, dtype=np.uint32).view(DTYPE)
+
+    n_mask = (n + 7) // 8
+    face = np.unpackbits(np.frombuffer(raw, dtype=np.uint8, count=n_mask, offset=pos), count=n).astype(bool)
+    pos += n_mask
+
+    qb = np.frombuffer(raw, dtype="<u2", count=n_channels * n, offset=pos).reshape(n_channels, n)
+    pos += qb.nbytes
+    vals = (_undelta(qb).T.astype(np.float32) / qz.bs_max)
+
+    L3 = n_landmarks * 3
+    ql = np.frombuffer(raw, dtype="<u2", count=L3 * n, offset=pos).reshape(L3, n)
+    lms = _undelta(ql).T.astype(np.float32) / np.float32(qz.lm_scale) + np.float32(qz.lm_lo)
+    lms[~face] = np.nan
+    return ts, vals, lms.reshape(n, n_landmarks, 3)
+
+
+# ─────────────────────────────────────────────
+# WRITER
+# ─────────────────────────────────────────────
+class ArchiveWriter:
+    """Tulis .vuiz per chunk. Pakai write_arrays seperti SessionWriter."""
+
+    def __init__(self, path, header, bs_bits=BS_BITS, lm_bits=LM_BITS, lm_range=LM_RANGE,
+                 codec=CODEC, chunk_frames=CHUNK_FRAMES):
+        if not 8 <= bs_bits <= 12:
+            raise ValueError("bs_bits harus 8–12")
+        if not 8 <= lm_bits <= 16:
+            raise ValueError("lm_bits harus 8–16")
+        if codec not in ("zlib", "lzma"):
+            raise ValueError("codec harus zlib atau lzma")
+        self.path = path
+        self.header = dict(header)
+        self.header.update(
+            archive_version=VERSION,
+            codec=codec,
+            chunk_frames=chunk_frames,
+            quant={"bs_bits": bs_bits, "lm_bits": lm_bits, "lm_range": list(lm_range)},
+        )
+        self.chunk_frames = chunk_frames
+        self.n_channels   = len(self.header["channels"])
+        self.n_landmarks  = len(self.header["landmark_indices"])
+        self._qz    = _Quant(self.header)
+        self._index = []
+        self._pend  = []          # array yang belum genap 1 chunk
+        self._pend_n = 0
+        self.frames = 0
+
+        self._f = open(path, "wb")
+        self._f.write(MAGIC)
+        # header ditulis ulang di close() (jumlah frame), jadi cadangkan tempat
+        self._header_pos = self._f.tell()
+        self._write_header(reserve=True)
+
+    def _write_header(self, reserve=False):
+        blob = json.dumps(self.header).encode("utf-8")
+        if reserve:
+            self._header_room = len(blob) + 256
+        if len(blob) > self._header_room:
+            raise ValueError("header terlalu besar untuk ruang yang dicadangkan")
+        blob = blob.ljust(self._header_room, b" ")
+        self._f.write(struct.pack("<I", len(blob)) + blob)
+
+    def write_arrays(self, ts, vals, lms):
+        n = len(ts)
+        if n == 0:
+            return
+        self._pend.append((np.asarray(ts), np.asarray(vals), np.asarray(lms).reshape(n, self.n_landmarks, 3)))
+        self._pend_n += n
+        while self._pend_n >= self.chunk_frames:
+            self._emit(self.chunk_frames)
+
+    def _emit(self, n):
+        ts   = np.concatenate([p[0] for p in self._pend])
+        vals = np.concatenate([p[1] for p in self._pend])
+        lms  = np.concatenate([p[2] for p in self._pend])
+        blob = encode_chunk(ts[:n], vals[:n], lms[:n], self._qz)
+        self._index.append((self._f.tell(), len(blob), float(ts[0]), self.frames))
+        self._f.write(blob)
+        self.frames += n
+        self._pend = [(ts[n:], vals[n:], lms[n:])] if len(ts) > n else []
+        self._pend_n = len(ts) - n
+
+    def close(self):
+        if self._pend_n:
+            self._emit(self._pend_n)
+        index = np.array(self._index, dtype=_INDEX_ITEM)
+        index_pos = self._f.tell()
+        self._f.write(index.tobytes())
+        self._f.write(struct.pack("<Q", index_pos) + INDEX_MAGIC)
+        self.header["frames"] = self.frames
+        self._f.seek(self._header_pos)
+        self._write_header()
+        self._f.close()
+
+
+# ─────────────────────────────────────────────
+# READER
+# ─────────────────────────────────────────────
+class ArchiveReader:
+    """Baca .vuiz: API sama dengan SessionReader untuk read_range / frame_at."""
+
+    def __init__(self, path, cache_chunks=CACHE_CHUNKS):
+        self.path = path
+        self._f = open(path, "rb")
+        if self._f.read(4) != MAGIC:
+            raise ValueError(f"{path}: bukan arsip .vuiz")
+        (hlen,) = struct.unpack("<I", self._f.read(4))
+        self.header = json.loads(self._f.read(hlen))
+        self.channels         = self.header["channels"]
+        self.landmark_indices = self.header["landmark_indices"]
+        self.sample_rate      = self.header.get("sample_rate")
+        self._qz = _Quant(self.header)
+
+        self._f.seek(-12, os.SEEK_END)
+        index_pos, magic = struct.unpack("<Q4s", self._f.read(12))
+        if magic != INDEX_MAGIC:
+            raise ValueError(f"{path}: index tidak ada (arsip tidak ditutup dengan benar?)")
+        end = self._f.seek(0, os.SEEK_END) - 12
+        self._f.seek(index_pos)
+        self.index  = np.frombuffer(self._f.read(end - index_pos), dtype=_INDEX_ITEM)
+        self.frames = int(self.header.get("frames", 0))
+        self._cache = OrderedDict()
+        self._cache_size = cache_chunks
+        self.chunks_decoded = 0
+
+    def __len__(self):
+        return self.frames
+
+    def close(self):
+        self._f.close()
+
+    def chunk(self, i):
+        """Decode chunk ke-i (di-cache LRU)."""
+        hit = self._cache.get(i)
+        if hit is not None:
+            self._cache.move_to_end(i)
+            return hit
+        item = self.index[i]
+        self._f.seek(int(item["offset"]))
+        blob = self._f.read(int(item["size"]))
+        data = decode_chunk(blob, len(self.channels), len(self.landmark_indices), self._qz)
+        self.chunks_decoded += 1
+        self._cache[i] = data
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+        return data
+
+    def read_all(self):
+        parts = [self.chunk(i) for i in range(len(self.index))]
+        if not parts:
+            C, L = len(self.channels), len(self.landmark_indices)
+            return FrameRange(np.empty(0, DTYPE), np.empty((0, C), DTYPE), np.empty((0, L, 3), DTYPE))
+        return FrameRange(*(np.concatenate([p[k] for p in parts]) for k in range(3)))
+
+    def read_range(self, t0, t1):
+        C, L = len(self.channels), len(self.landmark_indices)
+        out = [[], [], []]
+        if self.frames and t1 >= t0:
+            ix_t = self.index["t"]
+            c0 = max(int(np.searchsorted(ix_t, t0, side="right")) - 1, 0)
+            c1 = int(np.searchsorted(ix_t, t1, side="right"))
+            for i in range(c0, c1):
+                ts, vals, lms = self.chunk(i)
+                ts64 = ts.astype(np.float64)
+                lo = int(np.searchsorted(ts64, t0, side="left"))
+                hi = int(np.searchsorted(ts64, t1, side="right"))
+                for k, arr in enumerate((ts, vals, lms)):
+                    out[k].append(arr[lo:hi])
+        if not out[0]:
+            return FrameRange(np.empty(0, DTYPE), np.empty((0, C), DTYPE), np.empty((0, L, 3), DTYPE))
+        return FrameRange(*(np.concatenate(o) for o in out))
+
+    def frame_at(self, t):
+        if self.frames == 0:
+            return None
+        c = max(int(np.searchsorted(self.index["t"], t, side="right")) - 1, 0)
+        ts, vals, lms = self.chunk(c)
+        row = max(int(np.searchsorted(ts.astype(np.float64), t, side="right")) - 1, 0)
+        return Frame(float(ts[row]), vals[row].copy(), lms[row].copy())
+
+
+def open_session(path):
+    """SessionReader untuk .vui, ArchiveReader untuk .vuiz."""
+    if os.path.isfile(path):
+        with open(path, "rb") as f:
+            if f.read(4) == MAGIC:
+                return ArchiveReader(path)
+    return SessionReader(path)
+
+
+# ─────────────────────────────────────────────
+# PACK / UNPACK
+# ─────────────────────────────────────────────
+def pack(src, dst, **opts):
+    """.vui → .vuiz (streaming per INDEX chunk, tidak load seluruh sesi)."""
+    s = SessionReader(src)
+    header = make_header(s.channels, s.landmark_indices, s.sample_rate, s.header.get("start_time"),
+                         **{k: v for k, v in s.header.items()
+                            if k not in ("format", "version", "dtype", "frames", "channels",
+                                         "landmark_indices", "sample_rate", "start_time")})
+    w = ArchiveWriter(dst, header, **opts)
+    step = w.chunk_frames * 8
+    for lo in range(0, len(s), step):
+        hi = min(lo + step, len(s))
+        w.write_arrays(s.timestamps[lo:hi], s.values[lo:hi], s.landmarks[lo:hi])
+    w.close()
+    return w.frames
+
+
+def unpack(src, dst):
+    """.vuiz → .vui (chunk demi chunk)."""
+    a = ArchiveReader(src)
+    header = {k: v for k, v in a.header.items()
+              if k not in ("archive_version", "codec", "chunk_frames", "quant")}
+    header["frames"] = 0
+    w = SessionWriter(dst, header)
+    for i in range(len(a.index)):
+        ts, vals, lms = a.chunk(i)
+        w.write_arrays(ts, vals, lms.reshape(len(ts), -1))
+    w.close()
+    a.close()
+    return w.frames
+
+
+def _dir_size(path):
+    if os.path.isfile(path):
+        return os.path.getsize(path)
+    return sum(os.path.getsize(os.path.join(path, f)) for f in os.listdir(path))
+
+
+def bench(paths, tmp_dir, **opts):
+    """Rasio kompresi + throughput decode untuk tiap sesi."""
+    from .convertlegacy import collect_jobs, convert_file
+
+    os.makedirs(tmp_dir, exist_ok=True)
+    sessions = []
+    for p in paths:
+        if os.path.isdir(p) and not os.path.isfile(os.path.join(p, "header.json")):
+            sessions += [(s, s) for s in sorted(glob.glob(os.path.join(p, "*.vui")))]
+            # recording lama dikonversi dulu ke .vui sementara
+            for src, dst, _ in collect_jobs([p], out_dir=tmp_dir, force=True):
+                convert_file(src, dst)
+                sessions.append((src, dst))
+        else:
+            sessions.append((p, p))
+
+    rows = []
+    for orig, vui in sessions:
+        out = os.path.join(tmp_dir, os.path.basename(vui.rstrip("/\\")) + "z")
+        t0 = time.perf_counter()
+        frames = pack(vui, out, **opts)
+        t_enc = time.perf_counter() - t0
+
+        a = ArchiveReader(out)
+        t0 = time.perf_counter()
+        dec = a.read_all()
+        t_dec = time.perf_counter() - t0
+        a.close()
+
+        s = SessionReader(vui)
+        err_bs = float(np.max(np.abs(dec.values - s.values))) if frames else 0.0
+        lm_ok = ~np.isnan(s.landmarks)
+        err_lm = float(np.max(np.abs(dec.landmarks[lm_ok] - s.landmarks[lm_ok]))) if lm_ok.any() else 0.0
+
+        rows.append({
+            "session":   os.path.basename(orig),
+            "frames":    frames,
+            "orig":      _dir_size(orig),
+            "vui":       _dir_size(vui),
+            "vuiz":      os.path.getsize(out),
+            "enc_fps":   frames / t_enc if t_enc else 0.0,
+            "dec_fps":   frames / t_dec if t_dec else 0.0,
+            "err_bs":    err_bs,
+            "err_lm":    err_lm,
+        })
+    return rows
+
+
+# ─────────────────────────────────────────────
+# MAIN
+# ─────────────────────────────────────────────
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Arsip sesi terkuantisasi + delta + kompresi")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+
+    def add_opts(p):
+        p.add_argument("--bs-bits", type=int, default=BS_BITS, help="bit blendshape 8–12")
+        p.add_argument("--bs-err", type=float, help="error maks blendshape (pilih bit otomatis)")
+        p.add_argument("--lm-bits", type=int, default=LM_BITS, help="bit landmark (maks 16)")
+        p.add_argument("--codec", choices=["zlib", "lzma"], default=CODEC)
+        p.add_argument("--chunk", type=int, default=CHUNK_FRAMES, help="frame per chunk")
+
+    p = sub.add_parser("pack", help=".vui → .vuiz")
+    p.add_argument("src")
+    p.add_argument("dst", nargs="?")
+    add_opts(p)
+    p = sub.add_parser("unpack", help=".vuiz → .vui")
+    p.add_argument("src")
+    p.add_argument("dst", nargs="?")
+    p = sub.add_parser("bench", help="rasio kompresi & throughput decode")
+    p.add_argument("paths", nargs="*", default=[RECORDINGS_DIR])
+    p.add_argument("--tmp", help="folder arsip/konversi sementara (default: temp dir, dihapus setelah bench)")
+    add_opts(p)
+    args = ap.parse_args(argv)
+
+    opts = {}
+    if args.cmd in ("pack", "bench"):
+        bs_bits = bits_for_error(args.bs_err) if args.bs_err else args.bs_bits
+        opts = dict(bs_bits=bs_bits, lm_bits=args.lm_bits, codec=args.codec, chunk_frames=args.chunk)
+        lm_err = (LM_RANGE[1] - LM_RANGE[0]) / ((1 << args.lm_bits) - 1) / 2
+        print(f"⚙  blendshape {bs_bits} bit (err ≤ {0.5 / ((1 << bs_bits) - 1):.5f}), "
+              f"landmark {args.lm_bits} bit (err ≤ {lm_err:.6f}), {args.codec}, chunk {args.chunk}")
+
+    if args.cmd == "pack":
+        dst = args.dst or args.src.rstrip("/\\") + "z"
+        frames = pack(args.src, dst, **opts)
+        print(f"📦 {args.src} → {dst}  {frames} frames, "
+              f"{_dir_size(args.src) / 1024:.1f} KB → {os.path.getsize(dst) / 1024:.1f} KB")
+    elif args.cmd == "unpack":
+        dst = args.dst or (args.src[:-1] if args.src.endswith(".vuiz") else args.src + ".vui")
+        frames = unpack(args.src, dst)
+        print(f"📂 {args.src} → {dst}  {frames} frames")
+    else:
+        tmp = args.tmp or tempfile.mkdtemp(prefix="vui_bench_")
+        try:
+            rows = bench(args.paths, tmp, **opts)
+        finally:
+            if args.tmp is None:
+                shutil.rmtree(tmp, ignore_errors=True)
+        print(f"\n{'session':<36} {'frames':>7} {'asli':>9} {'.vui':>9} {'.vuiz':>8} "
+              f"{'rasio':>7} {'decode fps':>11} {'err bs':>8} {'err lm':>8}")
+        for r in rows:
+            print(f"{r['session']:<36} {r['frames']:>7} {r['orig'] / 1024:>8.1f}K {r['vui'] / 1024:>8.1f}K "
+                  f"{r['vuiz'] / 1024:>7.1f}K {r['orig'] / max(r['vuiz'], 1):>6.1f}x "
+                  f"{r['dec_fps']:>11.0f} {r['err_bs']:>8.5f} {r['err_lm']:>8.6f}")
+        if rows:
+            tot_f = sum(r["frames"] for r in rows)
+            tot_o = sum(r["orig"] for r in rows)
+            tot_z = sum(r["vuiz"] for r in rows)
+            print(f"\nTotal: {tot_f} frames, {tot_o / 1024:.1f} KB → {tot_z / 1024:.1f} KB "
+                  f"({tot_o / max(tot_z, 1):.1f}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,298 @@
+"""
+Session Format (.vui)
+─────────────────────
+Format sesi kolumnar biner, pengganti JSON indent=2 untuk recording kontinu.
+
+Satu sesi = satu folder:
+
+    recordings/stream_20260224_133426.vui/
+        header.json       ← channel names, landmark indices, sample rate, dsb
+        timestamps.f32    ← float32 [N]          detik sejak frame pertama
+        channels.f32      ← float32 [N, C]       blendshape (+ jarak pipi, dll)
+        landmarks.f32     ← float32 [N, L, 3]    x,y,z per landmark (NaN = tidak ada wajah)
+        index.bin         ← sparse time index: (t pertama chunk, baris awal chunk)
+
+Semua array little-endian, kontigu, ditulis append per chunk. Landmark
+disimpan SEKALI per index (index 152 di CHIN & FOREHEAD, 0/14/17 di NOSE &
+MOUTH tidak diduplikasi) — mapping region → index ada di header.
+
+Baca pakai numpy.memmap, jadi file multi-GB langsung bisa dibuka tanpa parsing:
+
+    s = SessionReader("recordings/stream_xxx.vui")
+    s.channel("mouthPucker")     # view [N], tidak load seluruh file
+    s.landmark(152)              # view [N, 3]
+    s.read_range(10.0, 12.5)     # frame antara detik 10–12.5
+    s.frame_at(42.0)             # frame terakhir pada/sebelum detik 42
+
+read_range / frame_at binary search di index (1 entry per chunk) lalu di
+timestamp chunk yang kena saja — halaman file lain tidak pernah disentuh,
+jadi scrubbing sesi berjam-jam tetap instan.
+
+Catatan: timestamp float32 relatif ke awal sesi → resolusi ~1 ms sampai
+±2 jam, ~4 ms di sesi 10 jam. Cukup untuk 24–60 fps.
+"""
+
+import json
+import os
+import sys
+from collections import namedtuple
+
+import numpy as np
+
+# ─────────────────────────────────────────────
+# CONFIG
+# ─────────────────────────────────────────────
+FORMAT_NAME    = "vuituber-session"
+FORMAT_VERSION = 1
+DTYPE          = np.dtype("<f4")
+
+HEADER_FILE     = "header.json"
+TIMESTAMPS_FILE = "timestamps.f32"
+CHANNELS_FILE   = "channels.f32"
+LANDMARKS_FILE  = "landmarks.f32"
+INDEX_FILE      = "index.bin"
+
+INDEX_STRIDE = 256    # maksimum baris per entry index (chunk recorder biasanya lebih kecil)
+INDEX_DTYPE  = np.dtype([("t", "<f8"), ("row", "<i8")])
+
+Frame      = namedtuple("Frame", ["t", "values", "landmarks"])
+FrameRange = namedtuple("FrameRange", ["timestamps", "values", "landmarks"])
+
+
+def make_header(channels, landmark_indices, sample_rate=None, start_time=None, **extra):
+    """Header minimal untuk sesi baru."""
+    header = {
+        "format":           FORMAT_NAME,
+        "version":          FORMAT_VERSION,
+        "dtype":            DTYPE.str,
+        "start_time":       start_time,
+        "sample_rate":      sample_rate,
+        "channels":         list(channels),
+        "landmark_indices": list(landmark_indices),
+        "frames":           0,
+    }
+    header.update(extra)
+    return header
+
+
+def _write_header(path, header):
+    tmp = os.path.join(path, HEADER_FILE + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(header, f, indent=2)
+    os.replace(tmp, os.path.join(path, HEADER_FILE))
+
+
+# ─────────────────────────────────────────────
+# WRITER
+# ─────────────────────────────────────────────
+class SessionWriter:
+    """
+    Sink untuk StreamRecorder: append chunk frame ke file kolom masing-masing.
+
+    frames = list of (t, values, landmarks_flat_or_None)
+    """
+
+    def __init__(self, path, header):
+        self.path   = path
+        self.header = dict(header)
+        self.n_channels  = len(self.header["channels"])
+        self.n_landmarks = len(self.header["landmark_indices"])
+        self.frames = 0
+
+        os.makedirs(path, exist_ok=True)
+        _write_header(path, self.header)
+        self._f_ts = open(os.path.join(path, TIMESTAMPS_FILE), "wb")
+        self._f_ch = open(os.path.join(path, CHANNELS_FILE), "wb")
+        self._f_lm = open(os.path.join(path, LANDMARKS_FILE), "wb")
+        self._f_ix = open(os.path.join(path, INDEX_FILE), "wb")
+
+    def write_chunk(self, frames):
+        n = len(frames)
+        ts   = np.fromiter((f[0] for f in frames), dtype=DTYPE, count=n)
+        vals = np.asarray([f[1] for f in frames], dtype=DTYPE).reshape(n, self.n_channels)
+        lms  = np.full((n, self.n_landmarks * 3), np.nan, dtype=DTYPE)
+        for i, f in enumerate(frames):
+            if f[2] is not None:
+                lms[i] = f[2]
+        self.write_arrays(ts, vals, lms)
+
+    def write_arrays(self, ts, vals, lms):
+        """Append array yang sudah jadi (dipakai converter / tool lain)."""
+        n = len(ts)
+        if n == 0:
+            return
+        # Satu entry index per chunk, chunk besar dipecah per INDEX_STRIDE baris
+        starts = np.arange(0, n, INDEX_STRIDE)
+        entries = np.empty(len(starts), dtype=INDEX_DTYPE)
+        entries["t"]   = np.asarray(ts, dtype=DTYPE)[starts]
+        entries["row"] = self.frames + starts
+
+        # Urutan tulis: landmarks → channels → timestamps → index. Kalau crash di
+        # tengah, reader pakai jumlah baris terkecil & buang entry index yang
+        # menunjuk ke baris yang belum lengkap.
+        self._f_lm.write(np.ascontiguousarray(lms, dtype=DTYPE).tobytes())
+        self._f_ch.write(np.ascontiguousarray(vals, dtype=DTYPE).tobytes())
+        self._f_ts.write(np.ascontiguousarray(ts, dtype=DTYPE).tobytes())
+        self._f_ix.write(entries.tobytes())
+        for f in (self._f_lm, self._f_ch, self._f_ts, self._f_ix):
+            f.flush()
+        self.frames += n
+
+    def close(self):
+        for f in (self._f_ts, self._f_ch, self._f_lm, self._f_ix):
+            f.close()
+        self.header["frames"] = self.frames
+        _write_header(self.path, self.header)
+
+
+# ─────────────────────────────────────────────
+# READER
+# ─────────────────────────────────────────────
+def _memmap(path, shape):
+    if 0 in shape:
+        return np.empty(shape, dtype=DTYPE)
+    return np.memmap(path, dtype=DTYPE, mode="r", shape=shape)
+
+
+class SessionReader:
+    """Buka sesi .vui lewat memmap (read-only, lazy)."""
+
+    def __init__(self, path):
+        self.path = path
+        with open(os.path.join(path, HEADER_FILE), encoding="utf-8") as f:
+            self.header = json.load(f)
+        if self.header.get("format") != FORMAT_NAME:
+            raise ValueError(f"{path}: bukan sesi {FORMAT_NAME}")
+
+        self.channels         = self.header["channels"]
+        self.landmark_indices = self.header["landmark_indices"]
+        self.sample_rate      = self.header.get("sample_rate")
+        self._channel_pos  = {name: i for i, name in enumerate(self.channels)}
+        self._landmark_pos = {idx: i for i, idx in enumerate(self.landmark_indices)}
+
+        C, L = len(self.channels), len(self.landmark_indices)
+        item = DTYPE.itemsize
+        # Jumlah frame = baris lengkap terkecil di ketiga file (aman kalau recording crash)
+        n = min(
+            os.path.getsize(os.path.join(path, TIMESTAMPS_FILE)) // item,
+            os.path.getsize(os.path.join(path, CHANNELS_FILE)) // (item * C) if C else sys.maxsize,
+            os.path.getsize(os.path.join(path, LANDMARKS_FILE)) // (item * L * 3) if L else sys.maxsize,
+        )
+        self.frames = n
+
+        self.timestamps = _memmap(os.path.join(path, TIMESTAMPS_FILE), (n,))
+        self.values     = _memmap(os.path.join(path, CHANNELS_FILE), (n, C))
+        self.landmarks  = _memmap(os.path.join(path, LANDMARKS_FILE), (n, L, 3))
+        self.index      = self._load_index()
+
+    def __len__(self):
+        return self.frames
+
+    def channel(self, name):
+        """Satu kolom channel [N] (view memmap)."""
+        return self.values[:, self._channel_pos[name]]
+
+    def landmark(self, idx):
+        """Koordinat satu landmark [N, 3] (view memmap)."""
+        return self.landmarks[:, self._landmark_pos[idx], :]
+
+    def region(self, indices):
+        """Koordinat beberapa landmark sekaligus [N, len(indices), 3]."""
+        return self.landmarks[:, [self._landmark_pos[i] for i in indices], :]
+
+    def duration(self):
+        return float(self.timestamps[-1]) if self.frames else 0.0
+
+    # ── Seeking ────────────────────────────────
+    def _load_index(self):
+        ix_path = os.path.join(self.path, INDEX_FILE)
+        if os.path.isfile(ix_path):
+            index = np.fromfile(ix_path, dtype=INDEX_DTYPE)
+            return index[index["row"] < self.frames]
+        # Sesi tanpa index → bangun dari timestamp tiap INDEX_STRIDE baris
+        rows = np.arange(0, self.frames, INDEX_STRIDE)
+        index = np.empty(len(rows), dtype=INDEX_DTYPE)
+        index["t"]   = self.timestamps[rows]
+        index["row"] = rows
+        return index
+
+    def _rows_between(self, t0, t1):
+        """Baris [lo, hi) dengan t0 <= timestamp <= t1, cuma baca chunk yang kena."""
+        if self.frames == 0 or t1 < t0:
+            return 0, 0
+        ix_t, ix_row = self.index["t"], self.index["row"]
+        c0 = max(int(np.searchsorted(ix_t, t0, side="right")) - 1, 0)
+        c1 = int(np.searchsorted(ix_t, t1, side="right"))
+        start = int(ix_row[c0])
+        end   = int(ix_row[c1]) if c1 < len(ix_row) else self.frames
+
+        # bandingkan di float64 (key float64 vs array float32 bisa beda pembulatan)
+        ts = self.timestamps[start:end].astype(np.float64)
+        lo = start + int(np.searchsorted(ts, t0, side="left"))
+        hi = start + int(np.searchsorted(ts, t1, side="right"))
+        return lo, hi
+
+    def read_range(self, t0, t1):
+        """Semua frame dengan t0 <= t <= t1 (detik sejak awal sesi)."""
+        lo, hi = self._rows_between(t0, t1)
+        return FrameRange(
+            np.array(self.timestamps[lo:hi]),
+            np.array(self.values[lo:hi]),
+            np.array(self.landmarks[lo:hi]),
+        )
+
+    def frame_at(self, t):
+        """Frame terakhir pada/sebelum t (sample & hold). None kalau sesi kosong."""
+        if self.frames == 0:
+            return None
+        ix_t, ix_row = self.index["t"], self.index["row"]
+        c = max(int(np.searchsorted(ix_t, t, side="right")) - 1, 0)
+        start = int(ix_row[c])
+        end   = int(ix_row[c + 1]) if c + 1 < len(ix_row) else self.frames
+        ts  = self.timestamps[start:end].astype(np.float64)
+        row = start + int(np.searchsorted(ts, t, side="right")) - 1
+        row = min(max(row, 0), self.frames - 1)
+        return Frame(float(self.timestamps[row]),
+                     np.array(self.values[row]),
+                     np.array(self.landmarks[row]))
+
+
+def is_session(path):
+    return os.path.isfile(os.path.join(path, HEADER_FILE))
+
+
+# ─────────────────────────────────────────────
+# MAIN — info sesi
+#
+#   python -m modelpipeline session recordings/stream_xxx.vui
+#   python -m modelpipeline session recordings/stream_xxx.vui --at 42.0
+# ─────────────────────────────────────────────
+def main(argv=None):
+    args = list(sys.argv[1:] if argv is None else argv)
+    at = None
+    if "--at" in args:
+        i = args.index("--at")
+        at = float(args[i + 1])
+        del args[i:i + 2]
+
+    for p in args:
+        s = SessionReader(p)
+        dur = s.duration()
+        print(f"{p}")
+        print(f"  start     : {s.header.get('start_time')}")
+        print(f"  frames    : {len(s)}  ({dur:.1f} s, ~{len(s) / dur if dur else 0:.1f} fps)")
+        print(f"  channels  : {len(s.channels)}")
+        print(f"  landmarks : {len(s.landmark_indices)}")
+        print(f"  index     : {len(s.index)} chunks")
+        if at is not None:
+            fr = s.frame_at(at)
+            if fr is not None:
+                print(f"\n  ▶ frame @ {fr.t:.3f} s")
+                for name, val in sorted(zip(s.channels, fr.values), key=lambda x: -x[1]):
+                    if val > 0.05:
+                        print(f"    {name:<35} {val:.3f}  {'█' * int(val * 20)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
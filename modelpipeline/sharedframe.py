@@ -0,0 +1,312 @@
+"""
+Shared Frame
+────────────
+Frame tracking terbaru di satu blok multiprocessing.shared_memory, supaya
+tool lokal lain (listener, recorder, preview, analytics) bisa baca kapan
+saja tanpa parse ulang OSC lewat UDP loopback dan tanpa membebani tracker:
+
+    python -m modelpipeline track --shm                    # tracker publish tiap frame
+    python -m modelpipeline shm                            # reader: rate, latency, blendshape aktif
+
+    reader = SharedFrameReader()                           # attach ke "vui_tracker"
+    frame = reader.read()                                  # snapshot konsisten (copy ~7 KB)
+    frame = reader.read(since=frame.seq)                   # None kalau belum ada frame baru
+
+Isi blok: header (magic, versi, ukuran) + satu record + tabel nama JSON:
+  seq        : counter seqlock (ganjil = writer sedang menulis)
+  frame      : nomor frame yang dipublish
+  t_capture  : timestamp capture kamera (detik, wall clock)
+  t_publish  : waktu publish (detik, wall clock) — basi = tidak ada wajah
+  face_id    : ID wajah yang dipublish (dipin saat wajah pertama muncul, sama dengan recording)
+  raw / sent : blendshape RAW MediaPipe / hasil remap (yang dikirim ke VSeeFace),
+               urutan = names (MP_BLENDSHAPE_NAMES)
+  landmarks  : [478, 3] x, y, z normalized
+  extra      : jarak pipi LEFT_CHEEK / RIGHT_CHEEK (0 kalau bukan mode monitor)
+
+Protokol seqlock (satu writer, reader berapa pun, tanpa lock):
+  writer: seq += 1 (ganjil) → tulis record → seq += 1 (genap)
+  reader: s1 = seq; ganjil → ulang; copy record; s2 = seq; s1 != s2 → ulang
+Writer tidak pernah menunggu reader. seq 8 byte aligned → store atomik;
+urutan store seq vs isi record dijamin di x86-64 (TSO), target utama kita.
+view() memberi record tanpa copy — setelah selesai membaca, cek
+stable(seq) untuk tahu datanya tidak tertimpa di tengah jalan.
+"""
+
+import argparse
+import json
+import struct
+import sys
+import time
+from collections import namedtuple
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from .constants import MP_BLENDSHAPE_NAMES
+
+# ─────────────────────────────────────────────
+# CONFIG
+# ─────────────────────────────────────────────
+SHM_NAME       = "vui_tracker"
+SHM_VERSION    = 1
+MAGIC          = b"VUISHM\0\0"
+LANDMARK_COUNT = 478
+EXTRA_CHANNELS = ("LEFT_CHEEK", "RIGHT_CHEEK")
+HEADER_SIZE    = 64
+READ_SPIN      = 16        # percobaan langsung sebelum yield CPU (writer di-preempt di tengah tulis)
+READ_TIMEOUT   = 0.5       # detik seq ganjil & tidak berubah → writer mati di tengah tulis
+
+# magic, versi, offset record, ukuran record, jumlah channel, landmark, extra, panjang tabel nama
+_HEADER = struct.Struct("<8sIIIIIII")
+
+_published = set()          # nama blok yang dibuat process ini (reader di process yang sama)
+
+SharedFrame = namedtuple("SharedFrame", "seq frame t_capture t_publish face_id raw sent landmarks extra")
+
+
+def record_dtype(channels, landmarks=LANDMARK_COUNT, extras=len(EXTRA_CHANNELS)):
+    return np.dtype([("seq", "<u8"), ("frame", "<u8"), ("t_capture", "<f8"), ("t_publish", "<f8"),
+                     ("face_id", "<u4"), ("_pad", "<u4"),
+                     ("raw", "<f4", (channels,)), ("sent", "<f4", (channels,)),
+                     ("landmarks", "<f4", (landmarks, 3)), ("extra", "<f4", (extras,))])
+
+
+def _attach(name):
+    """Attach ke blok yang sudah ada tanpa didaftarkan ke resource_tracker (yang akan unlink saat reader exit)."""
+    try:
+        return shared_memory.SharedMemory(name, track=False)      # Python 3.13+
+    except TypeError:
+        from multiprocessing import resource_tracker
+        shm = shared_memory.SharedMemory(name)
+        if name in _published:
+            return shm                  # didaftarkan (dan nanti di-unlink) oleh publisher di process ini
+        try:
+            resource_tracker.unregister(shm._name, "shared_memory")
+        except Exception:
+            pass
+        return shm
+
+
+# ─────────────────────────────────────────────
+# WRITER
+# ─────────────────────────────────────────────
+class SharedFramePublisher:
+    """Satu writer (tracker). Blok sisa tracker yang crash dengan nama sama diganti."""
+
+    def __init__(self, name=SHM_NAME, names=MP_BLENDSHAPE_NAMES, landmarks=LANDMARK_COUNT,
+                 extras=EXTRA_CHANNELS):
+        self.names  = list(names)
+        self.extras = list(extras)
+        self._col   = {n: i for i, n in enumerate(self.names)}
+        dtype = record_dtype(len(self.names), landmarks, len(self.extras))
+        table = json.dumps({"names": self.names, "extras": self.extras}).encode("utf-8")
+        size = HEADER_SIZE + dtype.itemsize + len(table)
+
+        try:
+            self.shm = shared_memory.SharedMemory(name, create=True, size=size)
+        except FileExistsError:
+            old = _attach(name)
+            old.close()
+            old.unlink()
+            self.shm = shared_memory.SharedMemory(name, create=True, size=size)
+        self.name = name
+        _published.add(name)
+
+        buf = self.shm.buf
+        _HEADER.pack_into(buf, 0, MAGIC, SHM_VERSION, HEADER_SIZE, dtype.itemsize, len(self.names),
+                          landmarks, len(self.extras), len(table))
+        buf[HEADER_SIZE + dtype.itemsize:size] = table
+        self.rec  = np.ndarray((), dtype, buffer=buf, offset=HEADER_SIZE)
+        self._seq = np.ndarray((1,), "<u8", buffer=buf, offset=HEADER_SIZE)
+        self._raw, self._sent = self.rec["raw"], self.rec["sent"]
+        self._lm, self._extra = self.rec["landmarks"], self.rec["extra"]
+        self.frames = 0
+        self.publish_s = 0.0
+
+    def _fill(self, out, values):
+        out[:] = 0.0
+        col = self._col
+        for name, v in values.items():
+            i = col.get(name)
+            if i is not None:
+                out[i] = v
+
+    def publish(self, t_capture, raw, sent, landmarks=None, extra=None, face_id=0):
+        """raw / sent: dict {nama: nilai}; landmarks: list NormalizedLandmark; extra: dict jarak pipi."""
+        t0 = time.perf_counter()
+        lm = None
+        if landmarks is not None:
+            n = min(len(landmarks), len(self._lm))
+            lm = np.fromiter((v for l in landmarks[:n] for v in (l.x, l.y, l.z)), np.float32, count=n * 3)
+
+        seq = int(self._seq[0])
+        self._seq[0] = seq + 1                  # ganjil: sedang menulis
+        rec = self.rec
+        rec["frame"] = self.frames
+        rec["t_capture"] = t_capture
+        rec["t_publish"] = time.time()
+        rec["face_id"] = face_id
+        self._fill(self._raw, raw)
+        self._fill(self._sent, sent)
+        if lm is not None:
+            self._lm.reshape(-1)[:len(lm)] = lm
+        self._extra[:] = [extra.get(n, 0.0) for n in self.extras] if extra else 0.0
+        self._seq[0] = seq + 2                  # genap: konsisten
+        self.frames += 1
+        self.publish_s += time.perf_counter() - t0
+
+    def close(self):
+        self.rec = self._seq = self._raw = self._sent = self._lm = self._extra = None
+        self.shm.close()
+        _published.discard(self.name)
+        try:
+            self.shm.unlink()
+        except FileNotFoundError:
+            pass
+
+
+# ─────────────────────────────────────────────
+# READER
+# ─────────────────────────────────────────────
+class SharedFrameReader:
+    """Reader lock-free; tidak pernah menulis ke blok. Tracker restart → buat reader baru."""
+
+    def __init__(self, name=SHM_NAME):
+        self.shm = _attach(name)
+        buf = self.shm.buf
+        magic, version, offset, itemsize, channels, landmarks, extras, table_len = _HEADER.unpack_from(buf, 0)
+        if magic != MAGIC or version != SHM_VERSION:
+            self.shm.close()
+            raise ValueError(f"shared memory '{name}' bukan frame VUI versi {SHM_VERSION}")
+        dtype = record_dtype(channels, landmarks, extras)
+        if dtype.itemsize != itemsize:
+            self.shm.close()
+            raise ValueError(f"shared memory '{name}': ukuran record tidak cocok")
+        table = json.loads(bytes(buf[offset + itemsize:offset + itemsize + table_len]).decode("utf-8"))
+        self.name   = name
+        self.names  = table["names"]
+        self.extras = table["extras"]
+        self.rec  = np.ndarray((), dtype, buffer=buf, offset=offset)
+        self._seq = np.ndarray((1,), "<u8", buffer=buf, offset=offset)
+        self.retries = 0            # baca yang diulang karena bentrok dengan writer
+
+    @property
+    def seq(self):
+        return int(self._seq[0])
+
+    def stable(self, seq):
+        """True kalau record belum berubah sejak seq dibaca (untuk view())."""
+        return self._seq[0] == seq
+
+    def view(self):
+        """(seq, record numpy tanpa copy). seq ganjil = writer sedang menulis."""
+        return int(self._seq[0]), self.rec
+
+    def read(self, since=None):
+        """
+        Snapshot konsisten record terbaru (SharedFrame, array hasil copy).
+        since = seq frame terakhir yang sudah dibaca → None kalau belum ada yang baru.
+        Belum pernah ada publish → None.
+        """
+        stuck, deadline = None, None
+        tries = 0
+        while True:
+            s1 = int(self._seq[0])
+            if s1 & 1:
+                self.retries += 1
+                tries += 1
+                if tries > READ_SPIN:
+                    # writer (thread lain / process yang di-preempt) butuh CPU / GIL untuk selesai
+                    if s1 != stuck:
+                        stuck, deadline = s1, time.perf_counter() + READ_TIMEOUT
+                    elif time.perf_counter() > deadline:
+                        raise TimeoutError(f"shared memory '{self.name}': writer tidak selesai menulis")
+                    time.sleep(0)
+                continue
+            if s1 == 0 or s1 == since:
+                return None
+            snap = self.rec.copy()
+            if int(self._seq[0]) == s1:
+                return SharedFrame(s1, int(snap["frame"]), float(snap["t_capture"]), float(snap["t_publish"]),
+                                   int(snap["face_id"]), snap["raw"], snap["sent"], snap["landmarks"],
+                                   snap["extra"])
+            self.retries += 1
+
+    def wait(self, since=None, timeout=1.0, interval=0.001):
+        """Polling sampai ada frame baru (seq != since) atau timeout → None."""
+        end = time.perf_counter() + timeout
+        while True:
+            frame = self.read(since)
+            if frame is not None or time.perf_counter() >= end:
+                return frame
+            time.sleep(interval)
+
+    def as_dict(self, frame, field="sent"):
+        return dict(zip(self.names, getattr(frame, field).tolist()))
+
+    def close(self):
+        self.rec = self._seq = None
+        self.shm.close()
+
+
+# ─────────────────────────────────────────────
+# MAIN
+# ─────────────────────────────────────────────
+def main(argv=None):
+    ap = argparse.ArgumentParser(prog="modelpipeline shm",
+                                 description="Baca frame tracker dari shared memory (tracker jalan dengan --shm)")
+    ap.add_argument("--name", default=SHM_NAME)
+    ap.add_argument("--interval", type=float, default=1.0, help="detik antar baris")
+    ap.add_argument("--threshold", type=float, default=0.3, help="tampilkan blendshape di atas nilai ini")
+    ap.add_argument("--duration", type=float, help="detik (default: sampai Ctrl+C)")
+    args = ap.parse_args(argv)
+
+    try:
+        reader = SharedFrameReader(args.name)
+    except FileNotFoundError:
+        print(f"❌ Shared memory '{args.name}' tidak ada — jalankan tracker dengan --shm")
+        return 1
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 1
+
+    print(f"🧷 Shared memory '{args.name}': {len(reader.names)} channel, "
+          f"{reader.rec['landmarks'].shape[0]} landmark — Ctrl+C untuk stop\n")
+    start = time.perf_counter()
+    next_print = start + args.interval
+    last_seq = None
+    n = missed = 0
+    last_frame_no = None
+    delays = []
+    try:
+        while args.duration is None or time.perf_counter() - start < args.duration:
+            frame = reader.wait(last_seq, timeout=0.2)
+            now = time.perf_counter()
+            if frame is not None:
+                if last_frame_no is not None and frame.frame > last_frame_no + 1:
+                    missed += frame.frame - last_frame_no - 1
+                last_seq, last_frame_no = frame.seq, frame.frame
+                n += 1
+                delays.append((time.time() - frame.t_capture) * 1e3)
+            if now >= next_print:
+                line = f"🧷 {n / args.interval:5.1f} fps"
+                if delays:
+                    line += f", capture→baca p50 {np.percentile(delays, 50):.1f} ms"
+                line += f", {missed} frame terlewat, {reader.retries} retry"
+                if frame is not None or last_seq is not None:
+                    snap = reader.read() if frame is None else frame
+                    active = sorted(((v, k) for k, v in reader.as_dict(snap).items() if v > args.threshold),
+                                    reverse=True)[:6]
+                    line += "  " + " ".join(f"{k}={v:.2f}" for v, k in active)
+                print(line)
+                n, delays = 0, []
+                next_print += args.interval
+    except KeyboardInterrupt:
+        pass
+    finally:
+        reader.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,426 @@
+"""
+Stage Graph
+───────────
+Runtime dataflow kecil untuk pipeline tracking: tiap stage (capture,
+convert, inference, remap, OSC, recording, render) adalah fungsi yang
+disambung lewat channel, dan tiap stage jalan di executor yang bisa diatur
+dari config — bukan dengan copy script.
+
+    g = StageGraph(config)
+    g.add("capture", read_frame, executor="main")            # source: fn() → item / STOP
+    g.add("infer",   detect, inputs=["capture"], executor="thread", queue=1, policy="drop_oldest")
+    g.add("osc",     send,   inputs=["infer"])
+    g.run(tick=poll_keys)                                   # blok sampai STOP / tick() False
+    print(format_stats(g.stats()))
+
+Executor:
+  - inline  : jalan langsung di thread yang meng-emit (tanpa antrean, latency minimum)
+  - main    : jalan di loop g.run() (thread pemanggil)
+  - thread  : thread sendiri
+  - process : process pool (`workers`), hasil tetap keluar urut; fn harus top-level
+              (picklable), state per worker lewat initializer/initargs. Worker
+              dibuat via forkserver (spawn di Windows), bukan fork: fork saat
+              thread lain memegang lock (mis. thread pembaca stdin) membuat
+              worker macet di bootstrap
+
+Channel (inbox stage non-inline):
+  - queue=1 + drop_oldest = latest-value slot (selalu frame terbaru)
+  - policy: drop_oldest | drop_newest | block — yang dibuang dihitung di `dropped`
+
+Fungsi stage return None = tidak ada output (filter/sink). Producer async
+(mis. callback LIVE_STREAM MediaPipe) bisa kirim output lewat g.emit(nama, item).
+Source return STOP = akhir stream: source berhenti, item yang masih di antrean /
+sedang diproses dituntaskan dulu (maks DRAIN_TIMEOUT), baru graph berhenti.
+Exception di stage menghentikan graph dan di-raise ulang dari run().
+"""
+
+import json
+import multiprocessing
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeout
+
+# ─────────────────────────────────────────────
+# CONFIG
+# ─────────────────────────────────────────────
+EXECUTORS = ("inline", "main", "thread", "process")
+POLICIES  = ("drop_oldest", "drop_newest", "block")
+
+DEFAULT_QUEUE  = 4
+DEFAULT_POLICY = "drop_oldest"
+POLL_INTERVAL  = 0.01    # detik — loop main / thread cek stop
+DRAIN_TIMEOUT  = 2.0     # detik — batas menuntaskan antrean setelah source STOP
+PROCESS_START  = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+
+class _Stop:
+    def __repr__(self):
+        return "STOP"
+
+
+STOP = _Stop()      # dikembalikan source untuk mengakhiri graph
+
+
+def _worker_ready():
+    return os.getpid()
+
+
+# ─────────────────────────────────────────────
+# CHANNEL
+# ─────────────────────────────────────────────
+class Channel:
+    """Bounded queue dengan policy backpressure. maxsize=1 + drop_oldest = latest-value slot."""
+
+    def __init__(self, maxsize=DEFAULT_QUEUE, policy=DEFAULT_POLICY):
+        if policy not in POLICIES:
+            raise ValueError(f"policy '{policy}' tidak dikenal (ada: {', '.join(POLICIES)})")
+        self.maxsize = max(int(maxsize), 1)
+        self.policy  = policy
+        self._items  = deque()
+        self._cond   = threading.Condition()
+        self._closed = False
+        self.put_count = self.dropped = 0
+        self.max_depth = 0
+        self.unfinished = 0     # item masuk yang belum task_done() (antre + sedang diproses)
+
+    def put(self, item):
+        """Return False kalau item (atau item lama) dibuang."""
+        with self._cond:
+            self.put_count += 1
+            kept = True
+            if len(self._items) >= self.maxsize:
+                if self.policy == "drop_newest":
+                    self.dropped += 1
+                    return False
+                if self.policy == "drop_oldest":
+                    self._items.popleft()
+                    self.dropped += 1
+                    self.unfinished -= 1
+                    kept = False
+                else:
+                    while len(self._items) >= self.maxsize and not self._closed:
+                        self._cond.wait(0.1)
+                    if self._closed:
+                        return False
+            self._items.append(item)
+            self.unfinished += 1
+            self.max_depth = max(self.max_depth, len(self._items))
+            self._cond.notify_all()
+            return kept
+
+    def get(self, timeout=None):
+        """Item berikut, atau STOP kalau timeout / channel ditutup & kosong."""
+        with self._cond:
+            if not self._items and not self._closed:
+                self._cond.wait(timeout)
+            if not self._items:
+                return STOP
+            item = self._items.popleft()
+            self._cond.notify_all()
+            return item
+
+    def task_done(self):
+        with self._cond:
+            self.unfinished -= 1
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def __len__(self):
+        return len(self._items)
+
+
+# ─────────────────────────────────────────────
+# STAGE
+# ─────────────────────────────────────────────
+class Stage:
+    def __init__(self, graph, name, fn, inputs=(), executor="inline", queue=DEFAULT_QUEUE,
+                 policy=DEFAULT_POLICY, workers=1, initializer=None, initargs=()):
+        if executor not in EXECUTORS:
+            raise ValueError(f"executor '{executor}' tidak dikenal (ada: {', '.join(EXECUTORS)})")
+        if executor == "inline" and not inputs:
+            raise ValueError(f"stage '{name}': source tidak bisa inline (pakai main / thread)")
+        self.graph    = graph
+        self.name     = name
+        self.fn       = fn
+        self.inputs   = list(inputs)
+        self.executor = executor
+        self.workers  = max(int(workers), 1)
+        self.initializer, self.initargs = initializer, tuple(initargs)
+        self.inbox    = Channel(queue, policy) if inputs and executor != "inline" else None
+        self.outputs  = []          # stage konsumen
+        self.processed = self.emitted = self.errors = 0
+        self.busy_s   = 0.0
+        self._lock    = threading.Lock()
+
+    @property
+    def is_source(self):
+        return not self.inputs
+
+    def deliver(self, item):
+        """Item dari upstream → jalankan langsung (inline) atau masuk inbox."""
+        if self.inbox is None:
+            self.process(item)
+        else:
+            self.inbox.put(item)
+
+    def process(self, item):
+        t0 = time.perf_counter()
+        try:
+            out = self.fn() if item is None and self.is_source else self.fn(item)
+        except Exception as e:
+            with self._lock:
+                self.errors += 1
+            self.graph.fail(self, e)
+            return
+        dt = time.perf_counter() - t0
+        with self._lock:
+            self.processed += 1
+            self.busy_s += dt
+        if out is STOP:
+            self.graph.end_of_stream()
+        elif out is not None:
+            self.emit(out)
+
+    def emit(self, item):
+        with self._lock:
+            self.emitted += 1
+        for consumer in self.outputs:
+            consumer.deliver(item)
+
+    def stats(self):
+        st = {"executor": self.executor, "processed": self.processed, "emitted": self.emitted,
+              "errors": self.errors, "busy_ms": round(self.busy_s * 1e3, 1),
+              "avg_ms": round(self.busy_s * 1e3 / self.processed, 3) if self.processed else None}
+        if self.inbox is not None:
+            st.update(queue=self.inbox.maxsize, policy=self.inbox.policy, dropped=self.inbox.dropped,
+                      depth=len(self.inbox), max_depth=self.inbox.max_depth)
+        return st
+
+
+# ─────────────────────────────────────────────
+# GRAPH
+# ─────────────────────────────────────────────
+class StageGraph:
+    """
+    config: {nama_stage: {executor, queue, policy, workers, ...}} — menimpa default
+    yang diberikan di add(), jadi deployment beda cukup ganti config.
+    """
+
+    def __init__(self, config=None):
+        self.config  = config or {}
+        self.stages  = {}
+        self._stop   = threading.Event()
+        self._eos    = threading.Event()
+        self._threads = []
+        self._pools  = []
+        self._error  = None
+        self._started = False
+
+    def add(self, name, fn, inputs=(), **defaults):
+        if name in self.stages:
+            raise ValueError(f"stage '{name}' sudah ada")
+        opts = dict(defaults)
+        opts.update({k: v for k, v in self.config.get(name, {}).items()
+                     if k in ("executor", "queue", "policy", "workers")})
+        stage = Stage(self, name, fn, inputs, **opts)
+        for src in stage.inputs:
+            if src not in self.stages:
+                raise ValueError(f"stage '{name}': input '{src}' belum ada (tambahkan berurutan)")
+            self.stages[src].outputs.append(stage)
+        self.stages[name] = stage
+        return stage
+
+    def option(self, name, key, default=None):
+        """Opsi tambahan di config stage (mis. infer.mode) yang dibaca pembuat graph."""
+        return self.config.get(name, {}).get(key, default)
+
+    def emit(self, name, item):
+        """Kirim output stage `name` dari luar fn-nya (callback async)."""
+        if not self._stop.is_set():
+            self.stages[name].emit(item)
+
+    # ── lifecycle ──
+    def start(self):
+        """
+        Process pool dibuat & semua worker-nya sudah jalan (initializer selesai)
+        sebelum thread mana pun mulai, jadi item pertama tidak menunggu spawn.
+        """
+        if self._started:
+            return self
+        self._started = True
+        pools = {}
+        for stage in self.stages.values():
+            if stage.executor == "process":
+                if stage.is_source:
+                    raise ValueError(f"stage '{stage.name}': source tidak bisa di process pool")
+                pool = pools[stage.name] = ProcessPoolExecutor(
+                    stage.workers, mp_context=multiprocessing.get_context(PROCESS_START),
+                    initializer=stage.initializer, initargs=stage.initargs)
+                self._pools.append(pool)
+                for fut in wait([pool.submit(_worker_ready) for _ in range(stage.workers)]).done:
+                    if fut.exception() is not None:
+                        self.stop()
+                        self.join()
+                        raise RuntimeError(f"stage '{stage.name}': worker gagal start: {fut.exception()!r}")
+        for stage in self.stages.values():
+            if stage.executor == "thread":
+                target = self._run_source if stage.is_source else self._run_consumer
+                self._spawn(target, stage)
+            elif stage.executor == "process":
+                self._spawn(self._run_process, stage, pools[stage.name])
+        return self
+
+    def run(self, tick=None):
+        """
+        Loop di thread pemanggil: source & stage executor=main, plus tick()
+        tiap putaran (return False → stop). Blok sampai stop / antrean tuntas
+        setelah STOP; exception stage di-raise ulang di sini.
+        """
+        if not self._started:
+            self.start()
+        mains = [s for s in self.stages.values() if s.executor == "main"]
+        sources = [s for s in mains if s.is_source]
+        consumers = [s for s in mains if not s.is_source]
+        deadline = None
+        try:
+            while not self._stop.is_set():
+                if not self._eos.is_set():
+                    for s in sources:
+                        s.process(None)
+                for s in consumers:
+                    while len(s.inbox) and not self._stop.is_set():
+                        s.process(s.inbox.get(0))
+                        s.inbox.task_done()
+                if tick is not None and tick() is False:
+                    break
+                if self._eos.is_set():
+                    deadline = deadline or time.perf_counter() + DRAIN_TIMEOUT
+                    if self.idle() or time.perf_counter() > deadline:
+                        break
+                if not sources or self._eos.is_set():
+                    self._stop.wait(POLL_INTERVAL)
+        finally:
+            self.stop()
+            self.join()
+        if self._error is not None:
+            stage, err = self._error
+            raise RuntimeError(f"stage '{stage.name}' gagal: {err!r}") from err
+
+    def end_of_stream(self):
+        """Source selesai: tidak ada input baru, run() berhenti setelah antrean tuntas."""
+        self._eos.set()
+
+    def idle(self):
+        return all(s.inbox is None or s.inbox.unfinished <= 0 for s in self.stages.values())
+
+    def stop(self):
+        self._stop.set()
+        for stage in self.stages.values():
+            if stage.inbox is not None:
+                stage.inbox.close()
+
+    def join(self, timeout=2.0):
+        for t in self._threads:
+            t.join(timeout)
+        self._threads = []
+        for pool in self._pools:
+            pool.shutdown(wait=True, cancel_futures=True)
+        self._pools = []
+
+    def fail(self, stage, err):
+        if self._error is None:
+            self._error = (stage, err)
+        self.stop()
+
+    @property
+    def stopped(self):
+        return self._stop.is_set()
+
+    def stats(self):
+        return {name: s.stats() for name, s in self.stages.items()}
+
+    # ── executor ──
+    def _spawn(self, target, *args):
+        t = threading.Thread(target=target, args=args, name=f"stage-{args[0].name}", daemon=True)
+        self._threads.append(t)
+        t.start()
+
+    def _run_source(self, stage):
+        while not self._stop.is_set() and not self._eos.is_set():
+            stage.process(None)
+
+    def _run_consumer(self, stage):
+        while not self._stop.is_set():
+            item = stage.inbox.get(POLL_INTERVAL * 10)
+            if item is not STOP:
+                stage.process(item)
+                stage.inbox.task_done()
+
+    def _run_process(self, stage, pool):
+        """Maks `workers` item jalan bersamaan; hasil di-emit urut sesuai input."""
+        pending = deque()
+        while not self._stop.is_set():
+            if len(pending) < stage.workers:
+                item = stage.inbox.get(POLL_INTERVAL if pending else POLL_INTERVAL * 10)
+                if item is not STOP:
+                    pending.append((time.perf_counter(), pool.submit(stage.fn, item)))
+                    continue
+            if not pending:
+                continue
+            t0, fut = pending[0]
+            try:
+                out = fut.result(timeout=POLL_INTERVAL * 10)
+            except FutureTimeout:
+                continue
+            except Exception as e:
+                stage.errors += 1
+                self.fail(stage, e)
+                return
+            pending.popleft()
+            stage.processed += 1
+            stage.busy_s += time.perf_counter() - t0
+            if isinstance(out, _Stop):                # STOP dari process lain = objek baru
+                self.end_of_stream()
+            elif out is not None:
+                stage.emit(out)
+            stage.inbox.task_done()
+
+
+# ─────────────────────────────────────────────
+# CONFIG HELPERS
+# ─────────────────────────────────────────────
+def load_graph_config(spec, presets):
+    """
+    "latency"               → preset
+    "graph.json"            → isi file saja
+    "threaded+graph.json"   → preset ditimpa isi file (per stage, per key)
+    """
+    name, _, path = spec.partition("+")
+    if not path and (name.endswith(".json") or os.path.isfile(name)):
+        name, path = "", name
+    if name and name not in presets:
+        raise ValueError(f"preset graph '{name}' tidak dikenal (ada: {', '.join(presets)})")
+    config = {stage: dict(opts) for stage, opts in presets.get(name, {}).items()}
+    if path:
+        with open(path, encoding="utf-8") as f:
+            for stage, opts in json.load(f).items():
+                config.setdefault(stage, {}).update(opts)
+    return config
+
+
+def format_stats(stats):
+    """Tabel ringkas per stage untuk terminal."""
+    lines = [f"  {'stage':<10} {'executor':<8} {'proses':>7} {'out':>7} {'avg ms':>8} {'antrean':>14} {'drop':>6}"]
+    for name, st in stats.items():
+        queue = f"{st['max_depth']}/{st['queue']} {st['policy']}" if "queue" in st else "-"
+        avg = f"{st['avg_ms']:.2f}" if st["avg_ms"] is not None else "-"
+        lines.append(f"  {name:<10} {st['executor']:<8} {st['processed']:>7} {st['emitted']:>7} "
+                     f"{avg:>8} {queue:>14} {st.get('dropped', 0):>6}"
+                     + (f"  ⚠ {st['errors']} error" if st["errors"] else ""))
+    return "\n".join(lines)
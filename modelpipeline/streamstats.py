@@ -0,0 +1,209 @@
+"""
+Stream Stats
+────────────
+Kualitas stream VMC yang masuk ke listener, per sender (ip:port):
+
+  - pesan/detik dan frame/detik
+  - jitter antar frame (std interval) + p95 interval
+  - gap antar batas frame (interval > GAP_FACTOR × median)
+  - estimasi packet loss:
+      · dari nomor urut /VUI/Frame kalau sender mengirimnya (pasti)
+      · dari jumlah Blend/Val per frame vs jumlah normal (perkiraan)
+  - latency satu arah dari waktu kirim di /VUI/Frame (satu mesin / jam sinkron)
+
+Batas frame = /VMC/Ext/Blend/Apply; sender yang tidak kirim Apply (tracker
+kita) pakai /VUI/Frame sebagai batas frame.
+
+Statistik bergulir di jendela WINDOW detik terakhir, dan StreamMonitor bisa
+menulis snapshot tiap LOG_INTERVAL ke file JSON lines.
+"""
+
+import json
+import time
+from collections import deque
+
+import numpy as np
+
+from .osccodec import STAMP_MASK, stamp_delay_us
+
+# ─────────────────────────────────────────────
+# CONFIG
+# ─────────────────────────────────────────────
+WINDOW       = 5.0     # detik statistik bergulir
+LOG_INTERVAL = 1.0     # detik antar baris log
+GAP_FACTOR   = 2.5     # interval > faktor × median → dihitung gap
+MAX_FRAMES   = 4096    # batas sampel per jendela
+
+
+class SenderStats:
+    """Statistik satu sender. Dipanggil dari thread listener saja."""
+
+    def __init__(self, addr, window=WINDOW):
+        self.addr   = addr
+        self.window = window
+        self.first_seen = self.last_seen = None
+        self.datagrams = self.messages = self.frames = 0
+        self.pending = 0                  # Blend/Val sejak batas frame terakhir
+        self.uses_apply = False
+
+        # sampel per frame: (waktu tiba, jumlah Blend/Val)
+        self._frame_t    = deque(maxlen=MAX_FRAMES)
+        self._frame_msgs = deque(maxlen=MAX_FRAMES)
+        # sampel per stamp: (waktu tiba, latency µs, frame hilang sebelum stamp ini)
+        self._stamp_t    = deque(maxlen=MAX_FRAMES)
+        self._latency    = deque(maxlen=MAX_FRAMES)
+        self._seq_lost   = deque(maxlen=MAX_FRAMES)
+        self._counts     = deque()        # (waktu, messages total) untuk rate
+        self.last_seq = None
+        self.seq_lost_total = self.seq_reordered = 0
+
+    # ── event dari listener ──
+    def on_datagram(self, now, n_messages):
+        if self.first_seen is None:
+            self.first_seen = now
+        self.last_seen = now
+        self.datagrams += 1
+        self.messages  += n_messages
+        self._counts.append((now, self.messages))
+
+    def on_apply(self, now):
+        if not self.uses_apply:
+            # sender ini pakai Apply → batas frame dari /VUI/Frame sebelumnya dibuang
+            self.uses_apply = True
+            self._frame_t.clear()
+            self._frame_msgs.clear()
+        self._frame(now)
+
+    def on_stamp(self, now, seq, sent_us):
+        lost = 0
+        if self.last_seq is not None:
+            step = (seq - self.last_seq) & STAMP_MASK
+            if step == 0 or step > STAMP_MASK // 2:
+                self.seq_reordered += 1
+                return
+            lost = step - 1
+            self.seq_lost_total += lost
+        self.last_seq = seq
+        self._stamp_t.append(now)
+        self._latency.append(stamp_delay_us(sent_us))
+        self._seq_lost.append(lost)
+        if not self.uses_apply:
+            self._frame(now)
+
+    def _frame(self, now):
+        self.frames += 1
+        self._frame_t.append(now)
+        self._frame_msgs.append(self.pending)
+        self.pending = 0
+
+    # ── laporan ──
+    def _prune(self, now):
+        edge = now - self.window
+        for times, others in ((self._frame_t, (self._frame_msgs,)),
+                              (self._stamp_t, (self._latency, self._seq_lost))):
+            while times and times[0] < edge:
+                times.popleft()
+                for d in others:
+                    d.popleft()
+        while len(self._counts) > 1 and self._counts[1][0] < edge:
+            self._counts.popleft()
+
+    def report(self, now=None):
+        now = time.perf_counter() if now is None else now
+        self._prune(now)
+        out = {"sender": f"{self.addr[0]}:{self.addr[1]}" if self.addr else "?",
+               "datagrams": self.datagrams, "messages": self.messages, "frames": self.frames,
+               "idle_s": round(now - self.last_seen, 3) if self.last_seen else None}
+
+        if len(self._counts) > 1:
+            (t0, m0), (t1, m1) = self._counts[0], self._counts[-1]
+            span = max(min(now, t1 + self.window) - t0, 1e-6)
+            out["msg_rate"] = round((m1 - m0) / span, 1)
+
+        ft = np.fromiter(self._frame_t, dtype=np.float64)
+        if len(ft) > 2:
+            iv = np.diff(ft) * 1000.0
+            med = float(np.median(iv))
+            out.update(fps=round(1000.0 / med, 2) if med > 0 else None,
+                       interval_ms=round(float(iv.mean()), 3),
+                       jitter_ms=round(float(iv.std()), 3),
+                       interval_p95_ms=round(float(np.percentile(iv, 95)), 3),
+                       max_gap_ms=round(float(iv.max()), 3),
+                       gaps=int(np.count_nonzero(iv > GAP_FACTOR * med)))
+
+            msgs = np.fromiter(self._frame_msgs, dtype=np.int64)[1:]
+            # jumlah normal per frame = maks yang wajar (frame gabungan karena batas
+            # frame hilang → ~2× median, tidak dihitung)
+            med_msgs = float(np.median(msgs)) if len(msgs) else 0.0
+            normal = msgs[msgs <= 1.5 * med_msgs]
+            expected = int(normal.max()) if len(normal) else 0
+            if expected > 0:
+                short = np.clip(expected - msgs, 0, None)
+                out.update(msgs_per_frame=expected,
+                           est_loss=round(float(short.sum() / (expected * len(msgs))), 5))
+
+        if self._stamp_t:
+            lat = np.fromiter(self._latency, dtype=np.float64) / 1000.0
+            lost = int(sum(self._seq_lost))
+            out.update(seq_loss=round(lost / (lost + len(self._stamp_t)), 5),
+                       seq_lost_total=self.seq_lost_total, seq_reordered=self.seq_reordered,
+                       latency_p50_ms=round(float(np.percentile(lat, 50)), 3),
+                       latency_p95_ms=round(float(np.percentile(lat, 95)), 3),
+                       latency_max_ms=round(float(lat.max()), 3))
+        return out
+
+
+class StreamMonitor:
+    """Kumpulan SenderStats + log JSON lines periodik."""
+
+    def __init__(self, window=WINDOW, log_path=None, log_interval=LOG_INTERVAL):
+        self.window  = window
+        self.senders = {}
+        self.log_interval = log_interval
+        self._log = open(log_path, "a", encoding="utf-8") if log_path else None
+        self.log_path = log_path
+        self._next_log = None
+
+    def sender(self, addr):
+        s = self.senders.get(addr)
+        if s is None:
+            s = self.senders[addr] = SenderStats(addr, self.window)
+        return s
+
+    def report(self, now=None):
+        now = time.perf_counter() if now is None else now
+        return [s.report(now) for s in self.senders.values()]
+
+    def tick(self, now=None):
+        """Panggil berkala dari loop listener. Return report kalau baru di-log, else None."""
+        now = time.perf_counter() if now is None else now
+        if self._next_log is None:
+            self._next_log = now + self.log_interval
+        if now < self._next_log:
+            return None
+        self._next_log = now + self.log_interval
+        rep = self.report(now)
+        if self._log:
+            self._log.write(json.dumps({"time": round(time.time(), 3), "senders": rep}) + "\n")
+            self._log.flush()
+        return rep
+
+    def close(self):
+        if self._log:
+            self._log.close()
+            self._log = None
+
+
+def format_report(r):
+    """Satu baris ringkas untuk terminal."""
+    parts = [f"📡 {r['sender']}"]
+    if "msg_rate" in r:
+        parts.append(f"{r['msg_rate']:.0f} msg/s")
+    if r.get("fps"):
+        parts.append(f"{r['fps']:.1f} fps  jitter {r['jitter_ms']:.2f} ms  gap maks {r['max_gap_ms']:.0f} ms ({r['gaps']}x)")
+    if "est_loss" in r:
+        parts.append(f"loss≈{r['est_loss'] * 100:.2f}%")
+    if "seq_loss" in r:
+        parts.append(f"seq loss {r['seq_loss'] * 100:.2f}%  latency p50 {r['latency_p50_ms']:.2f} / "
+                     f"p95 {r['latency_p95_ms']:.2f} ms")
+    return "  ".join(parts)
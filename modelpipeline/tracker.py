@@ -0,0 +1,1064 @@
+"""
+Face Tracker
+────────────
+Tracker MediaPipe FaceLandmarker → VSeeFace (VMC), gabungan CheeckModel.py,
+modelmonitor.py, runmodel.py dan mediapipefinal.py. Bedanya sekarang cuma
+profile remap (lihat remap.py) dan mode monitor:
+
+    python -m modelpipeline track                                  # cheekPuff proxy (dulu CheeckModel.py)
+    python -m modelpipeline monitor                                # jarak pipi + squint/blink (dulu modelmonitor.py)
+    python -m modelpipeline track -p runmodel                      # nilai mentah (dulu runmodel.py)
+    python -m modelpipeline track -p mediapipefinal --headless     # dulu mediapipefinal.py
+    python -m modelpipeline track -p CheeckModel+recordings/calibration_x.json
+    python -m modelpipeline track --camera clip.mp4 --headless     # file / folder gambar sebagai kamera
+
+Tombol (window preview, atau ketik + Enter kalau --headless):
+    R record ON/OFF · S snapshot · C print jarak pipi (monitor) · P profiling · Q quit & save
+
+P (atau `kill -USR1 <pid>`): sampling profiler semua thread + tracemalloc
+selama --profile-seconds, hasil profile_*/alloc_* di recordings/ (liveprofile.py).
+
+Loop tracking adalah stage graph (stagegraph.py): capture → convert →
+infer → remap → osc / record, plus render. Executor & antrean tiap stage
+dipilih lewat --graph (latency / threaded / throughput / file JSON).
+
+--faces N: sampai N wajah per frame, tiap wajah dapat ID stabil (facetracks.py),
+remap/filter sendiri dan target VMC sendiri (ID 0 → --port, ID n → port + n × 10).
+
+--shm: tiap frame (wajah yang dipin, sama dengan recording) juga dipublish ke shared memory
+"vui_tracker" (sharedframe.py) — tool lokal lain baca tanpa lewat OSC.
+
+--output-rate HZ: nilai VMC dikirim dengan rate tetap (outputsched.py),
+diinterpolasi di antara hasil inference terakhir, bukan tiap hasil datang.
+
+--gate: frame yang praktis tidak berubah (motiongate.py) tidak di-inference,
+hasil terakhir ditahan; rasio skip & estimasi CPU yang dihemat dicetak di akhir.
+Di mode live, frame yang ditahan lewat jalur yang sama dengan hasil callback
+MediaPipe (satu lock, timestamp naik), dan gate tidak skip selama detect_async
+masih menunggu hasil.
+
+Model di-load & di-warm-up (landmarker.py) sebelum kamera dibuka; waktu
+siap dan latency frame pertama yang sampai ke VSeeFace dicetak di awal.
+
+cv2 / mediapipe baru di-import saat Tracker.run() dan di fungsi gambar, jadi
+modul ini (termasuk callback on_result) bisa di-import tanpa kamera/model.
+"""
+
+import argparse
+import csv
+import json
+import os
+import signal
+import socket
+import sys
+import threading
+import time
+from collections import namedtuple
+from datetime import datetime
+
+from .constants import (BLENDSHAPE_TO_GROUP, CAMERA_FPS, CAMERA_HEIGHT, CAMERA_INDEX, CAMERA_WIDTH,
+                        CHEEK_DIST_CHANNELS, CHEEK_LANDMARKS, FACE_REGIONS, MODEL_PATH, NOSE_TIP_INDEX,
+                        RECORD_LANDMARK_INDICES, RECORDINGS_DIR, VMC_IP, VMC_PORT)
+from .landmarker import WARMUP_FRAMES, create_landmarker, format_report, make_mp_image
+from .liveprofile import PROFILE_SECONDS, LiveProfiler
+from .motiongate import DIFF_THRESHOLD, MAX_SKIP, MotionGate, format_gate_stats
+from .outputsched import OUTPUT_DELAY, OUTPUT_RATE, OutputScheduler, format_output_stats
+from .osccodec import BlendValEncoder, encode_frame_stamp
+from .remap import LiveRemap, load_profile
+from .sharedframe import SHM_NAME
+
+# ─────────────────────────────────────────────
+# CONFIG
+# ─────────────────────────────────────────────
+PREVIEW_FPS       = 15      # fps window preview (tracking tetap full rate)
+CONTINUOUS_RECORD = True    # R juga merekam SETIAP frame ke recordings/stream_*.vui
+SEND_FRAME_STAMP  = True    # kirim /VUI/Frame [seq, waktu] per frame (statistik listener)
+MOTION_GATE       = False   # skip inference di frame yang tidak berubah (motiongate.py, --gate)
+NUM_FACES         = 1       # wajah maksimum per frame (>1 → ID stabil per wajah, facetracks.py)
+FACE_PORT_STEP    = 10      # target VMC wajah ID n = port + n × step (ID 0 = port utama)
+SHARED_FRAME      = False   # publish frame ke shared memory (sharedframe.py, --shm)
+
+# Preset stage graph (lihat stagegraph.py). "latency" = perilaku script lama:
+# capture di loop utama, inference LIVE_STREAM, remap/OSC/record di callback.
+DEFAULT_GRAPH = "latency"
+GRAPH_PRESETS = {
+    "latency": {
+        "capture": {"executor": "main"},
+        "convert": {"executor": "inline"},
+        "infer":   {"executor": "inline", "mode": "live"},
+        "remap":   {"executor": "inline"},
+        "osc":     {"executor": "inline"},
+        "record":  {"executor": "inline"},
+        "shm":     {"executor": "inline"},
+        "render":  {"executor": "inline"},
+    },
+    # capture tidak pernah menunggu inference; inference selalu ambil frame terbaru
+    "threaded": {
+        "capture": {"executor": "thread"},
+        "convert": {"executor": "thread", "queue": 1, "policy": "drop_oldest"},
+        "infer":   {"executor": "thread", "queue": 1, "policy": "drop_oldest", "mode": "video"},
+        "remap":   {"executor": "inline"},
+        "osc":     {"executor": "inline"},
+        "record":  {"executor": "thread", "queue": 256, "policy": "drop_newest"},
+        "shm":     {"executor": "inline"},
+        "render":  {"executor": "thread", "queue": 1, "policy": "drop_oldest"},
+    },
+    # semua frame diproses (file video / load test), inference paralel di process pool
+    "throughput": {
+        "capture": {"executor": "main"},
+        "convert": {"executor": "inline"},
+        "infer":   {"executor": "process", "workers": 2, "queue": 8, "policy": "block", "mode": "video"},
+        "remap":   {"executor": "thread", "queue": 64, "policy": "block"},
+        "osc":     {"executor": "inline"},
+        "record":  {"executor": "inline"},
+        "shm":     {"executor": "inline"},
+        "render":  {"executor": "thread", "queue": 1, "policy": "drop_oldest"},
+    },
+}
+
+# mode → profile default + apakah jarak pipi dihitung/direkam
+MODES = {
+    "track":   {"profile": "CheeckModel",  "cheek_monitor": False},
+    "monitor": {"profile": "modelmonitor", "cheek_monitor": True},
+}
+
+
+# ─────────────────────────────────────────────
+# CHEEK DISTANCE
+# ─────────────────────────────────────────────
+def compute_cheek_distances(face_landmarks):
+    """
+    Hitung rata-rata jarak landmark pipi ke ujung hidung.
+    Makin besar = pipi makin terdorong keluar (cheekPuff).
+    """
+    nose = face_landmarks[NOSE_TIP_INDEX]
+    distances = {}
+    for side, indices in CHEEK_LANDMARKS.items():
+        dists = []
+        for idx in indices:
+            if idx < len(face_landmarks):
+                lm = face_landmarks[idx]
+                dx = lm.x - nose.x
+                dy = lm.y - nose.y
+                dists.append((dx**2 + dy**2) ** 0.5)
+        distances[side] = round(sum(dists) / len(dists), 4) if dists else 0.0
+    return distances
+
+
+# ─────────────────────────────────────────────
+# TRACKER
+# ─────────────────────────────────────────────
+# Satu wajah hasil tracking yang mengalir remap → osc / record (stage remap emit list per frame)
+TrackedFrame = namedtuple("TrackedFrame", "t_ms raw sent face_lm cheek_dist face_id", defaults=(0,))
+
+
+class FaceOutput:
+    """State per ID wajah: remap/filter sendiri + target VMC sendiri + nomor urut /VUI/Frame."""
+
+    def __init__(self, profile, addr):
+        self.remap = LiveRemap(profile)
+        self.addr  = addr
+        self.seq   = 0
+
+
+class Tracker:
+    """State tracking + callback MediaPipe (dulu variabel global di tiap script)."""
+
+    def __init__(self, profile, cheek_monitor=False, host=VMC_IP, port=VMC_PORT,
+                 send_frame_stamp=SEND_FRAME_STAMP, continuous_record=CONTINUOUS_RECORD,
+                 record_dir=RECORDINGS_DIR, gate=None, num_faces=NUM_FACES, face_port_step=FACE_PORT_STEP,
+                 profile_seconds=PROFILE_SECONDS, profile_alloc=True, shm_name=None,
+                 output_rate=OUTPUT_RATE, output_delay=OUTPUT_DELAY):
+        self.profile       = profile
+        self.cheek_monitor = cheek_monitor
+        self.addr          = (host, port)
+        self.num_faces     = max(int(num_faces), 1)
+        self.face_port_step = face_port_step
+        self.outputs       = {0: FaceOutput(profile, self.addr)}   # ID wajah → FaceOutput
+        self.remap         = self.outputs[0].remap
+        self.face_tracks   = None
+        if self.num_faces > 1:
+            from .facetracks import FaceTracks
+            self.face_tracks = FaceTracks()
+        self.send_stamps   = send_frame_stamp
+        self.continuous_record = continuous_record
+        self.record_dir    = record_dir
+        self.gate          = gate          # MotionGate atau None
+        self.profiler      = LiveProfiler(record_dir, profile_seconds, alloc=profile_alloc)
+        self.shm_name      = shm_name      # nama shared memory frame (None = tidak publish)
+        self.publisher     = None          # SharedFramePublisher selama run()
+        self.output_rate   = output_rate   # Hz kirim VMC tetap (0 = langsung per hasil)
+        self.output_delay  = output_delay
+        self.output        = None          # OutputScheduler selama run()
+
+        self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._enc  = BlendValEncoder()
+
+        self.latest_landmarks   = None
+        self.latest_blendshapes = {}   # { name: score } untuk HUD & snapshot
+        self.latest_cheek_dist  = {"LEFT_CHEEK": 0.0, "RIGHT_CHEEK": 0.0}
+        self.is_recording       = False
+        self.record_session     = []   # list of snapshot dicts
+        self.stream_recorder    = None # StreamRecorder aktif (kalau continuous_record)
+        self.print_cheek_coords = False
+        self.sample_rate        = None
+        self._landmarker        = None
+        self._landmarker_mode   = None
+        self._live_sink         = None # tujuan hasil LIVE_STREAM (di-set build_graph)
+        self._t_start           = None # perf_counter saat run() mulai
+        self.first_frame        = None # {startup_ms, latency_ms} frame pertama yang terkirim
+        self._last_result       = None # (hasil inference, ID wajah) terakhir — ditahan saat frame di-skip gate
+        self._pinned            = {"record": None, "shm": None}  # ID wajah yang diikuti recording / shm
+        self._infer_s           = 0.0  # waktu inference in-process (estimasi CPU yang dihemat gate)
+        self._infer_n           = 0
+        self._infer_pending     = None # (ts, t0) detect_async terakhir yang belum ada hasilnya (mode live)
+        self._pending_lock      = threading.Lock()
+        self._profile_request   = False # di-set handler SIGUSR1, diproses di handle_command
+
+    # ── stage: remap / osc / record ──
+    def send_frame_stamp(self, out):
+        """Penanda akhir frame untuk listener: nomor urut + waktu kirim (loss & latency)."""
+        if self.send_stamps:
+            self._sock.sendto(encode_frame_stamp(out.seq), out.addr)
+            out.seq += 1
+
+    def face_output(self, face_id):
+        out = self.outputs.get(face_id)
+        if out is None:
+            host, port = self.addr
+            out = self.outputs[face_id] = FaceOutput(self.profile, (host, port + face_id * self.face_port_step))
+            print(f"👥 Wajah ID {face_id} → {host}:{out.addr[1]}")
+        return out
+
+    def face_ids(self, result):
+        """ID stabil per wajah (urutan sama dengan result.face_landmarks); 1 wajah = selalu ID 0."""
+        faces = result.face_landmarks
+        if self.face_tracks is None:
+            return [0] if faces else []
+        ids = self.face_tracks.assign(faces)
+        for face_id in self.face_tracks.new_ids:
+            # ID dipakai ulang oleh wajah baru → filter/remap mulai dari nol
+            self.face_output(face_id).remap.reset()
+            if self.output is not None:
+                self.output.reset(face_id)
+        return ids
+
+    def process_result(self, result, timestamp_ms):
+        """
+        Hasil FaceLandmarker → list TrackedFrame per wajah (urut ID); update state HUD.
+        result None = frame di-skip motion gate → hasil terakhir ditahan (tetap lewat remap).
+        HUD, snapshot & jarak pipi mengikuti wajah ID terkecil; recording & shm wajah yang dipin
+        (pinned_frame).
+        """
+        held = result is None
+        if held:
+            if self._last_result is None:
+                return None
+            result, ids = self._last_result
+        else:
+            ids = self.face_ids(result)
+            self._last_result = (result, ids)
+
+        faces = sorted(zip(ids, result.face_landmarks, result.face_blendshapes or [[]] * len(ids)),
+                       key=lambda f: f[0])
+        if self.gate is not None and not held:
+            self.gate.update([l for _, lm, _ in faces for l in lm],
+                             [{b.category_name: float(b.score) for b in bs} for _, _, bs in faces])
+        if not faces:
+            return None
+        self.latest_landmarks = [lm for _, lm, _ in faces]
+
+        frames = []
+        for face_id, face_lm, blendshapes in faces:
+            if not blendshapes:
+                continue
+            cheek_dist = None
+            if self.cheek_monitor:
+                # tiap wajah (recording bisa mengikuti wajah selain ID terkecil); HUD wajah pertama
+                cheek_dist = compute_cheek_distances(face_lm)
+            if cheek_dist is not None and not frames:
+                self.latest_cheek_dist = cheek_dist
+                if self.print_cheek_coords:
+                    nose = face_lm[NOSE_TIP_INDEX]
+                    print(
+                        f"NOSE=({nose.x:.3f},{nose.y:.3f}) | "
+                        f"L_CHEEK={cheek_dist['LEFT_CHEEK']:.4f} | "
+                        f"R_CHEEK={cheek_dist['RIGHT_CHEEK']:.4f}"
+                    )
+
+            raw = {b.category_name: float(b.score) for b in blendshapes}
+            # Remap sesuai profile (squint/blink/cheekPuff proxy), state per ID wajah
+            sent = self.face_output(face_id).remap.apply(raw)
+
+            if not frames:
+                # HUD & snapshot: nilai RAW, kecuali cheekPuff hasil proxy
+                display = raw
+                if self.profile["CHEEK_PROXY"] and "cheekPuff" in sent:
+                    display = dict(raw, cheekPuff=sent["cheekPuff"])
+                self.latest_blendshapes = display
+            frames.append(TrackedFrame(timestamp_ms, raw, sent, face_lm, cheek_dist, face_id))
+        return frames or None
+
+    def send_frame(self, frames):
+        """Kirim nilai hasil remap tiap wajah ke target VMC-nya + /VUI/Frame."""
+        send, encode = self._sock.sendto, self._enc.encode
+        for frame in frames:
+            out = self.face_output(frame.face_id)
+            addr = out.addr
+            for name, score in frame.sent.items():
+                send(encode(name, score), addr)
+            self.send_frame_stamp(out)
+        if self.first_frame is None and self._t_start is not None:
+            self.report_first_frame(frames[0].t_ms)
+
+    def send_values(self, face_id, names, values, t_ms):
+        """Satu frame dari OutputScheduler (nilai hasil interpolasi, urut names) + /VUI/Frame."""
+        send, encode = self._sock.sendto, self._enc.encode
+        out = self.face_output(face_id)
+        addr = out.addr
+        for name, score in zip(names, values):
+            send(encode(name, score), addr)
+        self.send_frame_stamp(out)
+        if self.first_frame is None and self._t_start is not None:
+            self.report_first_frame(t_ms)
+
+    def report_first_frame(self, t_ms):
+        # t_ms = timestamp capture (wall clock ms) → latency capture sampai OSC terkirim
+        self.first_frame = {"startup_ms": (time.perf_counter() - self._t_start) * 1e3,
+                            "latency_ms": time.time() * 1000 - t_ms}
+        print(f"⚡ Frame pertama ke VSeeFace: {self.first_frame['startup_ms']:.0f} ms sejak start, "
+              f"latency capture→OSC {self.first_frame['latency_ms']:.1f} ms")
+
+    def pinned_frame(self, frames, key):
+        """
+        Frame wajah yang diikuti recording / shm: ID terkecil saat wajah pertama
+        muncul, lalu tetap ID itu — wajah lain tidak menyambung stream-nya.
+        Wajah yang dipin tidak ada di frame ini → None (frame dilewati).
+        """
+        face_id = self._pinned[key]
+        if face_id is None:
+            face_id = self._pinned[key] = frames[0].face_id
+            if key == "record" and self.stream_recorder is not None:
+                self.stream_recorder.annotate(face_id=face_id)
+            if self.face_tracks is not None:
+                print(f"📌 {'Recording' if key == 'record' else 'Shared memory'} mengikuti wajah ID {face_id}")
+        for frame in frames:
+            if frame.face_id == face_id:
+                return frame
+        return None
+
+    def record_frame(self, frames):
+        """Recording kontinu — simpan nilai RAW wajah yang dipin (+ jarak pipi di mode monitor)."""
+        rec = self.stream_recorder
+        frame = self.pinned_frame(frames, "record") if rec is not None else None
+        if frame is not None:
+            extra = None
+            if frame.cheek_dist is not None:
+                extra = {"LEFT_CHEEK_dist":  frame.cheek_dist["LEFT_CHEEK"],
+                         "RIGHT_CHEEK_dist": frame.cheek_dist["RIGHT_CHEEK"]}
+            rec.push(frame.t_ms / 1000.0, frame.raw, frame.face_lm, extra)
+
+    def publish_frame(self, frames):
+        """Shared memory — wajah yang dipin seperti recording (seqlock, tidak pernah menunggu reader)."""
+        pub = self.publisher
+        frame = self.pinned_frame(frames, "shm") if pub is not None else None
+        if frame is not None:
+            pub.publish(frame.t_ms / 1000.0, frame.raw, frame.sent, frame.face_lm, frame.cheek_dist,
+                        frame.face_id)
+
+    def on_result(self, result, output_image, timestamp_ms):
+        """remap → osc → record berurutan (callback LIVE_STREAM langsung, tanpa graph)."""
+        frames = self.process_result(result, timestamp_ms)
+        if frames is not None:
+            self.send_frame(frames)
+            self.record_frame(frames)
+
+    # ── recording ──
+    def start_stream_recording(self):
+        """Buka StreamRecorder baru → recordings/stream_<ts>.vui"""
+        from .recorder import StreamRecorder
+
+        ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+        os.makedirs(self.record_dir, exist_ok=True)
+        self._pinned["record"] = None      # recording baru → pin wajah yang ada saat frame pertama
+        rec = StreamRecorder(os.path.join(self.record_dir, f"stream_{ts}.vui"), RECORD_LANDMARK_INDICES,
+                             extra_channels=CHEEK_DIST_CHANNELS if self.cheek_monitor else (),
+                             sample_rate=self.sample_rate)
+        print(f"🎞  Recording kontinu → {rec.path}")
+        return rec.start()
+
+    def stop_stream_recording(self):
+        """Tutup recorder (flush sisa chunk) dan print statistik."""
+        rec, self.stream_recorder = self.stream_recorder, None
+        if rec is None:
+            return
+        rec.close()
+        st = rec.stats()
+        print(f"🎞  Stream selesai — {st['written']} frames ditulis, "
+              f"{st['dropped']} dropped, {st['chunks']} chunks → {rec.path}")
+
+    def toggle_recording(self):
+        self.is_recording = not self.is_recording
+        if self.is_recording:
+            print(f"\n🔴 Recording DIMULAI — {datetime.now().strftime('%H:%M:%S')}")
+            print("Tekan S untuk snapshot, R lagi untuk stop.\n")
+            if self.continuous_record:
+                self.stream_recorder = self.start_stream_recording()
+        else:
+            print(f"\n⏹  Recording DIHENTIKAN — {len(self.record_session)} snapshots tersimpan.")
+            self.stop_stream_recording()
+
+    def snapshot(self):
+        if self.is_recording and self.latest_blendshapes and self.latest_landmarks:
+            snap = take_snapshot(self.latest_landmarks, self.latest_blendshapes,
+                                 self.latest_cheek_dist if self.cheek_monitor else None)
+            self.record_session.append(snap)
+            print_snapshot_to_terminal(snap)
+            print(f"[Total snapshots: {len(self.record_session)}]")
+        elif not self.is_recording:
+            print("⚠ Aktifkan recording dulu dengan tekan R!")
+
+    def handle_command(self, key):
+        """Return False kalau harus berhenti (Q)."""
+        if self._profile_request:
+            self._profile_request = False
+            key = "p"
+        if key == "r":
+            self.toggle_recording()
+        elif key == "s":
+            self.snapshot()
+        elif key == "c" and self.cheek_monitor:
+            self.print_cheek_coords = not self.print_cheek_coords
+            print(f"\n{'🟡 ON' if self.print_cheek_coords else '⚫ OFF'} — Print koordinat pipi realtime")
+        elif key == "p":
+            if not self.profiler.toggle():
+                print("\n🔬 Profiling dihentikan, menulis hasil...")
+        elif key == "q":
+            return False
+        return True
+
+    def preview_state(self):
+        return {
+            "landmarks":      self.latest_landmarks,
+            "blendshapes":    self.latest_blendshapes,
+            "cheek_dist":     self.latest_cheek_dist if self.cheek_monitor else None,
+            "proxy_cheek":    self.profile["CHEEK_PROXY"],
+            "is_recording":   self.is_recording,
+            "snapshot_count": len(self.record_session),
+            "print_coords":   self.print_cheek_coords,
+        }
+
+    # ── model ──
+    def preload(self, model_path=MODEL_PATH, config=None, warmup=WARMUP_FRAMES):
+        """
+        Buat + warm-up landmarker in-process sebelum kamera dibuka. Kalau infer
+        jalan di process pool, tiap worker warm-up sendiri di initializer.
+        """
+        infer = (config if config is not None else GRAPH_PRESETS[DEFAULT_GRAPH]).get("infer", {})
+        if infer.get("executor") == "process":
+            return None
+        self.close_landmarker()
+        mode = infer.get("mode", "live")
+        self._landmarker, report = create_landmarker(model_path, mode, self._on_live_result, warmup,
+                                                     num_faces=self.num_faces)
+        self._landmarker_mode = mode
+        print(format_report(report))
+        return report
+
+    def close_landmarker(self):
+        if self._landmarker is not None:
+            self._landmarker.close()
+            self._landmarker = self._landmarker_mode = None
+
+    def _on_live_result(self, result, _image, timestamp_ms):
+        pending = self._infer_pending
+        if pending is not None and pending[0] == timestamp_ms:
+            self._infer_s += time.perf_counter() - pending[1]
+            self._infer_n += 1
+        sink = self._live_sink
+        if sink is not None:
+            sink((result, timestamp_ms))
+        if pending is not None and timestamp_ms >= pending[0]:
+            # baru dilepas setelah remap (gate.update) selesai → gate boleh skip lagi; compare-and-clear:
+            # detect_async frame lebih baru yang masuk di sela-sela tetap tercatat pending
+            with self._pending_lock:
+                if self._infer_pending is pending:
+                    self._infer_pending = None
+
+    # ── main loop ──
+    def build_graph(self, cap, ui=None, model_path=MODEL_PATH, config=None, warmup=WARMUP_FRAMES):
+        """
+        Stage graph tracking. Tiap stage bisa dipindah executor / antreannya
+        lewat config (lihat GRAPH_PRESETS):
+
+            capture ─┬─ convert ── infer ── remap ─┬─ osc
+                     └─ render                     ├─ record
+                                                   └─ shm (--shm)
+        """
+        import cv2
+
+        from .stagegraph import STOP, StageGraph
+
+        g = StageGraph(config if config is not None else GRAPH_PRESETS[DEFAULT_GRAPH])
+        infer_mode = g.option("infer", "mode", "live")
+        last_ms = [0]
+
+        def capture():
+            ret, frame = cap.read()
+            if not ret:
+                return STOP
+            # timestamp wajib naik ketat untuk FaceLandmarker (LIVE_STREAM / VIDEO)
+            last_ms[0] = max(int(time.time() * 1000), last_ms[0] + 1)
+            return frame, last_ms[0]
+
+        gate = self.gate
+
+        def convert(item):
+            frame, ts = item
+            # selama hasil detect_async belum datang, hasil "terakhir" belum final → jangan skip
+            if gate is not None and self._infer_pending is None and not gate.check(frame):
+                return None, ts             # di-skip: tanpa konversi & inference
+            return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB), ts
+
+        g.add("capture", capture, executor="main")
+        g.add("convert", convert, ["capture"])
+
+        if g.config.get("infer", {}).get("executor") == "process":
+            if infer_mode != "video":
+                raise ValueError("infer di process pool harus mode 'video'")
+            g.add("infer", infer_in_worker, ["convert"], initializer=init_infer_worker,
+                  initargs=(model_path, warmup, self.num_faces))
+        else:
+            if self._landmarker is None or self._landmarker_mode != infer_mode:
+                self.preload(model_path, g.config, warmup)
+            # Mode live: hasil datang dari thread callback MediaPipe, frame yang ditahan gate dari
+            # thread capture — keduanya lewat sink ini supaya remap → osc/record/shm tidak jalan
+            # bersamaan, dan hasil yang lebih tua dari yang sudah dikirim dibuang.
+            emit_lock = threading.Lock()
+            last_emit = [-1]
+
+            def live_sink(item):
+                with emit_lock:
+                    if item[1] <= last_emit[0]:
+                        return
+                    last_emit[0] = item[1]
+                    g.emit("infer", item)
+
+            self._live_sink = live_sink
+            if infer_mode == "live":
+                def infer(item):
+                    rgb, ts = item
+                    if rgb is None:
+                        live_sink(item)
+                        return None
+                    with self._pending_lock:
+                        self._infer_pending = (ts, time.perf_counter())
+                    self._landmarker.detect_async(make_mp_image(rgb), ts)
+            else:
+                def infer(item):
+                    rgb, ts = item
+                    if rgb is None:
+                        return None, ts
+                    t0 = time.perf_counter()
+                    result = self._landmarker.detect_for_video(make_mp_image(rgb), ts)
+                    self._infer_s += time.perf_counter() - t0
+                    self._infer_n += 1
+                    return result, ts
+            g.add("infer", infer, ["convert"])
+
+        g.add("remap", lambda item: self.process_result(*item), ["infer"])
+        # osc: kirim langsung, atau titip ke OutputScheduler (kirim rate tetap di thread-nya sendiri)
+        g.add("osc", self.output.push if self.output is not None else self.send_frame, ["remap"])
+        g.add("record", self.record_frame, ["remap"])
+        if self.publisher is not None:
+            g.add("shm", self.publish_frame, ["remap"])
+        if ui is not None:
+            # Preview: cuma titip frame terbaru, gambar & imshow jalan di thread preview
+            g.add("render", lambda item: ui.submit(item[0], self.preview_state()), ["capture"])
+        return g
+
+    def run(self, camera=CAMERA_INDEX, headless=False, model_path=MODEL_PATH, preview_fps=PREVIEW_FPS,
+            graph=DEFAULT_GRAPH, warmup=WARMUP_FRAMES, pace=True, rescan=False):
+        """
+        camera: index kamera (dibuka dari cache kamera kalau ada) atau file video /
+        folder gambar sebagai kamera palsu (pace=False → dibaca secepatnya).
+        """
+        self._t_start = time.perf_counter()
+        from .camerasource import format_source, open_source
+        from .preview import PreviewWindow, StdinCommands
+        from .stagegraph import format_stats, load_graph_config
+
+        config = load_graph_config(graph, GRAPH_PRESETS) if isinstance(graph, str) else graph
+        # Model di-load & di-warm-up dulu, kamera belakangan
+        self.preload(model_path, config, warmup)
+
+        try:
+            cap, source = open_source(camera, (CAMERA_WIDTH, CAMERA_HEIGHT, CAMERA_FPS),
+                                      realtime=pace, refresh=rescan)
+        except Exception:
+            self.close_landmarker()
+            raise
+        print(format_source(source))
+        self.sample_rate = source["fps"]
+        if self.shm_name:
+            from .sharedframe import SharedFramePublisher
+            self.publisher = SharedFramePublisher(self.shm_name)
+            print(f"🧷 Shared memory '{self.shm_name}' ({self.publisher.shm.size / 1024:.1f} KB) — "
+                  "baca: python -m modelpipeline shm")
+
+        if headless:
+            # Tanpa window: perintah diketik di terminal lalu Enter
+            keys = "r/s/c/p/q" if self.cheek_monitor else "r/s/p/q"
+            print(f"🖥  Mode HEADLESS — ketik {keys} + Enter di terminal.\n")
+            ui = StdinCommands().start()
+        else:
+            ui = PreviewWindow("VuiTuber Pipeline", draw_overlay, fps=preview_fps).start()
+
+        # SIGUSR1 = tombol P (profiling tanpa window / dari luar process)
+        old_usr1 = None
+        if hasattr(signal, "SIGUSR1"):
+            old_usr1 = signal.signal(signal.SIGUSR1, self._on_profile_signal)
+
+        if self.output_rate:
+            self.output = OutputScheduler(self.send_values, self.output_rate, self.output_delay)
+
+        g = None
+        try:
+            g = self.build_graph(cap, None if headless else ui, model_path, config, warmup)
+            print(f"🧩 Graph: {graph if isinstance(graph, str) else 'custom'} — "
+                  + ", ".join(f"{n}={s.executor}" for n, s in g.stages.items()))
+            g.start()
+            if self.output is not None:
+                self.output.start()
+            print(f"⏱  Siap dalam {(time.perf_counter() - self._t_start) * 1e3:.0f} ms (model + kamera + graph)\n")
+            g.run(tick=lambda: self.handle_command(ui.poll_command()))
+        finally:
+            if old_usr1 is not None:
+                signal.signal(signal.SIGUSR1, old_usr1)
+            if self.profiler.active:
+                self.profiler.stop()
+            if self.output is not None:
+                self.output.stop()
+            self._live_sink = None
+            self.close_landmarker()
+            # Simpan file setelah keluar
+            self.stop_stream_recording()
+            if self.record_session:
+                print(f"\n📦 Menyimpan {len(self.record_session)} snapshots...")
+                save_session_to_file(self.record_session, self.record_dir)
+            else:
+                print("\nTidak ada data yang direcord.")
+            ui.stop()
+            cap.release()
+            self._sock.close()
+            if self.publisher is not None:
+                pub, self.publisher = self.publisher, None
+                if pub.frames:
+                    print(f"🧷 Shared memory: {pub.frames} frame, {pub.publish_s * 1e6 / pub.frames:.0f} µs/frame")
+                pub.close()
+            if g is not None:
+                print("\n📊 Stage graph:\n" + format_stats(g.stats()))
+                if self.gate is not None:
+                    print(format_gate_stats(self.gate.stats(self.infer_cost_ms(g))))
+            if self.output is not None:
+                print(format_output_stats(self.output.stats()))
+                self.output = None
+        print("\n✅ Pipeline selesai.")
+
+    def _on_profile_signal(self, _signum, _frame):
+        self._profile_request = True
+
+    def infer_cost_ms(self, g):
+        """Rata-rata ms per inference asli (in-process diukur langsung, process pool dari stats stage)."""
+        if self._infer_n:
+            return self._infer_s * 1e3 / self._infer_n
+        st = g.stats().get("infer", {})
+        real = st.get("processed", 0) - (self.gate.skipped if self.gate is not None else 0)
+        return st["busy_ms"] / real if real > 0 else None
+
+
+# ─────────────────────────────────────────────
+# INFERENCE
+# ─────────────────────────────────────────────
+# Hasil inference versi tuple biasa — bisa di-pickle balik dari process pool,
+# atribut sama dengan FaceLandmarkerResult (.x/.y/.z, .category_name/.score)
+Landmark   = namedtuple("Landmark", "x y z")
+Category   = namedtuple("Category", "category_name score")
+FaceResult = namedtuple("FaceResult", "face_landmarks face_blendshapes")
+
+_worker_landmarker = None
+
+
+def plain_result(result):
+    return FaceResult([[Landmark(l.x, l.y, l.z) for l in face] for face in result.face_landmarks],
+                      [[Category(c.category_name, c.score) for c in face] for face in result.face_blendshapes])
+
+
+def init_infer_worker(model_path, warmup=WARMUP_FRAMES, num_faces=NUM_FACES):
+    """Initializer process pool: satu landmarker mode VIDEO per worker, sudah di-warm-up."""
+    global _worker_landmarker
+    _worker_landmarker, _report = create_landmarker(model_path, "video", warmup=warmup, num_faces=num_faces)
+
+
+def infer_in_worker(item):
+    rgb, ts = item
+    if rgb is None:             # di-skip motion gate
+        return None, ts
+    return plain_result(_worker_landmarker.detect_for_video(make_mp_image(rgb), ts)), ts
+
+
+# ─────────────────────────────────────────────
+# VISUALISASI (thread preview)
+# ─────────────────────────────────────────────
+_mesh_edges = None
+
+
+def draw_face_mesh(frame, landmarks_list):
+    """
+    Mesh tesselation. Pakai mediapipe.solutions kalau ada; versi mediapipe
+    baru tidak punya solutions lagi → gambar sendiri dari FaceLandmarksConnections.
+    """
+    global _mesh_edges
+    import cv2
+
+    try:
+        from mediapipe import solutions
+        from mediapipe.framework.formats import landmark_pb2
+    except ImportError:
+        solutions = None
+
+    if solutions is not None:
+        for face_landmarks in landmarks_list:
+            face_landmarks_proto = landmark_pb2.NormalizedLandmarkList()
+            face_landmarks_proto.landmark.extend([
+                landmark_pb2.NormalizedLandmark(x=l.x, y=l.y, z=l.z)
+                for l in face_landmarks
+            ])
+            solutions.drawing_utils.draw_landmarks(
+                image=frame,
+                landmark_list=face_landmarks_proto,
+                connections=solutions.face_mesh.FACEMESH_TESSELATION,
+                landmark_drawing_spec=None,
+                connection_drawing_spec=solutions.drawing_styles.get_default_face_mesh_tesselation_style()
+            )
+        return
+
+    import numpy as np
+    if _mesh_edges is None:
+        from mediapipe.tasks.python.vision import FaceLandmarksConnections
+        _mesh_edges = np.array([(c.start, c.end) for c in FaceLandmarksConnections.FACE_LANDMARKS_TESSELATION])
+    img_h, img_w = frame.shape[:2]
+    for face_landmarks in landmarks_list:
+        pts = np.array([(l.x * img_w, l.y * img_h) for l in face_landmarks], dtype=np.int32)
+        edges = _mesh_edges[_mesh_edges.max(axis=1) < len(pts)]
+        cv2.polylines(frame, list(pts[edges]), False, (192, 192, 192), 1, cv2.LINE_AA)
+
+
+def get_region_center(landmarks, region_indices, img_w, img_h):
+    """Hitung titik tengah dari sekumpulan landmark."""
+    xs, ys = [], []
+    for idx in region_indices:
+        if idx < len(landmarks):
+            lm = landmarks[idx]
+            xs.append(lm.x * img_w)
+            ys.append(lm.y * img_h)
+    if xs:
+        return int(sum(xs) / len(xs)), int(sum(ys) / len(ys))
+    return None
+
+
+def draw_region_labels(frame, landmarks, img_w, img_h):
+    """Gambar label nama region di atas wajah."""
+    import cv2
+    for region_name, indices in FACE_REGIONS.items():
+        center = get_region_center(landmarks, indices, img_w, img_h)
+        if center:
+            cx, cy = center
+            label = region_name.replace("_", " ")
+            (tw, th), _ = cv2.getTextSize(label, cv2.FONT_HERSHEY_SIMPLEX, 0.38, 1)
+            cv2.rectangle(frame, (cx - 2, cy - th - 4), (cx + tw + 2, cy + 2), (20, 20, 20), -1)
+            cv2.putText(frame, label, (cx, cy - 2),
+                        cv2.FONT_HERSHEY_SIMPLEX, 0.38, (0, 255, 180), 1, cv2.LINE_AA)
+
+
+def draw_cheek_dist_hud(frame, cheek_dist, img_h):
+    """Bar jarak pipi ke hidung di bagian bawah layar."""
+    import cv2
+    labels = [
+        ("L_CHEEK dist", cheek_dist.get("LEFT_CHEEK", 0.0),  (255, 160, 50)),
+        ("R_CHEEK dist", cheek_dist.get("RIGHT_CHEEK", 0.0), (50, 160, 255)),
+    ]
+    y = img_h - 55
+    for label, val, color in labels:
+        bar_len = int(val * 800)
+        cv2.rectangle(frame, (10, y - 10), (10 + bar_len, y + 4), color, -1)
+        cv2.putText(frame, f"{label}: {val:.4f}", (10 + bar_len + 5, y),
+                    cv2.FONT_HERSHEY_SIMPLEX, 0.45, color, 1, cv2.LINE_AA)
+        y += 24
+
+
+def draw_blendshape_hud(frame, blendshapes, img_h, proxy_cheek=False, bottom_margin=20):
+    """Tampilkan nilai blendshape per grup di sudut kiri atas."""
+    import cv2
+    x_start, y, line_h, col_width = 10, 20, 16, 240
+
+    grouped = {}
+    for name, score in blendshapes.items():
+        grouped.setdefault(BLENDSHAPE_TO_GROUP.get(name, "OTHER"), []).append((name, score))
+
+    col = 0
+    for group_name, items in grouped.items():
+        x = x_start + col * col_width
+        cv2.putText(frame, f"[ {group_name} ]", (x, y),
+                    cv2.FONT_HERSHEY_SIMPLEX, 0.45, (255, 220, 50), 1, cv2.LINE_AA)
+        local_y = y + line_h
+        for name, score in sorted(items, key=lambda i: -i[1]):
+            if score > 0.01:  # Hanya tampilkan yang aktif
+                bar_len = int(score * 80)
+                is_proxy = proxy_cheek and name == "cheekPuff"
+                if is_proxy:
+                    color = (255, 100, 0)  # oranye = hasil kalkulasi manual
+                else:
+                    color = (0, 200, 100) if score < 0.5 else (0, 100, 255) if score < 0.8 else (0, 50, 255)
+                cv2.rectangle(frame, (x, local_y - 9), (x + bar_len, local_y - 2), color, -1)
+                short_name = name.replace("Left","L").replace("Right","R").replace("mouth","m").replace("eye","e").replace("brow","br")
+                suffix = " [proxy]" if is_proxy else ""
+                cv2.putText(frame, f"{short_name}{suffix}: {score:.2f}", (x + bar_len + 3, local_y - 2),
+                            cv2.FONT_HERSHEY_SIMPLEX, 0.32, (220, 220, 220), 1, cv2.LINE_AA)
+                local_y += line_h
+                if local_y > img_h - bottom_margin:
+                    break
+        col += 1
+        if col > 3:
+            col = 0
+            y += 200
+
+
+def draw_overlay(frame, state):
+    """Gambar mesh, label region, HUD & status recording (dipanggil di thread preview)."""
+    import cv2
+    img_h, img_w = frame.shape[:2]
+    landmarks_list = state["landmarks"]
+    cheek_dist = state["cheek_dist"]
+
+    if landmarks_list:
+        draw_face_mesh(frame, landmarks_list)
+        draw_region_labels(frame, landmarks_list[0], img_w, img_h)
+
+    if state["blendshapes"]:
+        draw_blendshape_hud(frame, state["blendshapes"], img_h, state["proxy_cheek"],
+                            bottom_margin=80 if cheek_dist is not None else 20)
+
+    if cheek_dist is not None:
+        draw_cheek_dist_hud(frame, cheek_dist, img_h)
+
+    is_rec = state["is_recording"]
+    rec_color = (0, 0, 255) if is_rec else (100, 100, 100)
+    if cheek_dist is not None:
+        rec_text = f"● REC [{state['snapshot_count']} snap]" if is_rec else "○ IDLE  R=rec S=snap C=coords Q=quit"
+    else:
+        rec_text = f"● REC [{state['snapshot_count']} snapshots]" if is_rec else "○ IDLE  (R=record, S=snapshot, Q=quit)"
+    cv2.putText(frame, rec_text, (img_w - 400, 25),
+                cv2.FONT_HERSHEY_SIMPLEX, 0.5, rec_color, 2, cv2.LINE_AA)
+
+    if state["print_coords"]:
+        cv2.putText(frame, "● COORDS ON", (img_w - 160, 50),
+                    cv2.FONT_HERSHEY_SIMPLEX, 0.45, (0, 255, 255), 1, cv2.LINE_AA)
+
+
+# ─────────────────────────────────────────────
+# SNAPSHOT & SAVE
+# ─────────────────────────────────────────────
+def _round_xyz(lm):
+    return {"x": round(lm.x, 4), "y": round(lm.y, 4), "z": round(lm.z, 4)}
+
+
+def take_snapshot(landmarks_list, blendshapes, cheek_dist=None):
+    """Buat satu snapshot data untuk dicatat (cheek_dist → format modelmonitor)."""
+    snapshot = {"timestamp": datetime.now().isoformat()}
+    if cheek_dist is not None:
+        snapshot["cheek_distances"] = dict(cheek_dist)
+    snapshot["blendshapes"] = {}
+    snapshot["landmark_regions"] = {}
+
+    for name, score in blendshapes.items():
+        group = BLENDSHAPE_TO_GROUP.get(name, "OTHER")
+        snapshot["blendshapes"].setdefault(group, {})[name] = round(score, 4)
+
+    if landmarks_list:
+        face_lm = landmarks_list[0]
+        for region_name, indices in FACE_REGIONS.items():
+            snapshot["landmark_regions"][region_name] = [
+                _round_xyz(face_lm[idx]) for idx in indices if idx < len(face_lm)]
+
+        if cheek_dist is not None:
+            # Raw koordinat tiap titik landmark pipi
+            snapshot["cheek_raw_coords"] = {
+                side: {str(idx): _round_xyz(face_lm[idx]) for idx in indices if idx < len(face_lm)}
+                for side, indices in CHEEK_LANDMARKS.items()}
+    return snapshot
+
+
+def print_snapshot_to_terminal(snapshot):
+    """Print snapshot ke terminal dengan format rapi."""
+    print("\n" + "="*60)
+    print(f"📸 SNAPSHOT — {snapshot['timestamp']}")
+    print("="*60)
+
+    if "cheek_distances" in snapshot:
+        print("\n▶ CHEEK DISTANCES (pipi → hidung):")
+        for side, dist in snapshot["cheek_distances"].items():
+            bar = "█" * int(dist * 100)
+            print(f"  {side:<15} {dist:.4f}  {bar}")
+
+    print("\n▶ BLENDSHAPES (hanya yang aktif > 0.05):")
+    for group, items in snapshot["blendshapes"].items():
+        active = {k: v for k, v in items.items() if v > 0.05}
+        if active:
+            print(f"  [{group}]")
+            for name, val in sorted(active.items(), key=lambda x: -x[1]):
+                bar = "█" * int(val * 20)
+                print(f"    {name:<35} {val:.3f}  {bar}")
+
+    print("\n▶ LANDMARK REGION CENTERS (normalized 0.0–1.0):")
+    for region, coords in snapshot["landmark_regions"].items():
+        if coords:
+            avg_x = round(sum(c["x"] for c in coords) / len(coords), 3)
+            avg_y = round(sum(c["y"] for c in coords) / len(coords), 3)
+            print(f"  {region:<15} center = (x={avg_x}, y={avg_y})")
+    print("="*60)
+
+
+def save_session_to_file(session_data, out_dir=RECORDINGS_DIR):
+    """Simpan seluruh sesi ke JSON dan CSV (kolom jarak pipi kalau ada)."""
+    ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+    os.makedirs(out_dir, exist_ok=True)
+
+    # JSON — lengkap
+    json_path = os.path.join(out_dir, f"session_{ts}.json")
+    with open(json_path, "w") as f:
+        json.dump(session_data, f, indent=2)
+    print(f"\n💾 JSON saved → {json_path}")
+
+    # CSV — blendshape flat per snapshot
+    csv_path = os.path.join(out_dir, f"session_{ts}_blendshapes.csv")
+    all_names = set()
+    for snap in session_data:
+        for group_items in snap["blendshapes"].values():
+            all_names.update(group_items.keys())
+    all_names = sorted(all_names)
+    with_dist = any("cheek_distances" in snap for snap in session_data)
+
+    with open(csv_path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["timestamp"] + (CHEEK_DIST_CHANNELS if with_dist else []) + all_names)
+        for snap in session_data:
+            flat = {}
+            for group_items in snap["blendshapes"].values():
+                flat.update(group_items)
+            row = [snap["timestamp"]]
+            if with_dist:
+                dist = snap.get("cheek_distances", {})
+                row += [dist.get("LEFT_CHEEK", 0.0), dist.get("RIGHT_CHEEK", 0.0)]
+            writer.writerow(row + [flat.get(n, 0.0) for n in all_names])
+    print(f"💾 CSV  saved → {csv_path}")
+
+
+# ─────────────────────────────────────────────
+# MAIN
+# ─────────────────────────────────────────────
+def print_banner(tracker):
+    print("╔══════════════════════════════════════════════════╗")
+    print("║       VTuber Face Tracker + Recorder            ║")
+    print("╠══════════════════════════════════════════════════╣")
+    print("║  R  → Toggle Record ON/OFF                      ║")
+    print("║  S  → Snapshot (saat recording)                 ║")
+    if tracker.cheek_monitor:
+        print("║  C  → Toggle print koordinat pipi realtime      ║")
+    print(f"║  {'P  → Profiling ' + format(tracker.profiler.seconds, 'g') + ' s ON/OFF (+ SIGUSR1)':<47}║")
+    print("║  Q  → Quit & save semua data                    ║")
+    print("╠══════════════════════════════════════════════════╣")
+    p = tracker.profile
+    if p["CHEEK_PROXY"]:
+        print("║  cheekPuff proxy via mouthPucker                ║")
+        print(f"║  {'Nyala  : mouthPucker >= ' + str(p['CHEEK_THRESHOLD_ON']):<47}║")
+        print(f"║  {'Mati   : mouthPucker <  ' + str(p['CHEEK_THRESHOLD_OFF']):<47}║")
+        print(f"║  {'Smooth : ' + str(p['CHEEK_SMOOTH_FRAMES']) + ' frames':<47}║")
+    if p["SQUINT_OFFSET"] or p["BLINK_BOOST"] != 1.0:
+        text = f"Squint -{p['SQUINT_OFFSET']}  Blink x{p['BLINK_BOOST']} (> {p['BLINK_TRIGGER']})"
+        print(f"║  {text:<47}║")
+    if tracker.cheek_monitor:
+        print("║  Bar oranye = jarak pipi KIRI ke hidung         ║")
+        print("║  Bar biru   = jarak pipi KANAN ke hidung        ║")
+        print("║  Makin panjang → pipi makin terdorong keluar    ║")
+    print("╚══════════════════════════════════════════════════╝\n")
+
+
+def main(argv=None, mode="track"):
+    defaults = MODES[mode]
+    ap = argparse.ArgumentParser(prog=f"modelpipeline {mode}",
+                                 description="Face tracker MediaPipe → VSeeFace (VMC)")
+    ap.add_argument("-p", "--profile", default=defaults["profile"],
+                    help=f"profile remap / calibration JSON (default: {defaults['profile']})")
+    ap.add_argument("--headless", action="store_true", help="tanpa window & tanpa gambar sama sekali")
+    ap.add_argument("--camera", default=CAMERA_INDEX,
+                    help=f"index kamera (default: {CAMERA_INDEX}) atau file video / folder / glob gambar")
+    ap.add_argument("--rescan", action="store_true", help="abaikan cache kamera, probe ulang")
+    ap.add_argument("--no-pace", action="store_true", help="file video / gambar dibaca secepatnya, bukan per fps")
+    ap.add_argument("--host", default=VMC_IP)
+    ap.add_argument("--port", type=int, default=VMC_PORT)
+    ap.add_argument("--model", default=MODEL_PATH, help="default: face_landmarker.task di sebelah package")
+    ap.add_argument("--warmup", type=int, default=WARMUP_FRAMES,
+                    help=f"inference sintetis sebelum kamera dibuka (default: {WARMUP_FRAMES}, 0 = off)")
+    ap.add_argument("--preview-fps", type=float, default=PREVIEW_FPS)
+    ap.add_argument("--no-record", action="store_true", help="R hanya snapshot, tanpa stream .vui")
+    ap.add_argument("--no-stamp", action="store_true", help="jangan kirim /VUI/Frame")
+    ap.add_argument("--faces", type=int, default=NUM_FACES,
+                    help=f"wajah maksimum per frame (default: {NUM_FACES}); tiap wajah ID stabil + target VMC sendiri")
+    ap.add_argument("--face-port-step", type=int, default=FACE_PORT_STEP,
+                    help=f"wajah ID n dikirim ke port + n × step (default: {FACE_PORT_STEP})")
+    ap.add_argument("--gate", action="store_true", default=MOTION_GATE,
+                    help="skip inference di frame yang tidak berubah (hasil terakhir ditahan)")
+    ap.add_argument("--gate-threshold", type=float, default=DIFF_THRESHOLD,
+                    help=f"skor beda per sel minimum untuk inference (default: {DIFF_THRESHOLD})")
+    ap.add_argument("--gate-max-skip", type=int, default=MAX_SKIP,
+                    help=f"maksimum frame berturut-turut tanpa inference (default: {MAX_SKIP})")
+    ap.add_argument("--profile-seconds", type=float, default=PROFILE_SECONDS,
+                    help=f"durasi profiling per tombol P / SIGUSR1 (default: {PROFILE_SECONDS:g} s)")
+    ap.add_argument("--no-alloc", action="store_true", help="profiling tanpa tracemalloc (tracemalloc memperlambat alokasi selama sesi)")
+    ap.add_argument("--output-rate", type=float, default=OUTPUT_RATE, metavar="HZ",
+                    help="kirim VMC dengan rate tetap + interpolasi (mis. 60; default 0 = tiap hasil inference)")
+    ap.add_argument("--output-delay", type=float, default=OUTPUT_DELAY, metavar="MS",
+                    help=f"render di belakang jam capture (default: {OUTPUT_DELAY:g} ms)")
+    ap.add_argument("--shm", nargs="?", const=SHM_NAME, default=SHM_NAME if SHARED_FRAME else None,
+                    metavar="NAME", help=f"publish frame ke shared memory (default nama: {SHM_NAME})")
+    ap.add_argument("--graph", default=DEFAULT_GRAPH,
+                    help=f"preset stage graph ({', '.join(GRAPH_PRESETS)}), graph.json, atau preset+graph.json")
+    args = ap.parse_args(argv)
+
+    gate = MotionGate(args.gate_threshold, args.gate_max_skip) if args.gate else None
+    tracker = Tracker(load_profile(args.profile), defaults["cheek_monitor"], args.host, args.port,
+                      send_frame_stamp=not args.no_stamp, continuous_record=not args.no_record, gate=gate,
+                      num_faces=args.faces, face_port_step=args.face_port_step,
+                      profile_seconds=args.profile_seconds, profile_alloc=not args.no_alloc,
+                      shm_name=args.shm, output_rate=args.output_rate, output_delay=args.output_delay)
+    print_banner(tracker)
+    try:
+        tracker.run(args.camera, args.headless, args.model, args.preview_fps, args.graph, args.warmup,
+                    pace=not args.no_pace, rescan=args.rescan)
+    except (RuntimeError, FileNotFoundError) as e:
+        print(f"❌ {e}")
+        return 1
+    return 0
+
+
+def track_main(argv=None):
+    return main(argv, "track")
+
+
+def monitor_main(argv=None):
+    return main(argv, "monitor")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
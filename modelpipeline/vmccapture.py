@@ -0,0 +1,297 @@
+"""
+VMC Capture
+───────────
+Rekam SEMUA datagram VMC/OSC yang masuk ke listener ke file biner
+append-only (.vmcap), supaya bisa dibandingkan frame-per-frame dengan yang
+dikirim tracker (recording .vui).
+
+    python -m modelpipeline listen --capture                              # → recordings/capture_<ts>.vmcap
+    python -m modelpipeline capture info recordings/capture_xxx.vmcap
+    python -m modelpipeline capture dump recordings/capture_xxx.vmcap --limit 20
+    python -m modelpipeline capture export recordings/capture_xxx.vmcap   # → capture_xxx.vui (per frame)
+
+Layout file:
+    b"VMCAP\\0" u16 versi | u32 len | header JSON | record...
+    record = f64 waktu terima (epoch) | u32 IPv4 | u16 port | u16 len | datagram mentah
+
+Datagram disimpan mentah (address + argumen + bundle apa adanya) — paling
+kompak dan tidak ada yang hilang; di-decode saat dibaca.
+
+Sisi terima cuma put_nowait ke queue (tidak pernah nge-block, kalau penuh
+dihitung di `dropped`); thread writer di belakang yang pack & tulis ke disk
+per batch, sama seperti StreamRecorder.
+"""
+
+import argparse
+import json
+import os
+import queue
+import socket
+import struct
+import sys
+import threading
+import time
+from datetime import datetime
+
+import numpy as np
+
+from .osccodec import (BLEND_VAL_ADDRESS, BLEND_APPLY_ADDRESS, FRAME_STAMP_ADDRESS,
+                      iter_messages, parse_message)
+
+# ─────────────────────────────────────────────
+# CONFIG
+# ─────────────────────────────────────────────
+MAGIC          = b"VMCAP\0"
+VERSION        = 1
+QUEUE_SIZE     = 65536   # datagram maks yang antre ke writer (~20 detik @ 3000 msg/s)
+BATCH_SIZE     = 1024    # datagram per write()
+FLUSH_INTERVAL = 1.0     # detik — data di buffer tetap di-flush ke disk
+EXPORT_CHUNK   = 4096    # frame per write_arrays saat export (memori konstan untuk capture panjang)
+
+_RECORD = struct.Struct("<dIHH")
+_STOP = object()
+
+
+# ─────────────────────────────────────────────
+# WRITER
+# ─────────────────────────────────────────────
+class CaptureWriter:
+    """Log datagram append-only dengan bounded queue + background writer thread."""
+
+    def __init__(self, path, meta=None, queue_size=QUEUE_SIZE):
+        self.path = path
+        self.meta = dict(meta or {}, start_time=time.time())
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._thread = None
+        self._f = None
+        self.received = self.written = self.dropped = self.bytes_written = 0
+
+    def start(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self._f = open(self.path, "ab")
+        if self._f.tell() == 0:
+            head = json.dumps(self.meta).encode("utf-8")
+            self._f.write(MAGIC + struct.pack("<HI", VERSION, len(head)) + head)
+        self._thread = threading.Thread(target=self._run, name="vmc-capture", daemon=True)
+        self._thread.start()
+        return self
+
+    def write(self, data, addr=None, t=None):
+        """Dipanggil dari jalur terima — tidak boleh nge-block."""
+        self.received += 1
+        try:
+            self._queue.put_nowait((time.time() if t is None else t, addr, data))
+        except queue.Full:
+            self.dropped += 1
+            return False
+        return True
+
+    def close(self):
+        if self._thread is None:
+            return
+        self._queue.put(_STOP)
+        self._thread.join()
+        self._thread = None
+        self._f.close()
+
+    def stats(self):
+        return {
+            "received": self.received,
+            "written":  self.written,
+            "dropped":  self.dropped,
+            "bytes":    self.bytes_written,
+            "queued":   self._queue.qsize(),
+        }
+
+    def _run(self):
+        last_flush = time.monotonic()
+        stop = False
+        while not stop:
+            try:
+                batch = [self._queue.get(timeout=FLUSH_INTERVAL)]
+            except queue.Empty:
+                batch = []
+            while batch and len(batch) < BATCH_SIZE:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            if batch and batch[-1] is _STOP:
+                batch.pop()
+                stop = True
+
+            if batch:
+                parts = []
+                for t, addr, data in batch:
+                    ip, port = _pack_addr(addr)
+                    parts.append(_RECORD.pack(t, ip, port, len(data)))
+                    parts.append(data)
+                blob = b"".join(parts)
+                self._f.write(blob)
+                self.written += len(batch)
+                self.bytes_written += len(blob)
+            if stop or time.monotonic() - last_flush >= FLUSH_INTERVAL:
+                self._f.flush()
+                last_flush = time.monotonic()
+
+
+def _pack_addr(addr):
+    if not addr:
+        return 0, 0
+    try:
+        return struct.unpack("!I", socket.inet_aton(addr[0]))[0], addr[1]
+    except OSError:
+        return 0, addr[1]                  # IPv6 / hostname: cukup port
+
+
+# ─────────────────────────────────────────────
+# READER
+# ─────────────────────────────────────────────
+def read_header(f):
+    if f.read(len(MAGIC)) != MAGIC:
+        raise ValueError("bukan file .vmcap")
+    version, hlen = struct.unpack("<HI", f.read(6))
+    if version != VERSION:
+        raise ValueError(f"versi .vmcap {version} tidak didukung")
+    return json.loads(f.read(hlen))
+
+
+def iter_capture(path):
+    """Yield (waktu, "ip:port", datagram bytes). Record terakhir yang terpotong diabaikan."""
+    with open(path, "rb") as f:
+        read_header(f)
+        while True:
+            head = f.read(_RECORD.size)
+            if len(head) < _RECORD.size:
+                return
+            t, ip, port, size = _RECORD.unpack(head)
+            data = f.read(size)
+            if len(data) < size:
+                return
+            yield t, f"{socket.inet_ntoa(struct.pack('!I', ip))}:{port}", data
+
+
+def iter_capture_messages(path):
+    """Yield (waktu, sender, address, args) per pesan (bundle sudah dipecah)."""
+    for t, sender, data in iter_capture(path):
+        try:
+            for start, end in iter_messages(data):
+                address, args = parse_message(data, start, end)
+                yield t, sender, address, args
+        except ValueError:
+            yield t, sender, None, (data,)
+
+
+def iter_capture_frames(path, sender=None):
+    """
+    Yield (waktu, sender, {nama: nilai}) tiap batas frame: Blend/Apply, atau
+    /VUI/Frame untuk sender yang tidak kirim Apply. Nilai = state terakhir
+    (VMC: nilai bertahan sampai di-set lagi).
+    """
+    state, uses_apply = {}, set()
+    for t, src, address, args in iter_capture_messages(path):
+        if sender and src != sender:
+            continue
+        values = state.setdefault(src, {})
+        if address == BLEND_VAL_ADDRESS and len(args) >= 2:
+            values[str(args[0])] = float(args[1])
+        elif address == BLEND_APPLY_ADDRESS:
+            uses_apply.add(src)
+            yield t, src, dict(values)
+        elif address == FRAME_STAMP_ADDRESS and src not in uses_apply:
+            yield t, src, dict(values)
+
+
+def export_session(path, out, sender=None):
+    """Frame capture → sesi .vui (satu sender). Return jumlah frame."""
+    from .constants import MP_BLENDSHAPE_NAMES
+    from .sessionformat import SessionWriter, make_header
+
+    senders, names = {}, set()
+    for _t, src, values in iter_capture_frames(path, sender):
+        senders[src] = senders.get(src, 0) + 1
+        names.update(values)
+    if not senders:
+        return 0
+    sender = sender or max(senders, key=senders.get)
+    channels = [n for n in MP_BLENDSHAPE_NAMES if n in names] + sorted(names - set(MP_BLENDSHAPE_NAMES))
+
+    with open(path, "rb") as f:
+        meta = read_header(f)
+    # start_time ISO seperti writer .vui lain (recorder, convertlegacy), bukan epoch float
+    start = meta.get("start_time")
+    writer = SessionWriter(out, make_header(channels, [],
+                                            start_time=datetime.fromtimestamp(start).isoformat() if start else None,
+                                            source=os.path.basename(path), sender=sender))
+
+    def flush(ts, rows):
+        writer.write_arrays(np.asarray(ts, dtype=np.float32), np.asarray(rows, dtype=np.float32),
+                            np.empty((len(ts), 0, 3), dtype=np.float32))
+
+    ts, rows, t0 = [], [], None
+    for t, _src, values in iter_capture_frames(path, sender):
+        t0 = t if t0 is None else t0
+        ts.append(t - t0)
+        rows.append([values.get(c, 0.0) for c in channels])
+        if len(ts) >= EXPORT_CHUNK:
+            flush(ts, rows)
+            ts, rows = [], []
+    if ts:
+        flush(ts, rows)
+    writer.close()
+    return writer.frames
+
+
+# ─────────────────────────────────────────────
+# MAIN
+# ─────────────────────────────────────────────
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Capture datagram VMC (.vmcap): info, dump, export")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    for name in ("info", "dump", "export"):
+        p = sub.add_parser(name)
+        p.add_argument("capture")
+        if name == "dump":
+            p.add_argument("--limit", type=int, default=50)
+        if name == "export":
+            p.add_argument("out", nargs="?", help="default: <capture>.vui")
+            p.add_argument("--sender", help="ip:port (default: sender dengan frame terbanyak)")
+    args = ap.parse_args(argv)
+
+    if args.cmd == "info":
+        with open(args.capture, "rb") as f:
+            meta = read_header(f)
+        per_sender, addresses = {}, {}
+        n = t_first = t_last = 0
+        for t, sender, address, _args in iter_capture_messages(args.capture):
+            t_first = t_first or t
+            t_last = t
+            n += 1
+            per_sender[sender] = per_sender.get(sender, 0) + 1
+            addresses[address] = addresses.get(address, 0) + 1
+        dur = t_last - t_first
+        started = datetime.fromtimestamp(meta.get("start_time", 0)).isoformat(timespec="seconds")
+        print(f"📼 {args.capture}  (mulai {started}, port {meta.get('listen_port', '?')})")
+        print(f"   {n} pesan dalam {dur:.1f} s ({n / dur if dur > 0 else 0:.0f} msg/s)")
+        for s, c in sorted(per_sender.items(), key=lambda x: -x[1]):
+            print(f"   📡 {s:<22} {c} pesan")
+        for a, c in sorted(addresses.items(), key=lambda x: -x[1]):
+            print(f"   {str(a):<28} {c}")
+        return 0
+
+    if args.cmd == "dump":
+        for i, (t, sender, address, a) in enumerate(iter_capture_messages(args.capture)):
+            if i >= args.limit:
+                break
+            ts = datetime.fromtimestamp(t).strftime("%H:%M:%S.%f")
+            print(f"{ts}  {sender:<22} {address}  {list(a)}")
+        return 0
+
+    out = args.out or os.path.splitext(args.capture)[0] + ".vui"
+    n = export_session(args.capture, out, args.sender)
+    print(f"✅ {n} frames → {out}" if n else "Tidak ada frame (Blend/Apply atau /VUI/Frame) di capture.")
+    return 0 if n else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
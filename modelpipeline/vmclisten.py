@@ -0,0 +1,211 @@
+"""
+VMC Listener Engine
+───────────────────
+Penerima VMC/OSC satu thread, satu socket — pengganti
+osc_server.ThreadingOSCUDPServer yang bikin thread baru per datagram
+(53 pesan × 60 fps = ribuan thread per detik cuma untuk update dict).
+
+    lst = VMCListener(port=39540)
+    lst.on_apply = lambda l: print(l.snapshot())
+    lst.serve_forever()          # atau panggil lst.poll(timeout) di loop sendiri
+
+  - socket non-blocking + selectors, tiap bangun langsung drain sampai
+    MAX_DRAIN datagram (atau socket kosong)
+  - pesan tunggal dan bundle OSC (termasuk bundle bersarang)
+  - /VMC/Ext/Blend/Val ditulis ke array numpy yang dialokasi sekali;
+    nama → kolom di-cache per bytes nama, tanpa decode string per pesan
+  - SO_RCVBUF diperbesar supaya burst dari beberapa sender tidak di-drop kernel
+"""
+
+import selectors
+import socket
+import struct
+import time
+
+import numpy as np
+
+from .osccodec import (BLEND_VAL_ADDRESS, BLEND_APPLY_ADDRESS, FRAME_STAMP_ADDRESS,
+                      osc_string, iter_messages, parse_message)
+from .constants import LISTEN_PORT, MP_BLENDSHAPE_NAMES, VMC_IP
+
+# ─────────────────────────────────────────────
+# CONFIG
+# ─────────────────────────────────────────────
+MAX_CHANNELS  = 256          # kapasitas array nilai (52 MediaPipe + nama VRM)
+MAX_DATAGRAM  = 65535
+MAX_DRAIN     = 1024         # datagram maks per sekali bangun
+RECV_BUFFER   = 4 << 20      # SO_RCVBUF yang diminta (kernel bisa membatasi)
+
+_BLEND_VAL_HEAD  = osc_string(BLEND_VAL_ADDRESS) + osc_string(",sf")
+_BLEND_APPLY_MSG = osc_string(BLEND_APPLY_ADDRESS)
+_FLOAT = struct.Struct(">f")
+
+
+class VMCListener:
+    """
+    Engine penerima VMC. State terbaru ada di:
+      values[:len(names)]  nilai blendshape (float32), urutan = names
+      updated[col]         time.perf_counter() terakhir kolom itu diisi
+      applies              jumlah /VMC/Ext/Blend/Apply (= frame lengkap)
+
+    on_apply(listener)     dipanggil tiap Blend/Apply
+    on_message(addr, args) dipanggil untuk address lain (Bone/Root/dll), opsional
+    monitor                StreamMonitor (streamstats.py) untuk statistik per sender, opsional
+    capture                CaptureWriter (vmccapture.py) — semua datagram mentah ke disk, opsional
+    """
+
+    def __init__(self, host=VMC_IP, port=LISTEN_PORT, channels=None,
+                 max_channels=MAX_CHANNELS, max_drain=MAX_DRAIN, recv_buffer=RECV_BUFFER):
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, recv_buffer)
+        self.sock.bind((host, port))
+        self.sock.setblocking(False)
+        self.address = self.sock.getsockname()
+        self.recv_buffer = self.sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF)
+
+        self._sel = selectors.DefaultSelector()
+        self._sel.register(self.sock, selectors.EVENT_READ)
+        self.max_drain = max_drain
+
+        self.values  = np.zeros(max_channels, dtype=np.float32)
+        self.updated = np.zeros(max_channels, dtype=np.float64)
+        self.names   = []
+        self._col    = {}            # bytes nama (dengan padding) → kolom
+        for name in channels or MP_BLENDSHAPE_NAMES:
+            self.column(name)
+
+        self.on_apply   = None
+        self.on_message = None
+        self.monitor    = None
+        self.capture    = None
+        self._sender    = None           # SenderStats datagram yang sedang diproses
+        self.datagrams = self.messages = self.blend_vals = self.applies = 0
+        self.malformed = self.overflow = self.wakeups = 0
+        self._running = False
+
+    # ── channel ──
+    def column(self, name):
+        """Kolom untuk nama blendshape (didaftarkan kalau belum ada), -1 kalau penuh."""
+        key = osc_string(name)
+        col = self._col.get(key)
+        if col is None:
+            if len(self.names) >= len(self.values):
+                return -1
+            col = self._col[key] = len(self.names)
+            self.names.append(name)
+        return col
+
+    def snapshot(self):
+        """dict {nama: nilai} dari kolom yang pernah diisi."""
+        n = len(self.names)
+        seen = self.updated[:n] > 0
+        return {self.names[i]: float(self.values[i]) for i in np.flatnonzero(seen)}
+
+    # ── receive ──
+    def poll(self, timeout=None):
+        """Tunggu socket siap (maks timeout detik), lalu drain. Return jumlah datagram."""
+        if not self._sel.select(timeout):
+            return 0
+        self.wakeups += 1
+        sock = self.sock
+        n = 0
+        while n < self.max_drain:
+            try:
+                data, addr = sock.recvfrom(MAX_DATAGRAM)
+            except (BlockingIOError, InterruptedError):
+                break
+            n += 1
+            self.handle_datagram(data, addr)
+        return n
+
+    def handle_datagram(self, data, addr=None):
+        self.datagrams += 1
+        if self.capture is not None:
+            self.capture.write(data, addr)
+        sender = self._sender = self.monitor.sender(addr) if self.monitor is not None else None
+        before = self.messages
+        try:
+            for start, end in iter_messages(data):
+                self._handle_message(data, start, end)
+        except ValueError:
+            self.malformed += 1
+        if sender is not None:
+            sender.on_datagram(time.perf_counter(), self.messages - before)
+
+    def _handle_message(self, data, start, end):
+        self.messages += 1
+        # Fast path Blend/Val: "address\0,sf\0" + nama + float 4 byte terakhir
+        if data.startswith(_BLEND_VAL_HEAD, start) and end - start >= len(_BLEND_VAL_HEAD) + 8:
+            key = data[start + len(_BLEND_VAL_HEAD):end - 4]
+            col = self._col.get(key)
+            if col is None:
+                col = self.column(parse_message(data, start, end)[1][0])
+                if col < 0:
+                    self.overflow += 1
+                    return
+            self.values[col]  = _FLOAT.unpack_from(data, end - 4)[0]
+            self.updated[col] = time.perf_counter()
+            self.blend_vals += 1
+            if self._sender is not None:
+                self._sender.pending += 1
+            return
+
+        if data.startswith(_BLEND_APPLY_MSG, start):
+            self.applies += 1
+            if self._sender is not None:
+                self._sender.on_apply(time.perf_counter())
+            if self.on_apply:
+                self.on_apply(self)
+            return
+
+        address, args = parse_message(data, start, end)
+        if address == BLEND_VAL_ADDRESS and len(args) >= 2:
+            # Blend/Val dengan type tag lain (misal ",sd")
+            col = self.column(str(args[0]))
+            if col < 0:
+                self.overflow += 1
+                return
+            self.values[col]  = float(args[1])
+            self.updated[col] = time.perf_counter()
+            self.blend_vals += 1
+            if self._sender is not None:
+                self._sender.pending += 1
+        elif address == FRAME_STAMP_ADDRESS and len(args) >= 2:
+            if self._sender is not None:
+                self._sender.on_stamp(time.perf_counter(), int(args[0]), int(args[1]))
+        elif self.on_message:
+            self.on_message(address, args)
+
+    # ── loop ──
+    def serve_forever(self, poll_interval=0.1, on_tick=None):
+        """
+        Loop sampai stop() (dari callback / thread lain) atau Ctrl+C.
+        on_tick(listener) dipanggil tiap putaran (maks poll_interval sekali).
+        """
+        self._running = True
+        try:
+            while self._running:
+                self.poll(poll_interval)
+                if on_tick:
+                    on_tick(self)
+        finally:
+            self._running = False
+
+    def stop(self):
+        self._running = False
+
+    def close(self):
+        self._sel.close()
+        self.sock.close()
+
+    def stats(self):
+        return {
+            "datagrams":  self.datagrams,
+            "messages":   self.messages,
+            "blend_vals": self.blend_vals,
+            "applies":    self.applies,
+            "malformed":  self.malformed,
+            "overflow":   self.overflow,
+            "wakeups":    self.wakeups,
+            "channels":   len(self.names),
+        }
@@ -0,0 +1,425 @@
+"""
+VMC Simulator
+─────────────
+Pengganti VSeeFace + tracker untuk stress test jalur OSC di Linux headless
+(tanpa Windows, tanpa kamera):
+
+    python -m modelpipeline emulate                         # "VSeeFace" di 39539, echo ke 39540
+    python -m modelpipeline loadgen -n 8 --fps 60 --duration 30
+    python -m modelpipeline loadgen -n 4 --fps 24,30,60,144 --bones 55 --mode bundle --loss 0.01
+
+    tracker / replay / loadgen ──► emulate (39539) ──echo──► listen (39540)
+
+emulate — receiver emulator:
+  - terima /VMC/Ext/Blend/Val, /VMC/Ext/Blend/Apply, /VMC/Ext/Bone/Pos,
+    /VMC/Ext/Root/Pos (pakai VMCListener, pesan tunggal maupun bundle)
+  - per sender (StreamMonitor): fps, jitter, gap, loss, latency /VUI/Frame
+  - kelengkapan frame: tiap Apply dihitung berapa channel yang baru diisi
+    sejak Apply sebelumnya; kurang dari --expect = frame tidak lengkap
+  - echo seperti VSeeFace: tiap 1/--echo-fps detik kirim state terkini
+    (OK, T, Root, Bone, semua Blend/Val, Apply) sebagai bundle ke 39540
+
+loadgen — N tracker sintetis, tiap tracker socket sendiri (= sender
+sendiri di statistik penerima), fps masing-masing, nilai sinus per channel:
+  - --mode split  : satu datagram per pesan, seperti tracker.py
+  - --mode bundle : satu bundle per frame (dipecah per MAX_BUNDLE byte), seperti VSeeFace
+  - /VUI/Frame [seq, waktu] per frame → loss & latency terukur di penerima
+  - --loss P: frame sengaja tidak dikirim dengan peluang P (cek deteksi loss)
+Semua tracker dijadwalkan satu thread dengan deadline absolut
+(replay.DriftFreeScheduler), jadi rate total tidak drift walau N besar.
+"""
+
+import argparse
+import heapq
+import math
+import random
+import socket
+import sys
+import time
+
+import numpy as np
+
+from .constants import LISTEN_PORT, MP_BLENDSHAPE_NAMES, VMC_IP, VMC_PORT
+from .osccodec import (BLEND_APPLY, BlendValEncoder, encode_bundle, encode_frame_stamp, encode_message)
+from .replay import DriftFreeScheduler
+from .streamstats import StreamMonitor, format_report
+from .vmclisten import VMCListener
+
+# ─────────────────────────────────────────────
+# CONFIG
+# ─────────────────────────────────────────────
+ECHO_FPS        = 60        # VSeeFace kirim balik per frame render
+MAX_BUNDLE      = 1400      # byte per bundle (di bawah MTU, seperti sender VMC umumnya)
+STATS_INTERVAL  = 1.0       # detik antar baris statistik
+BONE_ADDRESS    = "/VMC/Ext/Bone/Pos"
+ROOT_ADDRESS    = "/VMC/Ext/Root/Pos"
+OK_ADDRESS      = "/VMC/Ext/OK"
+TIME_ADDRESS    = "/VMC/Ext/T"
+# Bone humanoid Unity yang umum dikirim tracker VMC (urutan kirim)
+BONE_NAMES = (
+    "Hips", "Spine", "Chest", "UpperChest", "Neck", "Head", "LeftEye", "RightEye", "Jaw",
+    "LeftShoulder", "LeftUpperArm", "LeftLowerArm", "LeftHand",
+    "RightShoulder", "RightUpperArm", "RightLowerArm", "RightHand",
+    "LeftUpperLeg", "LeftLowerLeg", "LeftFoot", "LeftToes",
+    "RightUpperLeg", "RightLowerLeg", "RightFoot", "RightToes",
+)
+
+
+def chunk_bundles(messages, max_bytes=MAX_BUNDLE):
+    """Pesan ter-encode → list bundle, masing-masing ≤ max_bytes (kecuali pesan tunggal yang lebih besar)."""
+    bundles, part, size = [], [], 16
+    for m in messages:
+        if part and size + 4 + len(m) > max_bytes:
+            bundles.append(encode_bundle(part))
+            part, size = [], 16
+        part.append(m)
+        size += 4 + len(m)
+    if part:
+        bundles.append(encode_bundle(part))
+    return bundles
+
+
+def bone_message(address, name, pose):
+    return encode_message(address, name, *(float(v) for v in pose))
+
+
+# ─────────────────────────────────────────────
+# RECEIVER EMULATOR
+# ─────────────────────────────────────────────
+class ReceiverEmulator:
+    """
+    VSeeFace palsu di atas VMCListener. Kelengkapan frame dihitung per Apply
+    (gabungan semua sender — untuk per sender lihat StreamMonitor est_loss).
+    """
+
+    def __init__(self, host=VMC_IP, port=VMC_PORT, echo=(VMC_IP, LISTEN_PORT), echo_fps=ECHO_FPS,
+                 expect=len(MP_BLENDSHAPE_NAMES), monitor=None):
+        self.listener = VMCListener(host, port)
+        self.listener.monitor    = monitor if monitor is not None else StreamMonitor(log_interval=STATS_INTERVAL)
+        self.listener.on_apply   = self._on_apply
+        self.listener.on_message = self._on_message
+        self.monitor = self.listener.monitor
+        self.expect  = expect
+
+        self.bones = {}                 # nama bone → (px, py, pz, qx, qy, qz, qw)
+        self.root  = None
+        self.bone_msgs = self.root_msgs = self.other_msgs = 0
+        self.frames = self.partial = 0
+        self.fresh_min = None
+        self._last_apply = 0.0
+
+        self.echo_addr   = echo
+        self.echo_period = 1.0 / echo_fps if echo and echo_fps > 0 else None
+        self.echo_frames = self.echo_datagrams = self.echo_errors = 0
+        self._echo_sock  = socket.socket(socket.AF_INET, socket.SOCK_DGRAM) if self.echo_period else None
+        self._enc = BlendValEncoder()
+        self._t0  = time.perf_counter()
+
+    # ── callback listener ──
+    def _on_apply(self, listener):
+        n = len(listener.names)
+        fresh = int(np.count_nonzero(listener.updated[:n] > self._last_apply))
+        self._last_apply = time.perf_counter()
+        self.frames += 1
+        if fresh < self.expect:
+            self.partial += 1
+        self.fresh_min = fresh if self.fresh_min is None else min(self.fresh_min, fresh)
+
+    def _on_message(self, address, args):
+        if address == BONE_ADDRESS and len(args) >= 8:
+            self.bones[args[0]] = args[1:8]
+            self.bone_msgs += 1
+        elif address == ROOT_ADDRESS and len(args) >= 8:
+            self.root = args[1:8]
+            self.root_msgs += 1
+        else:
+            self.other_msgs += 1
+
+    # ── echo ──
+    def echo_datagrams_now(self):
+        """State terkini dalam format kirim VSeeFace (bundle, Apply di akhir)."""
+        msgs = [encode_message(OK_ADDRESS, 1), encode_message(TIME_ADDRESS, time.perf_counter() - self._t0)]
+        if self.root is not None:
+            msgs.append(bone_message(ROOT_ADDRESS, "root", self.root))
+        msgs.extend(bone_message(BONE_ADDRESS, name, pose) for name, pose in self.bones.items())
+        encode = self._enc.encode
+        msgs.extend(encode(name, value) for name, value in self.listener.snapshot().items())
+        msgs.append(BLEND_APPLY)
+        return chunk_bundles(msgs)
+
+    def send_echo(self):
+        for data in self.echo_datagrams_now():
+            try:
+                self._echo_sock.sendto(data, self.echo_addr)
+                self.echo_datagrams += 1
+            except OSError:
+                self.echo_errors += 1
+        self.echo_frames += 1
+
+    # ── loop ──
+    def serve(self, duration=None, on_tick=None):
+        """Terima + echo sampai Ctrl+C / duration detik. on_tick(emulator) tiap putaran."""
+        start = time.perf_counter()
+        end = start + duration if duration else None
+        next_echo = start + self.echo_period if self.echo_period else None
+        try:
+            while True:
+                now = time.perf_counter()
+                if end is not None and now >= end:
+                    break
+                wait = 0.1 if next_echo is None else max(next_echo - now, 0.0)
+                self.listener.poll(min(wait, 0.1))
+                now = time.perf_counter()
+                if next_echo is not None and now >= next_echo:
+                    self.send_echo()
+                    next_echo += self.echo_period
+                    if next_echo < now:                 # tertinggal jauh: lompat, jangan burst
+                        next_echo = now + self.echo_period
+                if on_tick:
+                    on_tick(self)
+        except KeyboardInterrupt:
+            pass
+
+    def close(self):
+        self.listener.close()
+        self.monitor.close()
+        if self._echo_sock is not None:
+            self._echo_sock.close()
+
+    def stats(self):
+        st = self.listener.stats()
+        st.update(frames=self.frames, partial=self.partial, fresh_min=self.fresh_min,
+                  bones=len(self.bones), bone_msgs=self.bone_msgs, root_msgs=self.root_msgs,
+                  other_msgs=self.other_msgs, echo_frames=self.echo_frames,
+                  echo_datagrams=self.echo_datagrams, echo_errors=self.echo_errors)
+        return st
+
+
+def format_emulator(st):
+    text = (f"🎭 {st['datagrams']} datagram, {st['messages']} pesan, {st['frames']} Apply "
+            f"({st['partial']} tidak lengkap")
+    if st["fresh_min"] is not None:
+        text += f", min {st['fresh_min']} channel/frame"
+    text += f"), {st['bones']} bone, {st['malformed']} rusak"
+    if st["echo_frames"]:
+        text += f" · echo {st['echo_frames']} frame / {st['echo_datagrams']} datagram"
+        if st["echo_errors"]:
+            text += f", {st['echo_errors']} gagal"
+    return text
+
+
+# ─────────────────────────────────────────────
+# LOAD GENERATOR
+# ─────────────────────────────────────────────
+class SimTracker:
+    """Satu tracker sintetis: socket sendiri, nilai sinus per channel, frame stamp."""
+
+    def __init__(self, index, addr, fps, channels, bones=(), mode="split", apply=True, stamp=True, loss=0.0):
+        self.index    = index
+        self.addr     = addr
+        self.fps      = fps
+        self.channels = channels
+        self.bones    = bones
+        self.mode     = mode
+        self.apply    = apply
+        self.stamp    = stamp
+        self.loss     = loss
+        self.sock     = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.bind(("", 0))
+        self.port     = self.sock.getsockname()[1]    # = sender ip:port di statistik penerima
+        self._enc     = BlendValEncoder()
+        self._rng     = random.Random(index)
+        # frekuensi & fase per channel beda-beda, tetap deterministik per tracker
+        self._freq    = [0.2 + self._rng.random() * 1.5 for _ in channels]
+        self._phase   = [self._rng.random() * 2 * math.pi for _ in channels]
+
+        self.seq = self.frames = self.skipped = 0
+        self.datagrams = self.messages = self.bytes = self.errors = 0
+
+    def messages_at(self, t):
+        encode = self._enc.encode
+        msgs = [encode(name, 0.5 + 0.5 * math.sin(2 * math.pi * f * t + p))
+                for name, f, p in zip(self.channels, self._freq, self._phase)]
+        for k, name in enumerate(self.bones):
+            a = 0.1 * math.sin(2 * math.pi * 0.5 * t + k)
+            msgs.append(bone_message(BONE_ADDRESS, name, (0.0, 0.0, 0.0, a, 0.0, 0.0, math.sqrt(1 - a * a))))
+        if self.stamp:
+            msgs.append(encode_frame_stamp(self.seq))
+        if self.apply:
+            msgs.append(BLEND_APPLY)
+        return msgs
+
+    def send_frame(self, t):
+        self.seq += 1
+        if self.loss and self._rng.random() < self.loss:
+            self.skipped += 1
+            return
+        msgs = self.messages_at(t)          # frame yang di-skip tetap makan seq → lubang seq di penerima
+        datagrams = msgs if self.mode == "split" else chunk_bundles(msgs)
+        send, addr = self.sock.sendto, self.addr
+        for data in datagrams:
+            try:
+                send(data, addr)
+                self.datagrams += 1
+                self.bytes += len(data)
+            except OSError:                     # ENOBUFS / ECONNREFUSED di bawah beban
+                self.errors += 1
+        self.messages += len(msgs)
+        self.frames += 1
+
+    def close(self):
+        self.sock.close()
+
+
+class LoadGenerator:
+    def __init__(self, trackers):
+        self.trackers = trackers
+        self.sched = DriftFreeScheduler()
+
+    def run(self, duration=None, on_tick=None):
+        """
+        Jadwal semua tracker di satu heap (deadline absolut, tracker ke-i digeser
+        i/N periode supaya tidak kirim bersamaan). Return detik yang berjalan.
+        """
+        n = len(self.trackers)
+        heap = [(i / (n * t.fps), 0, i) for i, t in enumerate(self.trackers)]
+        heapq.heapify(heap)
+        self.sched.reset()
+        start = self.sched.start
+        try:
+            while heap:
+                offset, k, i = heapq.heappop(heap)
+                if duration is not None and offset >= duration:
+                    break
+                self.sched.wait_until_offset(offset)
+                tracker = self.trackers[i]
+                tracker.send_frame(offset)
+                heapq.heappush(heap, (i / (n * tracker.fps) + (k + 1) / tracker.fps, k + 1, i))
+                if on_tick:
+                    on_tick(self)
+        except KeyboardInterrupt:
+            pass
+        return time.perf_counter() - start
+
+    def lateness(self, reset=True):
+        """(p50, p99, max) keterlambatan kirim dalam ms sejak panggilan sebelumnya."""
+        late = self.sched.lateness
+        if reset:
+            self.sched.lateness = []
+        if not late:
+            return None
+        late = np.asarray(late) * 1000.0
+        return float(np.percentile(late, 50)), float(np.percentile(late, 99)), float(late.max())
+
+    def close(self):
+        for t in self.trackers:
+            t.close()
+
+
+def parse_addr(text, default_port):
+    host, _, port = text.rpartition(":")
+    return (host or VMC_IP, int(port)) if port.isdigit() else (text, default_port)
+
+
+# ─────────────────────────────────────────────
+# MAIN
+# ─────────────────────────────────────────────
+def emulate_main(argv=None):
+    ap = argparse.ArgumentParser(prog="modelpipeline emulate",
+                                 description="Emulator penerima VMC (pengganti VSeeFace untuk stress test)")
+    ap.add_argument("--host", default=VMC_IP)
+    ap.add_argument("--port", type=int, default=VMC_PORT, help=f"port terima (default {VMC_PORT})")
+    ap.add_argument("--echo", default=f"{VMC_IP}:{LISTEN_PORT}", help="tujuan echo host:port")
+    ap.add_argument("--no-echo", action="store_true", help="terima saja, tanpa kirim balik")
+    ap.add_argument("--echo-fps", type=float, default=ECHO_FPS)
+    ap.add_argument("--expect", type=int, default=len(MP_BLENDSHAPE_NAMES),
+                    help="channel per frame minimum untuk dianggap lengkap")
+    ap.add_argument("--duration", type=float, help="detik (default: sampai Ctrl+C)")
+    ap.add_argument("--quiet", action="store_true", help="tanpa statistik per detik")
+    args = ap.parse_args(argv)
+
+    echo = None if args.no_echo else parse_addr(args.echo, LISTEN_PORT)
+    emu = ReceiverEmulator(args.host, args.port, echo, args.echo_fps, args.expect)
+    print(f"🎭 Emulator VMC di {emu.listener.address[0]}:{emu.listener.address[1]}"
+          + (f", echo {args.echo_fps:g} fps → {echo[0]}:{echo[1]}" if echo else ", tanpa echo")
+          + " — Ctrl+C untuk stop\n")
+
+    def tick(e):
+        rep = e.monitor.tick()
+        if rep is not None and not args.quiet:
+            for r in rep:
+                print(format_report(r))
+            print(format_emulator(e.stats()))
+
+    try:
+        emu.serve(args.duration, tick)
+    finally:
+        emu.close()
+    st = emu.stats()
+    print("\n✅ Emulator dihentikan.")
+    for r in emu.monitor.report():
+        print(format_report(r))
+    print(format_emulator(st))
+    return 0
+
+
+def loadgen_main(argv=None):
+    ap = argparse.ArgumentParser(prog="modelpipeline loadgen", description="Load generator: N tracker VMC sintetis")
+    ap.add_argument("-n", "--trackers", type=int, default=1)
+    ap.add_argument("--fps", default="24", help="fps per tracker, satu nilai atau daftar koma (diulang)")
+    ap.add_argument("--target", default=f"{VMC_IP}:{VMC_PORT}", help="host:port penerima")
+    ap.add_argument("--channels", type=int, default=len(MP_BLENDSHAPE_NAMES),
+                    help=f"blendshape per frame (maks {len(MP_BLENDSHAPE_NAMES)})")
+    ap.add_argument("--bones", type=int, default=0, help=f"bone per frame (maks {len(BONE_NAMES)})")
+    ap.add_argument("--mode", choices=["split", "bundle"], default="split",
+                    help="split = datagram per pesan (tracker.py), bundle = per frame (VSeeFace)")
+    ap.add_argument("--no-apply", action="store_true", help="tanpa /VMC/Ext/Blend/Apply (seperti tracker.py)")
+    ap.add_argument("--no-stamp", action="store_true", help="tanpa /VUI/Frame")
+    ap.add_argument("--loss", type=float, default=0.0, help="peluang satu frame sengaja tidak dikirim")
+    ap.add_argument("--duration", type=float, help="detik (default: sampai Ctrl+C)")
+    args = ap.parse_args(argv)
+
+    rates = [float(f) for f in args.fps.split(",")]
+    if any(r <= 0 for r in rates):
+        ap.error("--fps harus > 0")
+    addr = parse_addr(args.target, VMC_PORT)
+    channels = MP_BLENDSHAPE_NAMES[:max(args.channels, 0)]
+    bones = BONE_NAMES[:max(args.bones, 0)]
+    trackers = [SimTracker(i, addr, rates[i % len(rates)], channels, bones, args.mode,
+                           apply=not args.no_apply, stamp=not args.no_stamp, loss=args.loss)
+                for i in range(args.trackers)]
+    gen = LoadGenerator(trackers)
+
+    total_fps = sum(t.fps for t in trackers)
+    per_frame = len(channels) + len(bones) + (not args.no_stamp) + (not args.no_apply)
+    print(f"🚚 {len(trackers)} tracker → {addr[0]}:{addr[1]}, {total_fps:g} frame/s total, "
+          f"{per_frame} pesan/frame ({args.mode}) ≈ {total_fps * per_frame:,.0f} pesan/s — Ctrl+C untuk stop\n")
+
+    last = [time.perf_counter(), 0]
+
+    def tick(g):
+        now = time.perf_counter()
+        if now - last[0] < STATS_INTERVAL:
+            return
+        msgs = sum(t.messages for t in g.trackers)
+        late = g.lateness()
+        print(f"📤 {(msgs - last[1]) / (now - last[0]):,.0f} pesan/s"
+              + (f", telat p50 {late[0]:.2f} / p99 {late[1]:.2f} / maks {late[2]:.1f} ms" if late else "")
+              + f", {sum(t.errors for t in g.trackers)} error kirim")
+        last[0], last[1] = now, msgs
+
+    try:
+        elapsed = gen.run(args.duration, tick)
+    finally:
+        gen.close()
+
+    print(f"\n✅ Selesai dalam {elapsed:.1f} s")
+    for t in trackers:
+        print(f"   tracker {t.index} (:{t.port}): "
+              f"{t.frames} frame ({t.frames / elapsed:.1f} fps), {t.skipped} sengaja hilang, "
+              f"{t.datagrams} datagram, {t.bytes / 1e6:.2f} MB, {t.errors} error")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(emulate_main())
@@ -0,0 +1,122 @@
+"""
+What-If Remap
+─────────────
+"Kalau SQUINT_OFFSET / blink boost / cheekPuff proxy diganti, sesi lama
+bakal kelihatan seperti apa?" — tuning offline, bukan live di stream.
+
+    python -m modelpipeline whatif recordings --profile raw --profile CheeckModel
+    python -m modelpipeline whatif sesi.vui -p CheeckModel -p CheeckModel+recordings/calibration_x.json
+    python -m modelpipeline whatif sesi.vui -p modelmonitor -p mediapipefinal --csv whatif.csv
+
+Profile pertama = baseline. Untuk tiap profile lain dihitung perbedaan
+per channel (mean |diff|, max |diff|, mean, p95, rasio aktif, jumlah
+ON/OFF) dan kurva hasilnya bisa diexport side-by-side ke CSV.
+Nilai input = blendshape RAW hasil recording kontinu (.vui).
+"""
+
+import argparse
+import csv
+import sys
+import time
+
+import numpy as np
+
+from .analytics import load_sessions
+from .constants import RECORDINGS_DIR
+from .remap import apply_profile, load_profile
+
+# ─────────────────────────────────────────────
+# CONFIG
+# ─────────────────────────────────────────────
+ACTIVE_LEVEL = 0.5     # nilai dianggap "aktif" untuk rasio & hitung ON/OFF
+DIFF_EPS     = 1e-6    # channel dengan max |diff| di bawah ini dianggap tidak berubah
+
+
+def diff_stats(base, other, session_id):
+    """Statistik per channel, semua vectorized → dict of array [C]."""
+    d = np.abs(other - base)
+    act_b = base >= ACTIVE_LEVEL
+    act_o = other >= ACTIVE_LEVEL
+    same = (session_id[1:] == session_id[:-1])[:, None]
+    return {
+        "mean_abs_diff": np.nanmean(d, axis=0),
+        "max_abs_diff":  np.nanmax(d, axis=0),
+        "mean_base":     np.nanmean(base, axis=0),
+        "mean_other":    np.nanmean(other, axis=0),
+        "p95_base":      np.nanpercentile(base, 95, axis=0),
+        "p95_other":     np.nanpercentile(other, 95, axis=0),
+        "active_base":   act_b.mean(axis=0),
+        "active_other":  act_o.mean(axis=0),
+        "toggles_base":  ((act_b[1:] != act_b[:-1]) & same).sum(axis=0),
+        "toggles_other": ((act_o[1:] != act_o[:-1]) & same).sum(axis=0),
+    }
+
+
+def export_csv(path, values_by_profile, names, channels, selected):
+    pos = {c: i for i, c in enumerate(channels)}
+    cols = [pos[c] for c in selected]
+    with open(path, "w", newline="") as f:
+        w = csv.writer(f)
+        w.writerow(["frame"] + [f"{c}@{n}" for c in selected for n in names])
+        stacked = np.stack([v[:, cols] for v in values_by_profile], axis=2)   # [N, sel, P]
+        stacked = stacked.reshape(len(stacked), -1)
+        for i, row in enumerate(np.round(stacked, 4).tolist()):
+            w.writerow([i] + row)
+    print(f"💾 Kurva side-by-side → {path}")
+
+
+# ─────────────────────────────────────────────
+# MAIN
+# ─────────────────────────────────────────────
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Terapkan profile remap ke recording lama & bandingkan")
+    ap.add_argument("paths", nargs="*", default=[RECORDINGS_DIR])
+    ap.add_argument("-p", "--profile", action="append", required=True,
+                    help="nama profile / file JSON / nama+file.json (ulang untuk banyak profile)")
+    ap.add_argument("--csv", help="export kurva channel yang berubah ke CSV")
+    ap.add_argument("--channels", help="channel untuk CSV (default: yang berubah), pisah koma")
+    args = ap.parse_args(argv)
+
+    values, channels, session_id, files = load_sessions(args.paths)
+    if len(values) == 0:
+        print("Tidak ada frame.")
+        return 1
+    profiles = [(spec, load_profile(spec)) for spec in args.profile]
+
+    t0 = time.perf_counter()
+    results = [apply_profile(values, channels, prof, session_id) for _, prof in profiles]
+    elapsed = time.perf_counter() - t0
+    n_total = len(values) * len(profiles)
+    print(f"📊 {len(files)} sesi, {len(values)} frames × {len(profiles)} profile "
+          f"dalam {elapsed * 1000:.1f} ms ({n_total / max(elapsed, 1e-9) / 1e6:.1f} M frame/s)")
+
+    base_name, base = profiles[0][0], results[0]
+    changed = set()
+    for (name, _), res in zip(profiles[1:], results[1:]):
+        st = diff_stats(base, res, session_id)
+        idx = np.flatnonzero(st["max_abs_diff"] > DIFF_EPS)
+        changed.update(channels[i] for i in idx)
+        print(f"\n▶ {base_name}  →  {name}")
+        if not len(idx):
+            print("  (tidak ada channel yang berubah)")
+            continue
+        print(f"  {'channel':<18} {'mean|Δ|':>8} {'max|Δ|':>7} {'mean':>13} {'p95':>13} "
+              f"{'aktif %':>13} {'ON/OFF':>11}")
+        for i in idx[np.argsort(-st["mean_abs_diff"][idx])]:
+            print(f"  {channels[i]:<18} {st['mean_abs_diff'][i]:>8.4f} {st['max_abs_diff'][i]:>7.3f} "
+                  f"{st['mean_base'][i]:>6.3f}→{st['mean_other'][i]:<6.3f} "
+                  f"{st['p95_base'][i]:>6.3f}→{st['p95_other'][i]:<6.3f} "
+                  f"{st['active_base'][i] * 100:>5.1f}→{st['active_other'][i] * 100:<6.1f} "
+                  f"{st['toggles_base'][i]:>5}→{st['toggles_other'][i]:<5}")
+
+    if args.csv:
+        selected = ([c.strip() for c in args.channels.split(",")] if args.channels
+                    else [c for c in channels if c in changed])
+        if "mouthPucker" in channels and "cheekPuff" in selected and "mouthPucker" not in selected:
+            selected.insert(0, "mouthPucker")
+        export_csv(args.csv, results, [n for n, _ in profiles], channels, selected)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())